@@ -14,7 +14,6 @@ from PyQt5.QtWidgets import QApplication
 from PyQt5.QtCore import Qt
 from src.gui.main_window import MainWindow
 from src.utils.logger import setup_logger
-from src.core.tts_engine import tts_engine
 
 
 def main():
@@ -31,17 +30,10 @@ def main():
     # 设置应用样式
     app.setStyle('Fusion')
     
-    # 创建主窗口
+    # 创建主窗口（TTS模型由主窗口在后台线程中加载）
     window = MainWindow()
     window.show()
     
-    # 预加载模型
-    logger.info("正在加载TTS模型...")
-    if tts_engine.load_model():
-        logger.info("模型加载成功")
-    else:
-        logger.warning("模型加载失败，将使用模拟模型")
-    
     # 运行应用
     logger.info("图形界面启动完成")
     sys.exit(app.exec_())
@@ -0,0 +1 @@
+# 项目源码包 
\ No newline at end of file
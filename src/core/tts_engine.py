@@ -4,15 +4,19 @@ TTS引擎
 """
 
 import os
+import re
+import queue
+import threading
 import torch
 import numpy as np
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Tuple, Mapping, Iterator, Callable
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor, Future, TimeoutError as FutureTimeoutError
 
 from ..utils.logger import get_logger
 from ..utils.config_loader import config_loader
 from .voice_pack_manager import voice_pack_manager
-from .performance_optimizer import optimizer, performance_monitor
+from .performance_optimizer import optimizer, performance_monitor, Cache
 
 # 导入各个引擎
 from .edge_tts_integration import edge_tts_integration
@@ -22,6 +26,20 @@ from .real_cosyvoice_integration import real_cosyvoice2_integration
 
 logger = get_logger(__name__)
 
+# 合成结果缓存的容量与单条上限（超过上限的音频不缓存）
+_AUDIO_CACHE_SIZE = 64
+_AUDIO_CACHE_MAX_BYTES = 10 * 1024 * 1024
+
+# 流式合成的分句规则与分段衔接处的淡入淡出长度（约2ms @ 22050Hz）
+_SENTENCE_SPLIT_RE = re.compile(r'(?<=[。！？.!?])\s+')
+_STREAM_FADE_SAMPLES = 44
+
+# 预热使用的短文本
+_WARMUP_TEXT = "预热"
+
+# 批量合成等待结果时检查停止请求的间隔（秒）
+_BATCH_POLL_INTERVAL = 0.1
+
 
 class TTSEngine:
     """TTS引擎类"""
@@ -31,6 +49,13 @@ class TTSEngine:
         self.device = "cuda" if torch.cuda.is_available() else "cpu"
         self.available_engines = []
         self.current_engine = None
+        self._audio_cache = Cache(max_size=_AUDIO_CACHE_SIZE)
+        # 每个引擎一个请求队列和工作线程，保证同一引擎实例不会被并发调用
+        self._engine_queues: Dict[str, queue.Queue] = {}
+        self._engine_queues_lock = threading.Lock()
+        # 已完成预热的 (引擎, 语音包)
+        self._warmed_up = set()
+        self._warmup_lock = threading.Lock()
         
         logger.info(f"TTS引擎初始化完成，设备: {self.device}")
     
@@ -47,17 +72,29 @@ class TTSEngine:
                 ("cosyvoice", real_cosyvoice2_integration, "CosyVoice2.0 (真实版)")
             ]
             
-            for engine_name, engine_instance, engine_desc in engines:
+            # 各引擎的加载互不依赖且多为I/O等待，并行加载以缩短启动时间
+            def _load(engine_instance):
                 try:
-                    if engine_instance.load_model():
-                        self.available_engines.append(engine_name)
-                        if self.current_engine is None:
-                            self.current_engine = engine_name
-                        logger.info(f"✓ {engine_desc} 加载成功")
-                    else:
-                        logger.warning(f"✗ {engine_desc} 加载失败")
+                    return engine_instance.load_model(), None
                 except Exception as e:
-                    logger.warning(f"✗ {engine_desc} 加载异常: {e}")
+                    return False, e
+            
+            with ThreadPoolExecutor(max_workers=len(engines)) as executor:
+                futures = [executor.submit(_load, engine_instance)
+                           for _, engine_instance, _ in engines]
+                results = [future.result() for future in futures]
+            
+            # 按优先级顺序汇总结果
+            for (engine_name, _, engine_desc), (loaded, error) in zip(engines, results):
+                if error is not None:
+                    logger.warning(f"✗ {engine_desc} 加载异常: {error}")
+                elif loaded:
+                    self.available_engines.append(engine_name)
+                    if self.current_engine is None:
+                        self.current_engine = engine_name
+                    logger.info(f"✓ {engine_desc} 加载成功")
+                else:
+                    logger.warning(f"✗ {engine_desc} 加载失败")
             
             if not self.available_engines:
                 logger.error("没有可用的TTS引擎")
@@ -71,9 +108,9 @@ class TTSEngine:
             logger.error(f"加载TTS引擎失败: {e}")
             return False
     
-    def get_available_engines(self) -> List[str]:
-        """获取可用的引擎列表"""
-        return self.available_engines.copy()
+    def get_available_engines(self) -> Tuple[str, ...]:
+        """获取可用的引擎列表（只读元组）"""
+        return tuple(self.available_engines)
     
     def set_current_engine(self, engine_name: str) -> bool:
         """设置当前使用的引擎"""
@@ -97,25 +134,247 @@ class TTSEngine:
                 logger.error("没有可用的TTS引擎")
                 return None
             
+            engine_name = self.current_engine
+            
+            # 相同参数的请求直接返回缓存结果
+            cache_key = (engine_name, voice_pack, text,
+                         round(speed, 3), pitch, round(energy, 3))
+            cached_audio = self._audio_cache.get(cache_key)
+            if cached_audio is not None:
+                logger.info(f"命中合成缓存: {text[:50]}...")
+                return cached_audio.copy()
+            
             logger.info(f"开始合成文本: {text[:50]}...")
             
-            # 使用当前引擎进行合成
-            if self.current_engine == "edge_tts":
-                return edge_tts_integration.synthesize(text, voice_pack, speed, pitch, energy)
-            elif self.current_engine == "gtts":
-                return gtts_integration.synthesize(text, voice_pack, speed, pitch, energy)
-            elif self.current_engine == "pyttsx3":
-                return pyttsx3_integration.synthesize(text, voice_pack, speed, pitch, energy)
-            elif self.current_engine == "cosyvoice":
-                return real_cosyvoice2_integration.synthesize(text, voice_pack, speed, pitch, energy)
-            else:
-                logger.error(f"未知的引擎: {self.current_engine}")
-                return None
+            # 交给该引擎的工作线程串行执行
+            future = Future()
+            self._get_engine_queue(engine_name).put(
+                (future, (engine_name, text, voice_pack, speed, pitch, energy))
+            )
+            audio = future.result()
+            
+            if isinstance(audio, np.ndarray) and audio.nbytes <= _AUDIO_CACHE_MAX_BYTES:
+                self._audio_cache.set(cache_key, audio.copy())
+            
+            return audio
                 
         except Exception as e:
             logger.error(f"语音合成失败: {e}")
             return None
     
+    def warmup(self, voice_pack: str = "default") -> bool:
+        """
+        预热当前引擎和语音包
+        
+        用一段短文本执行一次合成，让模型加载、设备初始化等一次性开销
+        在正式合成前完成。每个 (引擎, 语音包) 只预热一次，结果不写入缓存。
+        """
+        try:
+            if not self.available_engines:
+                return False
+            
+            engine_name = self.current_engine
+            key = (engine_name, voice_pack)
+            with self._warmup_lock:
+                if key in self._warmed_up:
+                    return True
+                self._warmed_up.add(key)
+            
+            logger.info(f"预热引擎: {engine_name} / {voice_pack}")
+            future = Future()
+            self._get_engine_queue(engine_name).put(
+                (future, (engine_name, _WARMUP_TEXT, voice_pack, 1.0, 0, 1.0))
+            )
+            return future.result() is not None
+            
+        except Exception as e:
+            logger.error(f"引擎预热失败: {e}")
+            return False
+    
+    def synthesize_batch(self, texts: List[str], voice_pack: str = "default",
+                         speed: float = 1.0, pitch: int = 0, energy: float = 1.0,
+                         should_stop: Optional[Callable[[], bool]] = None) -> List[Optional[np.ndarray]]:
+        """
+        批量语音合成
+        
+        未命中缓存的文本一次性提交到引擎工作线程的队列中，工作线程连续处理，
+        省去逐条提交、等待的往返；同一批次中相同的文本只合成一次。
+        
+        Args:
+            texts: 要合成的文本列表
+            voice_pack: 语音包名称
+            speed: 语速
+            pitch: 音调
+            energy: 音量
+            should_stop: 返回True时取消尚未开始的文本（正在合成的一条会完成）
+            
+        Returns:
+            与texts一一对应的音频列表，合成失败或被取消的位置为None
+        """
+        results: List[Optional[np.ndarray]] = [None] * len(texts)
+        try:
+            if not self.available_engines:
+                logger.error("没有可用的TTS引擎")
+                return results
+            
+            engine_name = self.current_engine
+            request_queue = self._get_engine_queue(engine_name)
+            pending: Dict[str, Tuple[Future, List[int]]] = {}
+            
+            for i, text in enumerate(texts):
+                cache_key = (engine_name, voice_pack, text,
+                             round(speed, 3), pitch, round(energy, 3))
+                cached_audio = self._audio_cache.get(cache_key)
+                if cached_audio is not None:
+                    results[i] = cached_audio.copy()
+                    continue
+                
+                entry = pending.get(text)
+                if entry is None:
+                    future = Future()
+                    request_queue.put(
+                        (future, (engine_name, text, voice_pack, speed, pitch, energy))
+                    )
+                    entry = pending[text] = (future, [])
+                entry[1].append(i)
+            
+            if pending:
+                logger.info(f"批量合成 {len(pending)} 条文本")
+            
+            stopped = False
+            for text, (future, indices) in pending.items():
+                try:
+                    if should_stop is None:
+                        audio = future.result()
+                    else:
+                        while True:
+                            if not stopped and should_stop():
+                                # 取消队列中尚未开始的请求，工作线程会跳过它们
+                                stopped = True
+                                for other, _ in pending.values():
+                                    other.cancel()
+                            try:
+                                audio = future.result(timeout=_BATCH_POLL_INTERVAL)
+                                break
+                            except FutureTimeoutError:
+                                continue
+                except Exception as e:
+                    if future.cancelled():
+                        continue
+                    logger.error(f"批量合成失败: {text[:50]}... {e}")
+                    continue
+                
+                if not isinstance(audio, np.ndarray):
+                    continue
+                
+                if audio.nbytes <= _AUDIO_CACHE_MAX_BYTES:
+                    cache_key = (engine_name, voice_pack, text,
+                                 round(speed, 3), pitch, round(energy, 3))
+                    self._audio_cache.set(cache_key, audio.copy())
+                
+                results[indices[0]] = audio
+                for index in indices[1:]:
+                    results[index] = audio.copy()
+            
+            return results
+            
+        except Exception as e:
+            logger.error(f"批量语音合成失败: {e}")
+            return results
+    
+    def synthesize_stream(self, text: str, voice_pack: str = "default",
+                          speed: float = 1.0, pitch: int = 0,
+                          energy: float = 1.0) -> Iterator[np.ndarray]:
+        """
+        流式语音合成
+        
+        按句子切分文本，在后台线程预先合成下一句，逐句产出音频片段，
+        使调用方可以在整段文本合成完成前开始播放。
+        
+        Args:
+            text: 要合成的文本
+            voice_pack: 语音包名称
+            speed: 语速
+            pitch: 音调
+            energy: 音量
+            
+        Yields:
+            每个句子的音频数据，合成失败的句子会被跳过
+        """
+        chunks = [chunk for chunk in _SENTENCE_SPLIT_RE.split(text.strip()) if chunk.strip()]
+        if not chunks:
+            return
+        
+        fade_in = np.linspace(0, 1, _STREAM_FADE_SAMPLES, dtype=np.float32)
+        fade_out = fade_in[::-1]
+        last_index = len(chunks) - 1
+        
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            ahead = executor.submit(self.synthesize, chunks[0], voice_pack, speed, pitch, energy)
+            for i in range(len(chunks)):
+                audio = ahead.result()
+                if i < last_index:
+                    ahead = executor.submit(self.synthesize, chunks[i + 1], voice_pack, speed, pitch, energy)
+                
+                if audio is None:
+                    logger.warning(f"分段合成失败，已跳过: {chunks[i][:50]}")
+                    continue
+                
+                # 分段衔接处做淡入淡出，避免拼接时产生爆音
+                if len(audio) > 2 * _STREAM_FADE_SAMPLES:
+                    audio = audio.astype(np.float32, copy=False)
+                    if i > 0:
+                        audio[:_STREAM_FADE_SAMPLES] *= fade_in
+                    if i < last_index:
+                        audio[-_STREAM_FADE_SAMPLES:] *= fade_out
+                
+                yield audio
+    
+    def _get_engine_queue(self, engine_name: str) -> queue.Queue:
+        """获取指定引擎的请求队列，首次使用时启动对应的工作线程"""
+        with self._engine_queues_lock:
+            request_queue = self._engine_queues.get(engine_name)
+            if request_queue is None:
+                request_queue = queue.Queue()
+                self._engine_queues[engine_name] = request_queue
+                threading.Thread(
+                    target=self._engine_worker,
+                    args=(request_queue,),
+                    name=f"tts-{engine_name}",
+                    daemon=True
+                ).start()
+            return request_queue
+    
+    def _engine_worker(self, request_queue: queue.Queue):
+        """引擎工作线程：依次处理队列中的合成请求"""
+        while True:
+            future, args = request_queue.get()
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                future.set_result(self._synthesize_with_engine(*args))
+            except Exception as e:
+                future.set_exception(e)
+    
+    def _synthesize_with_engine(self, engine_name: str, text: str, voice_pack: str,
+                                speed: float, pitch: int, energy: float) -> Optional[np.ndarray]:
+        """使用指定引擎进行合成"""
+        if engine_name == "edge_tts":
+            return edge_tts_integration.synthesize(text, voice_pack, speed, pitch, energy)
+        elif engine_name == "gtts":
+            return gtts_integration.synthesize(text, voice_pack, speed, pitch, energy)
+        elif engine_name == "pyttsx3":
+            return pyttsx3_integration.synthesize(text, voice_pack, speed, pitch, energy)
+        elif engine_name == "cosyvoice":
+            return real_cosyvoice2_integration.synthesize(text, voice_pack, speed, pitch, energy)
+        else:
+            logger.error(f"未知的引擎: {engine_name}")
+            return None
+    
+    def clear_cache(self):
+        """清空合成结果缓存"""
+        self._audio_cache.clear()
+    
     def get_engine_info(self, engine_name: str = None) -> Dict[str, Any]:
         """获取引擎信息"""
         if engine_name is None:
@@ -139,15 +398,15 @@ class TTSEngine:
             info[engine_name] = self.get_engine_info(engine_name)
         return info
     
-    def get_voice_packs(self) -> Dict[str, Dict[str, Any]]:
+    def get_voice_packs(self) -> Mapping[str, Dict[str, Any]]:
         """获取所有可用的语音包"""
         return voice_pack_manager.get_all_voice_packs()
     
-    def get_engine_voice_packs(self, engine_name: str) -> Dict[str, Dict[str, Any]]:
+    def get_engine_voice_packs(self, engine_name: str) -> Mapping[str, Dict[str, Any]]:
         """获取指定引擎的所有语音包"""
         return voice_pack_manager.get_engine_voice_packs(engine_name)
     
-    def get_all_engine_voice_packs(self) -> Dict[str, Dict[str, Dict[str, Any]]]:
+    def get_all_engine_voice_packs(self) -> Dict[str, Mapping[str, Dict[str, Any]]]:
         """获取所有引擎的语音包"""
         return voice_pack_manager.get_all_engine_voice_packs()
     
@@ -155,7 +414,7 @@ class TTSEngine:
         """获取可用的语音包列表（兼容性方法）"""
         return voice_pack_manager.get_available_voice_packs()
     
-    def get_available_engine_voice_packs(self, engine_name: str) -> List[str]:
+    def get_available_engine_voice_packs(self, engine_name: str) -> Tuple[str, ...]:
         """获取指定引擎可用的语音包列表"""
         return voice_pack_manager.get_available_engine_voice_packs(engine_name)
     
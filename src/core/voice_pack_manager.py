@@ -5,7 +5,8 @@
 
 import os
 import yaml
-from typing import Dict, Any, List, Optional
+from types import MappingProxyType
+from typing import Dict, Any, List, Tuple, Optional, Mapping
 from pathlib import Path
 
 from ..utils.logger import get_logger
@@ -13,13 +14,158 @@ from ..utils.config_loader import config_loader
 
 logger = get_logger(__name__)
 
+# 支持的引擎列表
+_ENGINES = ("edge_tts", "gtts", "pyttsx3", "cosyvoice")
+
+# 基础语音包
+_BASE_VOICE_PACKS = MappingProxyType({
+    "default": {
+        "name": "默认语音包",
+        "description": "标准中文语音包",
+        "speaker_id": 0,
+        "emotion": "neutral",
+        "speed": 1.0,
+        "pitch": 0,
+        "energy": 1.0,
+        "language": "zh-CN",
+        "gender": "unknown",
+        "style": "neutral"
+    },
+    "female": {
+        "name": "女声语音包",
+        "description": "温柔女声",
+        "speaker_id": 1,
+        "emotion": "gentle",
+        "speed": 1.0,
+        "pitch": 2,
+        "energy": 0.9,
+        "language": "zh-CN",
+        "gender": "female",
+        "style": "gentle"
+    },
+    "male": {
+        "name": "男声语音包",
+        "description": "磁性男声",
+        "speaker_id": 2,
+        "emotion": "deep",
+        "speed": 0.9,
+        "pitch": -2,
+        "energy": 1.1,
+        "language": "zh-CN",
+        "gender": "male",
+        "style": "deep"
+    },
+    "child": {
+        "name": "儿童语音包",
+        "description": "活泼可爱的儿童声音",
+        "speaker_id": 3,
+        "emotion": "happy",
+        "speed": 1.2,
+        "pitch": 4,
+        "energy": 1.2,
+        "language": "zh-CN",
+        "gender": "unknown",
+        "style": "cute"
+    },
+    "elder": {
+        "name": "老年语音包",
+        "description": "慈祥的老年声音",
+        "speaker_id": 4,
+        "emotion": "calm",
+        "speed": 0.8,
+        "pitch": -1,
+        "energy": 0.8,
+        "language": "zh-CN",
+        "gender": "unknown",
+        "style": "wise"
+    },
+    "robot": {
+        "name": "机器人语音包",
+        "description": "科技感的机器人声音",
+        "speaker_id": 5,
+        "emotion": "neutral",
+        "speed": 0.9,
+        "pitch": 0,
+        "energy": 1.0,
+        "language": "zh-CN",
+        "gender": "unknown",
+        "style": "robotic"
+    },
+    "angry": {
+        "name": "愤怒语音包",
+        "description": "愤怒情绪的声音",
+        "speaker_id": 6,
+        "emotion": "angry",
+        "speed": 1.1,
+        "pitch": 1,
+        "energy": 1.3,
+        "language": "zh-CN",
+        "gender": "unknown",
+        "style": "angry"
+    },
+    "sad": {
+        "name": "悲伤语音包",
+        "description": "悲伤情绪的声音",
+        "speaker_id": 7,
+        "emotion": "sad",
+        "speed": 0.8,
+        "pitch": -1,
+        "energy": 0.7,
+        "language": "zh-CN",
+        "gender": "unknown",
+        "style": "sad"
+    }
+})
+
+# Edge-TTS语音ID映射
+_EDGE_TTS_DEFAULT_VOICE = "zh-CN-XiaoxiaoNeural"
+_EDGE_TTS_VOICE_MAP = MappingProxyType({
+    "default": "zh-CN-XiaoxiaoNeural",
+    "female": "zh-CN-XiaoxiaoNeural",
+    "male": "zh-CN-YunjianNeural",
+    "child": "zh-CN-XiaoxiaoNeural",
+    "elder": "zh-CN-YunjianNeural",
+    "robot": "zh-CN-YunjianNeural",
+    "angry": "zh-CN-XiaoxiaoNeural",
+    "sad": "zh-CN-XiaoxiaoNeural"
+})
+
+# gTTS语言配置映射
+_GTTS_LANG_MAP = MappingProxyType({
+    "default": {"lang": "zh-cn", "tld": "com"},
+    "female": {"lang": "zh-cn", "tld": "com"},
+    "male": {"lang": "zh-tw", "tld": "com"},
+    "child": {"lang": "zh-cn", "tld": "com"},
+    "elder": {"lang": "zh-cn", "tld": "com"},
+    "robot": {"lang": "en", "tld": "com"},
+    "angry": {"lang": "zh-cn", "tld": "com"},
+    "sad": {"lang": "zh-cn", "tld": "com"}
+})
+
+# pyttsx3语音ID映射
+_PYTTSX3_VOICE_HUIHUI = "HKEY_LOCAL_MACHINE\\SOFTWARE\\Microsoft\\Speech\\Voices\\Tokens\\TTS_MS_ZH-CN_HUIHUI_11.0"
+_PYTTSX3_VOICE_ZIRA = "HKEY_LOCAL_MACHINE\\SOFTWARE\\Microsoft\\Speech\\Voices\\Tokens\\TTS_MS_EN-US_ZIRA_11.0"
+_PYTTSX3_VOICE_MAP = MappingProxyType({
+    "default": _PYTTSX3_VOICE_HUIHUI,
+    "female": _PYTTSX3_VOICE_HUIHUI,
+    "male": _PYTTSX3_VOICE_ZIRA,
+    "child": _PYTTSX3_VOICE_HUIHUI,
+    "elder": _PYTTSX3_VOICE_ZIRA,
+    "robot": _PYTTSX3_VOICE_ZIRA,
+    "angry": _PYTTSX3_VOICE_HUIHUI,
+    "sad": _PYTTSX3_VOICE_HUIHUI
+})
+
 
 class VoicePackManager:
     """语音包管理器"""
     
     def __init__(self):
-        self.voice_packs = {}
+        self.voice_packs = MappingProxyType({})
         self.engine_voice_packs = {}
+        self._engine_pack_names = {}
+        self._engine_pack_name_set = {}
+        self._engine_pack_mappings = {}
         self.load_voice_packs()
     
     def load_voice_packs(self):
@@ -28,232 +174,123 @@ class VoicePackManager:
             # 加载基础语音包配置
             voice_packs_config = config_loader.get("voice_packs", {})
             
-            # 基础语音包
-            base_voice_packs = {
-                "default": {
-                    "name": "默认语音包",
-                    "description": "标准中文语音包",
-                    "speaker_id": 0,
-                    "emotion": "neutral",
-                    "speed": 1.0,
-                    "pitch": 0,
-                    "energy": 1.0,
-                    "language": "zh-CN",
-                    "gender": "unknown",
-                    "style": "neutral"
-                },
-                "female": {
-                    "name": "女声语音包",
-                    "description": "温柔女声",
-                    "speaker_id": 1,
-                    "emotion": "gentle",
-                    "speed": 1.0,
-                    "pitch": 2,
-                    "energy": 0.9,
-                    "language": "zh-CN",
-                    "gender": "female",
-                    "style": "gentle"
-                },
-                "male": {
-                    "name": "男声语音包",
-                    "description": "磁性男声",
-                    "speaker_id": 2,
-                    "emotion": "deep",
-                    "speed": 0.9,
-                    "pitch": -2,
-                    "energy": 1.1,
-                    "language": "zh-CN",
-                    "gender": "male",
-                    "style": "deep"
-                },
-                "child": {
-                    "name": "儿童语音包",
-                    "description": "活泼可爱的儿童声音",
-                    "speaker_id": 3,
-                    "emotion": "happy",
-                    "speed": 1.2,
-                    "pitch": 4,
-                    "energy": 1.2,
-                    "language": "zh-CN",
-                    "gender": "unknown",
-                    "style": "cute"
-                },
-                "elder": {
-                    "name": "老年语音包",
-                    "description": "慈祥的老年声音",
-                    "speaker_id": 4,
-                    "emotion": "calm",
-                    "speed": 0.8,
-                    "pitch": -1,
-                    "energy": 0.8,
-                    "language": "zh-CN",
-                    "gender": "unknown",
-                    "style": "wise"
-                },
-                "robot": {
-                    "name": "机器人语音包",
-                    "description": "科技感的机器人声音",
-                    "speaker_id": 5,
-                    "emotion": "neutral",
-                    "speed": 0.9,
-                    "pitch": 0,
-                    "energy": 1.0,
-                    "language": "zh-CN",
-                    "gender": "unknown",
-                    "style": "robotic"
-                },
-                "angry": {
-                    "name": "愤怒语音包",
-                    "description": "愤怒情绪的声音",
-                    "speaker_id": 6,
-                    "emotion": "angry",
-                    "speed": 1.1,
-                    "pitch": 1,
-                    "energy": 1.3,
-                    "language": "zh-CN",
-                    "gender": "unknown",
-                    "style": "angry"
-                },
-                "sad": {
-                    "name": "悲伤语音包",
-                    "description": "悲伤情绪的声音",
-                    "speaker_id": 7,
-                    "emotion": "sad",
-                    "speed": 0.8,
-                    "pitch": -1,
-                    "energy": 0.7,
-                    "language": "zh-CN",
-                    "gender": "unknown",
-                    "style": "sad"
-                }
-            }
-            
-            # 合并配置
-            self.voice_packs = {**base_voice_packs, **voice_packs_config}
+            # 合并配置（外层和每个语音包都是只读视图，需要修改时请自行复制）
+            merged = {**_BASE_VOICE_PACKS, **voice_packs_config}
+            self.voice_packs = MappingProxyType({
+                pack_name: MappingProxyType(dict(pack_config))
+                for pack_name, pack_config in merged.items()
+            })
             
-            # 为每个引擎创建独立的语音包列表
-            self._create_engine_voice_packs()
+            # 引擎语音包在首次访问时按需创建
+            self.engine_voice_packs = {}
+            self._engine_pack_names = {}
+            self._engine_pack_name_set = {}
+            self._engine_pack_mappings = {}
             
             logger.info(f"总共加载了 {len(self.voice_packs)} 个基础语音包")
             
         except Exception as e:
             logger.error(f"加载语音包配置失败: {e}")
-            self.voice_packs = {}
+            self.voice_packs = MappingProxyType({})
     
-    def _create_engine_voice_packs(self):
-        """为每个引擎创建独立的语音包列表"""
-        try:
-            # 定义引擎列表
-            engines = ["edge_tts", "gtts", "pyttsx3", "cosyvoice"]
+    def _get_engine_packs(self, engine_name: str) -> Dict[str, Dict[str, Any]]:
+        """获取指定引擎的语音包（首次访问时创建并缓存）"""
+        engine_packs = self.engine_voice_packs.get(engine_name)
+        if engine_packs is None:
+            if engine_name not in _ENGINES:
+                return {}
+            engine_packs = self._build_engine_voice_packs(engine_name)
+            self.engine_voice_packs[engine_name] = engine_packs
             
-            # 为每个引擎创建语音包
-            for engine_name in engines:
-                engine_packs = {}
+            # 同时预计算名称列表、名称集合和基础语音包映射
+            self._engine_pack_names[engine_name] = tuple(engine_packs)
+            self._engine_pack_name_set[engine_name] = frozenset(engine_packs)
+            self._engine_pack_mappings[engine_name] = {
+                pack_config["base_pack"]: engine_pack_name
+                for engine_pack_name, pack_config in engine_packs.items()
+                if pack_config.get("base_pack")
+            }
+        return engine_packs
+    
+    def _build_engine_voice_packs(self, engine_name: str) -> Dict[str, Dict[str, Any]]:
+        """为指定引擎创建独立的语音包列表"""
+        engine_packs = {}
+        try:
+            for pack_name, pack_config in self.voice_packs.items():
+                # 创建引擎特定的语音包名称
+                engine_pack_name = f"{engine_name}_{pack_name}"
                 
-                for pack_name, pack_config in self.voice_packs.items():
-                    # 创建引擎特定的语音包名称
-                    engine_pack_name = f"{engine_name}_{pack_name}"
-                    
-                    # 复制基础配置
-                    engine_pack_config = pack_config.copy()
-                    
-                    # 添加引擎特定信息
-                    engine_pack_config["engine"] = engine_name
-                    engine_pack_config["base_pack"] = pack_name
-                    engine_pack_config["display_name"] = f"{engine_name.upper()}-{pack_config.get('name', pack_name)}"
-                    
-                    # 根据引擎添加特定配置
-                    if engine_name == "edge_tts":
-                        engine_pack_config["voice_id"] = self._get_edge_tts_voice_id(pack_name)
-                        engine_pack_config["description"] = f"Edge-TTS {pack_config.get('description', '')}"
-                    elif engine_name == "gtts":
-                        engine_pack_config["language_config"] = self._get_gtts_language_config(pack_name)
-                        engine_pack_config["description"] = f"gTTS {pack_config.get('description', '')}"
-                    elif engine_name == "pyttsx3":
-                        engine_pack_config["voice_id"] = self._get_pyttsx3_voice_id(pack_name)
-                        engine_pack_config["description"] = f"pyttsx3 {pack_config.get('description', '')}"
-                    elif engine_name == "cosyvoice":
-                        engine_pack_config["description"] = f"CosyVoice {pack_config.get('description', '')}"
-                    
-                    engine_packs[engine_pack_name] = engine_pack_config
+                # 复制基础配置
+                engine_pack_config = pack_config.copy()
                 
-                self.engine_voice_packs[engine_name] = engine_packs
-                logger.info(f"为引擎 {engine_name} 创建了 {len(engine_packs)} 个语音包")
+                # 添加引擎特定信息
+                engine_pack_config["engine"] = engine_name
+                engine_pack_config["base_pack"] = pack_name
+                engine_pack_config["display_name"] = f"{engine_name.upper()}-{pack_config.get('name', pack_name)}"
                 
+                # 根据引擎添加特定配置
+                if engine_name == "edge_tts":
+                    engine_pack_config["voice_id"] = self._get_edge_tts_voice_id(pack_name)
+                    engine_pack_config["description"] = f"Edge-TTS {pack_config.get('description', '')}"
+                elif engine_name == "gtts":
+                    engine_pack_config["language_config"] = self._get_gtts_language_config(pack_name)
+                    engine_pack_config["description"] = f"gTTS {pack_config.get('description', '')}"
+                elif engine_name == "pyttsx3":
+                    engine_pack_config["voice_id"] = self._get_pyttsx3_voice_id(pack_name)
+                    engine_pack_config["description"] = f"pyttsx3 {pack_config.get('description', '')}"
+                elif engine_name == "cosyvoice":
+                    engine_pack_config["description"] = f"CosyVoice {pack_config.get('description', '')}"
+                
+                engine_packs[engine_pack_name] = engine_pack_config
+            
+            logger.info(f"为引擎 {engine_name} 创建了 {len(engine_packs)} 个语音包")
+            
         except Exception as e:
-            logger.error(f"创建引擎语音包失败: {e}")
+            logger.error(f"创建引擎 {engine_name} 语音包失败: {e}")
+        
+        return engine_packs
     
     def _get_edge_tts_voice_id(self, pack_name: str) -> str:
         """获取Edge-TTS语音ID"""
-        voice_mapping = {
-            "default": "zh-CN-XiaoxiaoNeural",
-            "female": "zh-CN-XiaoxiaoNeural",
-            "male": "zh-CN-YunjianNeural",
-            "child": "zh-CN-XiaoxiaoNeural",
-            "elder": "zh-CN-YunjianNeural",
-            "robot": "zh-CN-YunjianNeural",
-            "angry": "zh-CN-XiaoxiaoNeural",
-            "sad": "zh-CN-XiaoxiaoNeural"
-        }
-        return voice_mapping.get(pack_name, "zh-CN-XiaoxiaoNeural")
+        return _EDGE_TTS_VOICE_MAP.get(pack_name, _EDGE_TTS_DEFAULT_VOICE)
     
     def _get_gtts_language_config(self, pack_name: str) -> dict:
         """获取gTTS语言配置"""
-        language_configs = {
-            "default": {"lang": "zh-cn", "tld": "com"},
-            "female": {"lang": "zh-cn", "tld": "com"},
-            "male": {"lang": "zh-tw", "tld": "com"},
-            "child": {"lang": "zh-cn", "tld": "com"},
-            "elder": {"lang": "zh-cn", "tld": "com"},
-            "robot": {"lang": "en", "tld": "com"},
-            "angry": {"lang": "zh-cn", "tld": "com"},
-            "sad": {"lang": "zh-cn", "tld": "com"}
-        }
-        return language_configs.get(pack_name, language_configs["default"])
+        return dict(_GTTS_LANG_MAP.get(pack_name, _GTTS_LANG_MAP["default"]))
     
     def _get_pyttsx3_voice_id(self, pack_name: str) -> str:
         """获取pyttsx3语音ID"""
-        voice_mapping = {
-            "default": "HKEY_LOCAL_MACHINE\\SOFTWARE\\Microsoft\\Speech\\Voices\\Tokens\\TTS_MS_ZH-CN_HUIHUI_11.0",
-            "female": "HKEY_LOCAL_MACHINE\\SOFTWARE\\Microsoft\\Speech\\Voices\\Tokens\\TTS_MS_ZH-CN_HUIHUI_11.0",
-            "male": "HKEY_LOCAL_MACHINE\\SOFTWARE\\Microsoft\\Speech\\Voices\\Tokens\\TTS_MS_EN-US_ZIRA_11.0",
-            "child": "HKEY_LOCAL_MACHINE\\SOFTWARE\\Microsoft\\Speech\\Voices\\Tokens\\TTS_MS_ZH-CN_HUIHUI_11.0",
-            "elder": "HKEY_LOCAL_MACHINE\\SOFTWARE\\Microsoft\\Speech\\Voices\\Tokens\\TTS_MS_EN-US_ZIRA_11.0",
-            "robot": "HKEY_LOCAL_MACHINE\\SOFTWARE\\Microsoft\\Speech\\Voices\\Tokens\\TTS_MS_EN-US_ZIRA_11.0",
-            "angry": "HKEY_LOCAL_MACHINE\\SOFTWARE\\Microsoft\\Speech\\Voices\\Tokens\\TTS_MS_ZH-CN_HUIHUI_11.0",
-            "sad": "HKEY_LOCAL_MACHINE\\SOFTWARE\\Microsoft\\Speech\\Voices\\Tokens\\TTS_MS_ZH-CN_HUIHUI_11.0"
-        }
-        return voice_mapping.get(pack_name, voice_mapping["default"])
+        return _PYTTSX3_VOICE_MAP.get(pack_name, _PYTTSX3_VOICE_MAP["default"])
     
-    def get_all_voice_packs(self) -> Dict[str, Dict[str, Any]]:
-        """获取所有基础语音包"""
-        return self.voice_packs.copy()
+    def get_all_voice_packs(self) -> Mapping[str, Dict[str, Any]]:
+        """获取所有基础语音包（只读视图，不支持修改）"""
+        return self.voice_packs
     
-    def get_engine_voice_packs(self, engine_name: str) -> Dict[str, Dict[str, Any]]:
-        """获取指定引擎的所有语音包"""
-        return self.engine_voice_packs.get(engine_name, {}).copy()
+    def get_engine_voice_packs(self, engine_name: str) -> Mapping[str, Dict[str, Any]]:
+        """获取指定引擎的所有语音包（只读视图，不支持修改）"""
+        return MappingProxyType(self._get_engine_packs(engine_name))
     
-    def get_all_engine_voice_packs(self) -> Dict[str, Dict[str, Dict[str, Any]]]:
-        """获取所有引擎的语音包"""
-        return self.engine_voice_packs.copy()
+    def get_all_engine_voice_packs(self) -> Dict[str, Mapping[str, Dict[str, Any]]]:
+        """获取所有引擎的语音包（内层为只读视图，不支持修改）"""
+        return {engine_name: MappingProxyType(self._get_engine_packs(engine_name))
+                for engine_name in _ENGINES}
     
-    def get_voice_pack(self, voice_pack_name: str) -> Optional[Dict[str, Any]]:
-        """获取指定基础语音包"""
+    def get_voice_pack(self, voice_pack_name: str) -> Optional[Mapping[str, Any]]:
+        """获取指定基础语音包（只读视图，不支持修改）"""
         return self.voice_packs.get(voice_pack_name)
     
     def get_engine_voice_pack(self, engine_name: str, voice_pack_name: str) -> Optional[Dict[str, Any]]:
         """获取指定引擎的指定语音包"""
-        engine_packs = self.engine_voice_packs.get(engine_name, {})
-        return engine_packs.get(voice_pack_name)
+        return self._get_engine_packs(engine_name).get(voice_pack_name)
     
     def get_available_voice_packs(self) -> List[str]:
         """获取可用的基础语音包列表"""
         return list(self.voice_packs.keys())
     
-    def get_available_engine_voice_packs(self, engine_name: str) -> List[str]:
-        """获取指定引擎可用的语音包列表"""
-        engine_packs = self.engine_voice_packs.get(engine_name, {})
-        return list(engine_packs.keys())
+    def get_available_engine_voice_packs(self, engine_name: str) -> Tuple[str, ...]:
+        """获取指定引擎可用的语音包列表（只读元组）"""
+        self._get_engine_packs(engine_name)
+        return self._engine_pack_names.get(engine_name, ())
     
     def is_voice_pack_available(self, voice_pack_name: str) -> bool:
         """检查基础语音包是否可用"""
@@ -261,10 +298,10 @@ class VoicePackManager:
     
     def is_engine_voice_pack_available(self, engine_name: str, voice_pack_name: str) -> bool:
         """检查引擎语音包是否可用"""
-        engine_packs = self.engine_voice_packs.get(engine_name, {})
-        return voice_pack_name in engine_packs
+        self._get_engine_packs(engine_name)
+        return voice_pack_name in self._engine_pack_name_set.get(engine_name, frozenset())
     
-    def get_voice_packs_by_engine(self, engine_name: str) -> List[str]:
+    def get_voice_packs_by_engine(self, engine_name: str) -> Tuple[str, ...]:
         """获取指定引擎支持的语音包（兼容性方法）"""
         return self.get_available_engine_voice_packs(engine_name)
     
@@ -279,13 +316,8 @@ class VoicePackManager:
     
     def get_engine_voice_pack_mapping(self, engine_name: str) -> Dict[str, str]:
         """获取引擎语音包到基础语音包的映射"""
-        mapping = {}
-        engine_packs = self.engine_voice_packs.get(engine_name, {})
-        for engine_pack_name, pack_config in engine_packs.items():
-            base_pack = pack_config.get("base_pack", "")
-            if base_pack:
-                mapping[base_pack] = engine_pack_name
-        return mapping
+        self._get_engine_packs(engine_name)
+        return self._engine_pack_mappings.get(engine_name, {}).copy()
 
 
 # 全局实例
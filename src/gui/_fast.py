@@ -0,0 +1,60 @@
+"""
+界面用数值计算辅助函数
+可用Numba时使用JIT编译版本，否则回退到NumPy实现
+"""
+
+import numpy as np
+
+try:
+    from numba import njit
+    _NUMBA_AVAILABLE = True
+except ImportError:
+    _NUMBA_AVAILABLE = False
+
+
+if _NUMBA_AVAILABLE:
+    @njit("float32[:, :](float32[:], int64)", cache=True, fastmath=True)
+    def _peaks(audio, n_buckets):
+        """单次遍历计算每个分段的最小值和最大值（Numba加速）"""
+        n = audio.shape[0]
+        out = np.empty((n_buckets, 2), dtype=np.float32)
+        for i in range(n_buckets):
+            start = i * n // n_buckets
+            end = (i + 1) * n // n_buckets
+            lo = audio[start]
+            hi = audio[start]
+            for j in range(start + 1, end):
+                v = audio[j]
+                if v < lo:
+                    lo = v
+                elif v > hi:
+                    hi = v
+            out[i, 0] = lo
+            out[i, 1] = hi
+        return out
+else:
+    def _peaks(audio, n_buckets):
+        """计算每个分段的最小值和最大值"""
+        starts = np.arange(n_buckets, dtype=np.int64) * audio.shape[0] // n_buckets
+        out = np.empty((n_buckets, 2), dtype=np.float32)
+        out[:, 0] = np.minimum.reduceat(audio, starts)
+        out[:, 1] = np.maximum.reduceat(audio, starts)
+        return out
+
+
+def peaks(audio, n_buckets):
+    """
+    计算波形包络
+
+    Args:
+        audio: 音频数据
+        n_buckets: 分段数量（超过采样点数时按采样点数计算）
+
+    Returns:
+        形状为 (分段数, 2) 的数组，每行为该分段的 (最小值, 最大值)
+    """
+    audio = np.ascontiguousarray(audio, dtype=np.float32).ravel()
+    n_buckets = int(min(n_buckets, audio.shape[0]))
+    if n_buckets <= 0:
+        return np.empty((0, 2), dtype=np.float32)
+    return _peaks(audio, n_buckets)
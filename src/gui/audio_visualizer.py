@@ -10,6 +10,72 @@ import matplotlib.pyplot as plt
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
 from matplotlib.figure import Figure
 
+from ._fast import peaks
+
+# 波形图最多绘制的包络分段数（每段绘制最小值和最大值两个点）
+_WAVEFORM_BUCKETS = 2000
+
+try:
+    from scipy.signal import stft
+    _SCIPY_AVAILABLE = True
+except ImportError:
+    _SCIPY_AVAILABLE = False
+
+try:
+    from numba import njit, prange
+    _NUMBA_AVAILABLE = True
+except ImportError:
+    _NUMBA_AVAILABLE = False
+
+
+if _NUMBA_AVAILABLE:
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _window_frames(x, win, hop, n_frames, w):
+        """分帧并加窗（Numba加速）"""
+        out = np.empty((n_frames, w), dtype=np.float32)
+        for i in prange(n_frames):
+            base = i * hop
+            for j in range(w):
+                out[i, j] = x[base + j] * win[j]
+        return out
+else:
+    def _window_frames(x, win, hop, n_frames, w):
+        """分帧并加窗"""
+        frames = np.lib.stride_tricks.sliding_window_view(x, w)[::hop][:n_frames]
+        return (frames * win).astype(np.float32)
+
+
+def _compute_stft(audio_data, sample_rate, window_size, hop_size):
+    """
+    计算短时傅里叶变换
+    
+    优先使用SciPy；不可用时先分帧加窗（可用Numba时JIT加速），再统一做一次rfft。
+    
+    Returns:
+        (频率轴, 时间轴, STFT复数矩阵[频率, 帧])
+    """
+    if _SCIPY_AVAILABLE:
+        return stft(
+            audio_data,
+            fs=sample_rate,
+            window='hann',
+            nperseg=window_size,
+            noverlap=window_size - hop_size,
+            boundary=None,
+            padded=False
+        )
+    
+    x = np.ascontiguousarray(audio_data, dtype=np.float32)
+    n_frames = (len(x) - window_size) // hop_size + 1
+    # 与scipy的'hann'一致：周期汉宁窗，并按窗口和归一化
+    win = np.hanning(window_size + 1)[:-1].astype(np.float32)
+    frames = _window_frames(x, win, hop_size, n_frames, window_size)
+    stft_data = np.fft.rfft(frames, axis=1).T / win.sum()
+    
+    freq_bins = np.fft.rfftfreq(window_size, 1.0 / sample_rate)
+    time_frames = (np.arange(n_frames) * hop_size + window_size / 2) / sample_rate
+    return freq_bins, time_frames, stft_data
+
 
 class AudioVisualizer(QWidget):
     """音频可视化组件"""
@@ -18,6 +84,8 @@ class AudioVisualizer(QWidget):
         super().__init__()
         self.audio_data = None
         self.sample_rate = 22050
+        self._time_axis = None
+        self._time_axis_key = None
         self.init_ui()
     
     def init_ui(self):
@@ -39,6 +107,44 @@ class AudioVisualizer(QWidget):
         self.spectrum_ax = self.figure.add_subplot(3, 1, 2)
         self.spectrogram_ax = self.figure.add_subplot(3, 1, 3)
         
+        # 创建常驻的绘图对象，更新时只替换数据
+        self._waveform_line, = self.waveform_ax.plot([], [], 'b-', linewidth=0.5)
+        self.waveform_ax.set_title('音频波形')
+        self.waveform_ax.set_xlabel('时间 (秒)')
+        self.waveform_ax.set_ylabel('幅度')
+        self.waveform_ax.grid(True, alpha=0.3)
+        
+        self._spectrum_line, = self.spectrum_ax.plot([], [], 'r-', linewidth=1)
+        self.spectrum_ax.set_title('频谱')
+        self.spectrum_ax.set_xlabel('频率 (Hz)')
+        self.spectrum_ax.set_ylabel('幅度 (dB)')
+        self.spectrum_ax.grid(True, alpha=0.3)
+        
+        self._spec_im = self.spectrogram_ax.imshow(
+            np.zeros((1, 1)),
+            aspect='auto',
+            origin='lower',
+            cmap='viridis'
+        )
+        self.spectrogram_ax.set_title('频谱图')
+        self.spectrogram_ax.set_xlabel('时间 (秒)')
+        self.spectrogram_ax.set_ylabel('频率 (Hz)')
+        
+        # 添加颜色条
+        self._spec_cbar = None
+        try:
+            self._spec_cbar = self.figure.colorbar(self._spec_im, ax=self.spectrogram_ax)
+            self._spec_cbar.set_label('幅度 (dB)')
+        except Exception:
+            pass  # 如果添加颜色条失败，忽略
+        
+        # 空状态提示
+        self._empty_texts = [
+            ax.text(0.5, 0.5, '暂无音频数据', transform=ax.transAxes,
+                    ha='center', va='center', fontsize=12)
+            for ax in (self.waveform_ax, self.spectrum_ax, self.spectrogram_ax)
+        ]
+        
         self.figure.tight_layout()
         
         # 设置初始显示
@@ -64,24 +170,42 @@ class AudioVisualizer(QWidget):
         except Exception as e:
             print(f"设置音频数据失败: {e}")
     
+    def _get_time_axis(self, length, sample_rate, n_buckets=0):
+        """
+        获取波形时间轴（按长度、采样率和分段数缓存）
+        
+        n_buckets 大于0时返回包络的时间轴：每段起点重复两次，共 2*n_buckets 个点。
+        """
+        key = (length, sample_rate, n_buckets)
+        if self._time_axis_key != key:
+            if n_buckets:
+                starts = np.arange(n_buckets, dtype=np.int64) * length // n_buckets
+                self._time_axis = np.repeat(starts.astype(np.float32) * (1.0 / sample_rate), 2)
+            else:
+                self._time_axis = np.arange(length, dtype=np.float32) * (1.0 / sample_rate)
+            self._time_axis_key = key
+        return self._time_axis
+    
     def update_visualization(self):
         """更新可视化显示"""
         if self.audio_data is None:
             return
         
         try:
-            # 清除之前的图形
-            self.clear_plots()
-            
-            # 时间轴
-            time_axis = np.linspace(0, len(self.audio_data) / self.sample_rate, len(self.audio_data))
+            for text in self._empty_texts:
+                text.set_visible(False)
             
-            # 1. 波形图
-            self.waveform_ax.plot(time_axis, self.audio_data, 'b-', linewidth=0.5)
-            self.waveform_ax.set_title('音频波形')
-            self.waveform_ax.set_xlabel('时间 (秒)')
-            self.waveform_ax.set_ylabel('幅度')
-            self.waveform_ax.grid(True, alpha=0.3)
+            # 1. 波形图（长音频只绘制最小/最大值包络）
+            n_samples = len(self.audio_data)
+            if n_samples > 2 * _WAVEFORM_BUCKETS:
+                time_axis = self._get_time_axis(n_samples, self.sample_rate, _WAVEFORM_BUCKETS)
+                waveform = peaks(self.audio_data, _WAVEFORM_BUCKETS).ravel()
+            else:
+                time_axis = self._get_time_axis(n_samples, self.sample_rate)
+                waveform = self.audio_data
+            self._waveform_line.set_data(time_axis, waveform)
+            self.waveform_ax.relim()
+            self.waveform_ax.autoscale_view()
             
             # 2. 频谱图
             # 计算FFT
@@ -96,12 +220,10 @@ class AudioVisualizer(QWidget):
             # 转换为dB
             fft_db = 20 * np.log10(fft_magnitude + 1e-10)
             
-            self.spectrum_ax.plot(fft_freq_positive[:len(fft_freq_positive)//2], 
-                                fft_db[:len(fft_db)//2], 'r-', linewidth=1)
-            self.spectrum_ax.set_title('频谱')
-            self.spectrum_ax.set_xlabel('频率 (Hz)')
-            self.spectrum_ax.set_ylabel('幅度 (dB)')
-            self.spectrum_ax.grid(True, alpha=0.3)
+            self._spectrum_line.set_data(fft_freq_positive[:len(fft_freq_positive)//2],
+                                         fft_db[:len(fft_db)//2])
+            self.spectrum_ax.relim()
+            self.spectrum_ax.autoscale_view()
             self.spectrum_ax.set_xlim(0, self.sample_rate // 4)  # 显示到奈奎斯特频率的一半
             
             # 3. 频谱图 (时频分析)
@@ -110,54 +232,22 @@ class AudioVisualizer(QWidget):
             hop_size = window_size // 4
             
             if len(self.audio_data) > window_size:
-                # 简化的频谱图计算
-                n_frames = (len(self.audio_data) - window_size) // hop_size + 1
-                n_freqs = window_size // 2 + 1
-                
-                spectrogram = np.zeros((n_freqs, n_frames))
-                
-                for i in range(n_frames):
-                    start = i * hop_size
-                    end = start + window_size
-                    window_data = self.audio_data[start:end]
-                    
-                    # 应用汉宁窗
-                    windowed_data = window_data * np.hanning(len(window_data))
-                    
-                    # 计算FFT
-                    fft_frame = np.fft.fft(windowed_data)
-                    magnitude = np.abs(fft_frame[:n_freqs])
-                    spectrogram[:, i] = magnitude
-                
-                # 转换为dB并显示
-                spectrogram_db = 20 * np.log10(spectrogram + 1e-10)
-                
-                # 时间和频率轴
-                time_frames = np.linspace(0, len(self.audio_data) / self.sample_rate, n_frames)
-                freq_bins = np.linspace(0, self.sample_rate / 2, n_freqs)
-                
-                im = self.spectrogram_ax.imshow(
-                    spectrogram_db, 
-                    aspect='auto', 
-                    origin='lower',
-                    extent=[time_frames[0], time_frames[-1], freq_bins[0], freq_bins[-1]],
-                    cmap='viridis'
+                freq_bins, time_frames, stft_data = _compute_stft(
+                    self.audio_data, self.sample_rate, window_size, hop_size
                 )
                 
-                self.spectrogram_ax.set_title('频谱图')
-                self.spectrogram_ax.set_xlabel('时间 (秒)')
-                self.spectrogram_ax.set_ylabel('频率 (Hz)')
+                # 转换为dB并显示
+                spectrogram_db = 20 * np.log10(np.abs(stft_data) + 1e-10)
                 
-                # 添加颜色条
-                try:
-                    cbar = self.figure.colorbar(im, ax=self.spectrogram_ax)
-                    cbar.set_label('幅度 (dB)')
-                except:
-                    pass  # 如果添加颜色条失败，忽略
+                self._spec_im.set_data(spectrogram_db)
+                self._spec_im.set_extent([time_frames[0], time_frames[-1], freq_bins[0], freq_bins[-1]])
+                self._spec_im.set_clim(spectrogram_db.min(), spectrogram_db.max())
+                self._spec_im.set_visible(True)
+            else:
+                self._spec_im.set_visible(False)
             
             # 更新画布
-            self.figure.tight_layout()
-            self.canvas.draw()
+            self.canvas.draw_idle()
             
         except Exception as e:
             print(f"更新可视化失败: {e}")
@@ -165,23 +255,15 @@ class AudioVisualizer(QWidget):
     def clear_plots(self):
         """清除所有图形"""
         try:
-            self.waveform_ax.clear()
-            self.spectrum_ax.clear()
-            self.spectrogram_ax.clear()
+            self._waveform_line.set_data([], [])
+            self._spectrum_line.set_data([], [])
+            self._spec_im.set_visible(False)
             
-            if self.audio_data is None:
-                # 显示空状态
-                self.waveform_ax.text(0.5, 0.5, '暂无音频数据', 
-                                    transform=self.waveform_ax.transAxes,
-                                    ha='center', va='center', fontsize=12)
-                self.spectrum_ax.text(0.5, 0.5, '暂无音频数据', 
-                                    transform=self.spectrum_ax.transAxes,
-                                    ha='center', va='center', fontsize=12)
-                self.spectrogram_ax.text(0.5, 0.5, '暂无音频数据', 
-                                       transform=self.spectrogram_ax.transAxes,
-                                       ha='center', va='center', fontsize=12)
+            # 无音频数据时显示空状态
+            for text in self._empty_texts:
+                text.set_visible(self.audio_data is None)
             
-            self.canvas.draw()
+            self.canvas.draw_idle()
             
         except Exception as e:
-            print(f"清除图形失败: {e}")
\ No newline at end of file
+            print(f"清除图形失败: {e}")
@@ -3,29 +3,223 @@
 实现引擎与语音包的对应关系
 """
 
-import json
 import os
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from importlib import import_module
+from sys import intern
 from pathlib import Path
+from types import MappingProxyType
 from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# 优先使用orjson解析配置（直接读取字节），不可用时回退到标准库json
+try:
+    import orjson
+    _loads = orjson.loads
+    _binary = True
+except ImportError:
+    import json
+    _loads = json.loads
+    _binary = False
+
+# 引擎语音包配置文件路径
+_CONFIG_PATH = Path(__file__).resolve().parents[2] / "config" / "engine_voice_config.json"
+
+# 已解析的配置，按配置文件的 (修改时间, 大小) 区分，只保存在内存中
+_config_cache = {}
+
+# 已导入的集成对象缓存，避免每次刷新都走导入机制
+_integration_cache = {}
+
+# 引擎 -> (缓存键, 模块路径, 属性名)
+_VOICE_SOURCES = {
+    "edge_tts": ("edge", "src.core.edge_tts_integration", "edge_tts_integration"),
+    "pyttsx3": ("pyttsx3", "src.core.pyttsx3_integration", "pyttsx3_integration"),
+    "cosyvoice": ("cosyvoice", "src.core.real_cosyvoice_integration", "real_cosyvoice_integration"),
+}
+
+# 引擎信息（只读常量）
+_ENGINE_INFO = MappingProxyType({
+    "edge_tts": MappingProxyType({
+        "name": "Edge-TTS",
+        "description": "微软Edge浏览器TTS服务",
+        "features": ("高质量", "多语言", "在线服务"),
+        "voice_count": "36+ 中文语音"
+    }),
+    "cosyvoice": MappingProxyType({
+        "name": "CosyVoice2.0",
+        "description": "阿里巴巴开源TTS模型",
+        "features": ("高质量", "本地推理", "情感表达"),
+        "voice_count": "6+ 语音风格"
+    }),
+    "gtts": MappingProxyType({
+        "name": "Google TTS",
+        "description": "Google文本转语音服务",
+        "features": ("多语言", "在线服务", "免费"),
+        "voice_count": "13+ 语言"
+    }),
+    "pyttsx3": MappingProxyType({
+        "name": "pyttsx3",
+        "description": "本地系统TTS引擎",
+        "features": ("离线", "跨平台", "系统集成"),
+        "voice_count": "系统语音"
+    })
+})
+
+_UNKNOWN_ENGINE_INFO = MappingProxyType({
+    "description": "未知引擎",
+    "features": (),
+    "voice_count": "未知"
+})
+
+# 默认语音包列表（只读常量）
+_COSYVOICE_DEFAULT_VOICES = (
+    ("默认语音", "default"),
+    ("温暖女声", "female_warm"),
+    ("深沉男声", "male_deep"),
+    ("可爱童声", "child_cute"),
+    ("专业播音", "professional"),
+    ("情感朗读", "emotional")
+)
+_COSYVOICE_FALLBACK_VOICES = (("默认语音", "default"), ("温暖女声", "female_warm"), ("深沉男声", "male_deep"))
+
+# gTTS支持的语言和方言
+_GTTS_VOICES = (
+    ("中文 (普通话)", "zh-cn"),
+    ("中文 (台湾)", "zh-tw"),
+    ("English (US)", "en-us"),
+    ("English (UK)", "en-uk"),
+    ("English (Australia)", "en-au"),
+    ("日本語", "ja"),
+    ("한국어", "ko"),
+    ("Français", "fr"),
+    ("Deutsch", "de"),
+    ("Español", "es"),
+    ("Italiano", "it"),
+    ("Português", "pt"),
+    ("Русский", "ru")
+)
+
+_PYTTSX3_DEFAULT_VOICES = (
+    ("系统默认", "default"),
+    ("Microsoft Zira (Female)", "zira"),
+    ("Microsoft David (Male)", "david"),
+    ("Microsoft Mark (Male)", "mark")
+)
+_PYTTSX3_FALLBACK_VOICES = (("系统默认", "default"),)
+
+_BASIC_VOICES = (
+    ("默认语音", "default"),
+    ("女声", "female"),
+    ("男声", "male"),
+    ("童声", "child")
+)
+
+# 规整后的语音列表缓存：键 -> (原始语音列表对象, 显示名元组, 语音ID元组)
+_normalized_voices = {}
+
+
+def _normalize_voices(voices, id_field, name_field):
+    """将集成提供的语音列表（字典列表或字典）统一整理为显示名元组和语音ID元组"""
+    if isinstance(voices, dict):
+        items = voices.items()
+        name_field = 'name'
+    else:
+        items = ((voice_info.get(id_field, 'Unknown'), voice_info)
+                 for voice_info in voices if isinstance(voice_info, dict))
+    
+    _fmt = "{} ({})".format
+    display_names = []
+    voice_ids = []
+    for voice_id, voice_info in items:
+        voice_id = intern(str(voice_id))
+        gender = intern(str(voice_info.get('gender', 'Unknown')))
+        display_names.append(_fmt(voice_info.get(name_field, voice_id), gender))
+        voice_ids.append(voice_id)
+    return tuple(display_names), tuple(voice_ids)
+
+
+def _get_normalized_voices(key, voices, id_field, name_field):
+    """获取规整后的语音列表，原始列表对象不变时直接复用"""
+    cached = _normalized_voices.get(key)
+    if cached is None or cached[0] is not voices:
+        cached = (voices, *_normalize_voices(voices, id_field, name_field))
+        _normalized_voices[key] = cached
+    return cached[1], cached[2]
+
+
+def _get_integration(key, module_path, attr):
+    """按需导入并缓存集成对象"""
+    obj = _integration_cache.get(key)
+    if obj is None:
+        mod = sys.modules.get(module_path) or import_module(module_path)
+        obj = getattr(mod, attr)
+        _integration_cache[key] = obj
+    return obj
+
 
 class EngineVoiceManager:
     """引擎和语音包管理器"""
     
     def __init__(self):
         self.engine_voice_mapping = {}
-        self.config = self._load_config()
+        self._voice_cache = {}
+        
+        # 配置在后台线程加载，首次真正用到时才等待
+        self._config = None
+        self._config_ready = threading.Event()
+        self._group_by_category = False
+        self._max_voices = 50
+        self._display_names = {}
         self._initialize_mappings()
+        threading.Thread(target=self._load_config_background,
+                         name="EngineVoiceConfigLoader", daemon=True).start()
+        
+        # 并行预取各引擎语音包列表
+        self._voice_futures = {}
+        self._prefetch_voices()
+    
+    @property
+    def config(self):
+        """配置字典（加载完成前会阻塞等待）"""
+        self._config_ready.wait()
+        return self._config
+    
+    def _load_config_background(self):
+        """后台加载配置并缓存界面设置"""
+        try:
+            self._config = self._load_config()
+            self._cache_ui_settings()
+        except Exception as e:
+            logger.error(f"后台加载配置失败: {e}")
+        finally:
+            self._config_ready.set()
     
     def _load_config(self):
         """加载配置文件"""
         try:
-            config_path = Path(__file__).parent.parent.parent / "config" / "engine_voice_config.json"
-            if config_path.exists():
-                with open(config_path, 'r', encoding='utf-8') as f:
-                    return json.load(f)
+            config_path = _CONFIG_PATH
+            if config_path.is_file():
+                st = config_path.stat()
+                key = (st.st_mtime_ns, st.st_size)
+                
+                # 配置文件未变化时直接使用已解析的结果
+                config = _config_cache.get(key)
+                if config is not None:
+                    return config
+                
+                if _binary:
+                    with open(config_path, 'rb') as f:
+                        config = _loads(f.read())
+                else:
+                    with open(config_path, 'r', encoding='utf-8') as f:
+                        config = _loads(f.read())
+                _config_cache.clear()
+                _config_cache[key] = config
+                return config
         except Exception as e:
             logger.error(f"加载配置文件失败: {e}")
         
@@ -42,6 +236,30 @@ class EngineVoiceManager:
             }
         }
     
+    def _cache_ui_settings(self):
+        """缓存常用的界面设置，避免每次调用都逐层查找配置"""
+        ui = self._config.get("ui_settings") or {}
+        self._group_by_category = bool(ui.get("group_voices_by_category", False))
+        self._max_voices = int(ui.get("max_voices_per_engine", 50))
+        self._display_names = self._config.get("engine_display_names") or {}
+    
+    def _prefetch_voices(self):
+        """在后台线程中并行构建各引擎的语音包列表"""
+        try:
+            executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="VoicePrefetch")
+            for engine_name in self.engine_voice_mapping:
+                self._voice_futures[engine_name] = executor.submit(self._build_voices, engine_name)
+            executor.shutdown(wait=False)
+        except Exception as e:
+            # 预取失败不影响使用，首次访问时同步构建
+            logger.warning(f"预取语音包列表失败: {e}")
+            self._voice_futures.clear()
+    
+    def _build_voices(self, engine_name):
+        """构建指定引擎的语音包列表，返回 (语音列表来源对象, 语音包列表)"""
+        source = self._get_voice_source(engine_name)
+        return source, self.engine_voice_mapping[engine_name]()
+    
     def _initialize_mappings(self):
         """初始化引擎与语音包的映射关系"""
         self.engine_voice_mapping = {
@@ -52,38 +270,58 @@ class EngineVoiceManager:
         }
     
     def get_voices_for_engine(self, engine_name):
-        """获取指定引擎的语音包列表"""
+        """获取指定引擎的语音包列表（结果按引擎缓存）"""
         try:
-            if engine_name in self.engine_voice_mapping:
-                return self.engine_voice_mapping[engine_name]()
-            else:
-                return self._get_basic_voices()
+            # 取回后台预取的结果
+            future = self._voice_futures.pop(engine_name, None)
+            if future is not None:
+                try:
+                    self._voice_cache[intern(engine_name)] = future.result()
+                except Exception as e:
+                    logger.warning(f"预取引擎 {engine_name} 的语音包失败: {e}")
+            
+            # 集成重新加载语音列表后对象会变化，缓存随之自动失效
+            source = self._get_voice_source(engine_name)
+            cached = self._voice_cache.get(engine_name)
+            if cached is not None and cached[0] is source:
+                return cached[1]
+            
+            getter = self.engine_voice_mapping.get(engine_name)
+            voices = getter() if getter else self._get_basic_voices()
+            
+            self._voice_cache[intern(engine_name)] = (source, voices)
+            return voices
         except Exception as e:
             logger.error(f"获取引擎 {engine_name} 的语音包失败: {e}")
             return self._get_basic_voices()
     
+    def invalidate(self, engine_name=None):
+        """清除语音包缓存，不指定引擎时清除全部"""
+        if engine_name is None:
+            self._voice_futures.clear()
+            self._voice_cache.clear()
+        else:
+            self._voice_futures.pop(engine_name, None)
+            self._voice_cache.pop(engine_name, None)
+    
+    def _get_voice_source(self, engine_name):
+        """获取引擎集成当前的语音列表对象，用于判断缓存是否失效"""
+        source = _VOICE_SOURCES.get(engine_name)
+        if source is None:
+            return None
+        try:
+            return getattr(_get_integration(*source), 'available_voices', None)
+        except Exception:
+            return None
+    
     def _get_edge_tts_voices(self):
         """获取Edge-TTS语音包"""
         try:
-            from src.core.edge_tts_integration import edge_tts_integration
+            edge_tts_integration = _get_integration(*_VOICE_SOURCES["edge_tts"])
             if hasattr(edge_tts_integration, 'available_voices'):
                 voices = edge_tts_integration.available_voices
-                voice_list = []
-                
-                if isinstance(voices, list):
-                    # voices是列表格式，包含字典
-                    for voice_info in voices:
-                        if isinstance(voice_info, dict):
-                            voice_id = voice_info.get('name', 'Unknown')
-                            friendly_name = voice_info.get('friendly_name', voice_id)
-                            gender = voice_info.get('gender', 'Unknown')
-                            display_name = f"{friendly_name} ({gender})"
-                            voice_list.append((display_name, voice_id))
-                elif isinstance(voices, dict):
-                    # voices是字典格式
-                    for voice_id, voice_info in voices.items():
-                        display_name = f"{voice_info.get('name', voice_id)} ({voice_info.get('gender', 'Unknown')})"
-                        voice_list.append((display_name, voice_id))
+                display_names, voice_ids = _get_normalized_voices("edge", voices, 'name', 'friendly_name')
+                voice_list = list(zip(display_names, voice_ids))
                 
                 return voice_list if voice_list else self._get_basic_voices()
             else:
@@ -95,114 +333,63 @@ class EngineVoiceManager:
     def _get_cosyvoice_voices(self):
         """获取CosyVoice语音包"""
         try:
-            from src.core.real_cosyvoice_integration import real_cosyvoice_integration
+            real_cosyvoice_integration = _get_integration(*_VOICE_SOURCES["cosyvoice"])
             if hasattr(real_cosyvoice_integration, 'available_voices'):
                 voices = real_cosyvoice_integration.available_voices
-                voice_list = []
                 
                 if voices:
-                    for voice_id, voice_info in voices.items():
-                        display_name = f"{voice_info.get('name', voice_id)} ({voice_info.get('gender', 'Unknown')})"
-                        voice_list.append((display_name, voice_id))
-                    return voice_list
+                    display_names, voice_ids = _get_normalized_voices("cosyvoice", voices, 'id', 'name')
+                    return list(zip(display_names, voice_ids))
             
             # CosyVoice默认语音包
-            cosyvoice_voices = [
-                ("默认语音", "default"),
-                ("温暖女声", "female_warm"),
-                ("深沉男声", "male_deep"),
-                ("可爱童声", "child_cute"),
-                ("专业播音", "professional"),
-                ("情感朗读", "emotional")
-            ]
-            return cosyvoice_voices
+            return _COSYVOICE_DEFAULT_VOICES
             
         except Exception as e:
             logger.error(f"加载CosyVoice语音包失败: {e}")
-            return [("默认语音", "default"), ("温暖女声", "female_warm"), ("深沉男声", "male_deep")]
+            return _COSYVOICE_FALLBACK_VOICES
     
     def _get_gtts_voices(self):
         """获取gTTS语音包"""
-        try:
-            # gTTS支持的语言和方言
-            gtts_voices = [
-                ("中文 (普通话)", "zh-cn"),
-                ("中文 (台湾)", "zh-tw"),
-                ("English (US)", "en-us"),
-                ("English (UK)", "en-uk"),
-                ("English (Australia)", "en-au"),
-                ("日本語", "ja"),
-                ("한국어", "ko"),
-                ("Français", "fr"),
-                ("Deutsch", "de"),
-                ("Español", "es"),
-                ("Italiano", "it"),
-                ("Português", "pt"),
-                ("Русский", "ru")
-            ]
-            return gtts_voices
-        except Exception as e:
-            logger.error(f"加载gTTS语音包失败: {e}")
-            return [("中文 (普通话)", "zh-cn"), ("English (US)", "en-us")]
+        return _GTTS_VOICES
     
     def _get_pyttsx3_voices(self):
         """获取pyttsx3语音包"""
         try:
-            from src.core.pyttsx3_integration import pyttsx3_integration
+            pyttsx3_integration = _get_integration(*_VOICE_SOURCES["pyttsx3"])
             if hasattr(pyttsx3_integration, 'available_voices'):
                 voices = pyttsx3_integration.available_voices
-                voice_list = []
                 
                 if voices:
-                    for voice_info in voices:
-                        voice_id = voice_info.get('id', 'Unknown')
-                        name = voice_info.get('name', voice_id)
-                        gender = voice_info.get('gender', 'Unknown')
-                        display_name = f"{name} ({gender})"
-                        voice_list.append((display_name, voice_id))
-                    return voice_list
+                    display_names, voice_ids = _get_normalized_voices("pyttsx3", voices, 'id', 'name')
+                    return list(zip(display_names, voice_ids))
             
             # pyttsx3默认语音包
-            pyttsx3_voices = [
-                ("系统默认", "default"),
-                ("Microsoft Zira (Female)", "zira"),
-                ("Microsoft David (Male)", "david"),
-                ("Microsoft Mark (Male)", "mark")
-            ]
-            return pyttsx3_voices
+            return _PYTTSX3_DEFAULT_VOICES
             
         except Exception as e:
             logger.error(f"加载pyttsx3语音包失败: {e}")
-            return [("系统默认", "default")]
+            return _PYTTSX3_FALLBACK_VOICES
     
     def _get_basic_voices(self):
         """获取基础语音包"""
-        return [
-            ("默认语音", "default"),
-            ("女声", "female"),
-            ("男声", "male"),
-            ("童声", "child")
-        ]
+        return _BASIC_VOICES
     
     def get_available_engines(self):
         """获取可用的引擎列表（按配置顺序）"""
         try:
-            from src.core.tts_engine import tts_engine
+            tts_engine = _get_integration("tts_engine", "src.core.tts_engine", "tts_engine")
             available_engines = tts_engine.get_available_engines()
             
             # 按配置顺序排序
             engine_order = self.config.get("engine_order", [])
-            ordered_engines = []
+            available_set = set(available_engines)
             
             # 先添加配置中指定顺序的引擎
-            for engine in engine_order:
-                if engine in available_engines:
-                    ordered_engines.append(engine)
+            ordered_engines = [engine for engine in engine_order if engine in available_set]
             
             # 再添加其他可用引擎
-            for engine in available_engines:
-                if engine not in ordered_engines:
-                    ordered_engines.append(engine)
+            seen = set(ordered_engines)
+            ordered_engines.extend(engine for engine in available_engines if engine not in seen)
             
             return ordered_engines
         except Exception as e:
@@ -211,53 +398,41 @@ class EngineVoiceManager:
     
     def get_engine_display_name(self, engine_name):
         """获取引擎显示名称"""
-        display_names = self.config.get("engine_display_names", {})
-        return display_names.get(engine_name, engine_name)
+        self._config_ready.wait()
+        return self._display_names.get(engine_name, engine_name)
     
     def should_group_voices_by_category(self):
         """是否按类别分组显示语音包"""
-        return self.config.get("ui_settings", {}).get("group_voices_by_category", False)
+        self._config_ready.wait()
+        return self._group_by_category
     
     def get_max_voices_per_engine(self):
         """获取每个引擎最大显示语音数量"""
-        return self.config.get("ui_settings", {}).get("max_voices_per_engine", 50)
+        self._config_ready.wait()
+        return self._max_voices
     
     def get_engine_info(self, engine_name):
         """获取引擎信息"""
-        engine_info_mapping = {
-            "edge_tts": {
-                "name": "Edge-TTS",
-                "description": "微软Edge浏览器TTS服务",
-                "features": ["高质量", "多语言", "在线服务"],
-                "voice_count": "36+ 中文语音"
-            },
-            "cosyvoice": {
-                "name": "CosyVoice2.0",
-                "description": "阿里巴巴开源TTS模型",
-                "features": ["高质量", "本地推理", "情感表达"],
-                "voice_count": "6+ 语音风格"
-            },
-            "gtts": {
-                "name": "Google TTS",
-                "description": "Google文本转语音服务",
-                "features": ["多语言", "在线服务", "免费"],
-                "voice_count": "13+ 语言"
-            },
-            "pyttsx3": {
-                "name": "pyttsx3",
-                "description": "本地系统TTS引擎",
-                "features": ["离线", "跨平台", "系统集成"],
-                "voice_count": "系统语音"
-            }
-        }
-        
-        return engine_info_mapping.get(engine_name, {
-            "name": engine_name,
-            "description": "未知引擎",
-            "features": [],
-            "voice_count": "未知"
-        })
+        info = _ENGINE_INFO.get(engine_name)
+        if info is None:
+            info = {"name": engine_name, **_UNKNOWN_ENGINE_INFO}
+        return info
+
+
+# 全局实例（首次访问时创建）
+_instance = None
+
+
+def get_manager():
+    """获取全局引擎语音包管理器"""
+    global _instance
+    if _instance is None:
+        _instance = EngineVoiceManager()
+    return _instance
 
 
-# 创建全局实例
-engine_voice_manager = EngineVoiceManager()
\ No newline at end of file
+def __getattr__(name):
+    """兼容 `from ... import engine_voice_manager`，首次访问时才创建实例"""
+    if name == "engine_voice_manager":
+        return get_manager()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
\ No newline at end of file
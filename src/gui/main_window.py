@@ -4,68 +4,441 @@
 
 import sys
 import os
+import re
+import hashlib
+import threading
+import time
+from collections import OrderedDict, deque
 from pathlib import Path
 from PyQt5.QtWidgets import (QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, 
-                             QTextEdit, QPushButton, QLabel, QComboBox, 
+                             QTextEdit, QPlainTextEdit, QPushButton, QLabel, QComboBox, 
                              QSlider, QSpinBox, QDoubleSpinBox, QProgressBar,
                              QGroupBox, QGridLayout, QSplitter, QFrame,
                              QMessageBox, QFileDialog, QListWidget, QTabWidget)
-from PyQt5.QtCore import Qt, QThread, pyqtSignal, QTimer
-from PyQt5.QtGui import QFont, QPixmap, QIcon
+from PyQt5.QtCore import Qt, QThread, pyqtSignal, QTimer, QObject, QRunnable, QThreadPool
+from PyQt5.QtGui import (QFont, QPixmap, QIcon, QColor, QPalette,
+                         QStandardItemModel, QStandardItem, QTextCursor)
 import numpy as np
 
 # 添加项目根目录到Python路径
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
-from src.core.tts_engine import tts_engine
-from src.audio.audio_processor import audio_processor
 from src.utils.logger import get_logger
 from .audio_visualizer import AudioVisualizer
 from .voice_pack_widget import VoicePackWidget
-from .engine_voice_manager import engine_voice_manager
-from .engine_voice_manager import engine_voice_manager
-from .engine_voice_manager import engine_voice_manager
+from .engine_voice_manager import get_manager as get_engine_voice_manager
 
 logger = get_logger(__name__)
 
+# 主窗口样式表
+_MAIN_WINDOW_QSS = """
+QMainWindow {
+    background-color: #f0f0f0;
+}
+QGroupBox {
+    font-weight: bold;
+    border: 2px solid #cccccc;
+    border-radius: 5px;
+    margin-top: 1ex;
+    padding-top: 10px;
+}
+QGroupBox::title {
+    subcontrol-origin: margin;
+    left: 10px;
+    padding: 0 5px 0 5px;
+}
+QPushButton {
+    background-color: #4CAF50;
+    color: white;
+    border: none;
+    padding: 8px 16px;
+    border-radius: 4px;
+    font-weight: bold;
+}
+QPushButton:hover {
+    background-color: #45a049;
+}
+QPushButton:pressed {
+    background-color: #3d8b40;
+}
+QPushButton:disabled {
+    background-color: #cccccc;
+    color: #666666;
+}
+QPushButton#synthesizeButton,
+QPushButton#synthesizeButton:hover,
+QPushButton#synthesizeButton:pressed {
+    background-color: palette(button);
+    color: palette(button-text);
+}
+QPushButton#synthesizeButton:disabled {
+    background-color: #cccccc;
+    color: #666666;
+}
+QTextEdit, QPlainTextEdit {
+    border: 1px solid #cccccc;
+    border-radius: 4px;
+    padding: 5px;
+    background-color: white;
+}
+QComboBox {
+    border: 1px solid #cccccc;
+    border-radius: 4px;
+    padding: 5px;
+    background-color: white;
+}
+QSlider::groove:horizontal {
+    border: 1px solid #cccccc;
+    height: 8px;
+    background: #e0e0e0;
+    border-radius: 4px;
+}
+QSlider::handle:horizontal {
+    background: #4CAF50;
+    border: 1px solid #4CAF50;
+    width: 18px;
+    margin: -2px 0;
+    border-radius: 9px;
+}
+"""
+
+# 帮助文本
+_HELP_HTML = """
+<h2>CosyVoice TTS 语音合成系统</h2>
+
+<h3>功能介绍:</h3>
+<ul>
+    <li><b>多引擎支持:</b> Edge-TTS、CosyVoice、Google TTS、pyttsx3</li>
+    <li><b>语音包管理:</b> 每个引擎显示专属语音包</li>
+    <li><b>参数调节:</b> 支持语速、音调、音量调节</li>
+    <li><b>音频可视化:</b> 实时显示音频波形和频谱</li>
+</ul>
+
+<h3>使用方法:</h3>
+<ol>
+    <li>选择TTS引擎</li>
+    <li>选择对应的语音包</li>
+    <li>输入要转换的文本</li>
+    <li>调整语音参数</li>
+    <li>点击"开始合成"按钮</li>
+    <li>播放或保存生成的音频</li>
+</ol>
+
+<h3>引擎说明:</h3>
+<ul>
+    <li><b>Edge-TTS:</b> 微软TTS服务，36+中文语音包</li>
+    <li><b>CosyVoice:</b> 阿里巴巴开源TTS模型，高质量合成</li>
+    <li><b>Google TTS:</b> Google文本转语音服务</li>
+    <li><b>pyttsx3:</b> 本地系统TTS引擎</li>
+</ul>
+
+<h3>快捷键:</h3>
+<ul>
+    <li><b>Ctrl+Enter:</b> 开始合成</li>
+    <li><b>Space:</b> 播放/暂停</li>
+    <li><b>Ctrl+S:</b> 保存音频</li>
+</ul>
+"""
+
+# 合成按钮颜色
+_BTN_COLOR = QColor('#4CAF50')
+_BTN_TEXT_COLOR = QColor('white')
+
+# 语音包超过该数量时直接构建新的数据模型替换下拉框模型
+_LARGE_COMBO_THRESHOLD = 100
+
+# 合成音频的采样率（与保存文件时一致）
+_PLAYBACK_SAMPLE_RATE = 22050
+
+# 分段合成时段落首尾的淡入淡出时长（秒），避免拼接处出现爆音
+_CHUNK_FADE_SECONDS = 0.002
+
+# 流式播放时向输出设备补充数据的间隔（毫秒）
+_PLAYBACK_FEED_MS = 20
+
+# 长文本按句切分，每段最多字符数
+_SENTENCE_END_RE = re.compile(r'(?<=[。！？.!?])')
+_MAX_CHUNK_CHARS = 200
+
+# 打开文本文件时的分块大小和最大载入字符数
+_FILE_READ_CHUNK = 64 * 1024
+_MAX_TEXT_CHARS = 200000
+
+
+class SynthesisCache:
+    """
+    合成结果缓存
+    
+    内存中按LRU保留最近的音频；被淘汰的音频写入磁盘（.npy），
+    内存里只保留路径和形状记录，再次命中时以内存映射方式读取。
+    磁盘缓存同样限制文件数和总大小，超出时按修改时间删除最旧的文件。
+    """
+    
+    def __init__(self, max_entries=32, max_bytes=64 * 1024 * 1024, cache_dir=None,
+                 max_disk_entries=256, max_disk_bytes=512 * 1024 * 1024):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.max_disk_entries = max_disk_entries
+        self.max_disk_bytes = max_disk_bytes
+        self.cache_dir = Path(cache_dir) if cache_dir else Path.home() / ".cache" / "txt2voice"
+        self._memory = OrderedDict()  # key -> np.ndarray
+        self._disk = {}  # key -> (路径, 形状)
+        self._bytes = 0
+        self._lock = threading.Lock()
+    
+    @staticmethod
+    def make_key(text, engine, voice_pack, speed, pitch, energy):
+        """根据合成参数生成缓存键"""
+        raw = f"{engine}|{voice_pack}|{speed:.3f}|{pitch}|{energy:.3f}|{text}"
+        return hashlib.sha256(raw.encode('utf-8')).hexdigest()
+    
+    def get(self, key):
+        """获取缓存的音频，未命中返回None"""
+        with self._lock:
+            audio = self._memory.get(key)
+            if audio is not None:
+                self._memory.move_to_end(key)
+                return audio
+            record = self._disk.get(key)
+        
+        path = record[0] if record else self.cache_dir / f"{key}.npy"
+        try:
+            if path.is_file():
+                # 更新修改时间，清理磁盘缓存时最近用过的文件最后删除
+                os.utime(path)
+                return np.load(path, mmap_mode='r')
+        except Exception as e:
+            logger.warning(f"读取合成缓存失败: {e}")
+        return None
+    
+    def put(self, key, audio):
+        """写入缓存，超出容量时将最久未用的音频转存到磁盘"""
+        evicted = []
+        with self._lock:
+            old = self._memory.pop(key, None)
+            if old is not None:
+                self._bytes -= old.nbytes
+            self._memory[key] = audio
+            self._bytes += audio.nbytes
+            
+            while len(self._memory) > 1 and (len(self._memory) > self.max_entries or
+                                             self._bytes > self.max_bytes):
+                old_key, old_audio = self._memory.popitem(last=False)
+                self._bytes -= old_audio.nbytes
+                evicted.append((old_key, old_audio))
+        
+        for old_key, old_audio in evicted:
+            self._spill(old_key, old_audio)
+    
+    def _spill(self, key, audio):
+        """将音频写入磁盘缓存"""
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            path = self.cache_dir / f"{key}.npy"
+            np.save(path, audio)
+            with self._lock:
+                self._disk[key] = (path, audio.shape)
+        except Exception as e:
+            logger.warning(f"写入合成缓存失败: {e}")
+            return
+        
+        self._prune_disk()
+    
+    def _prune_disk(self):
+        """磁盘缓存超出文件数或总大小限制时，按修改时间从旧到新删除"""
+        try:
+            files = []
+            for entry in os.scandir(self.cache_dir):
+                if entry.name.endswith('.npy') and entry.is_file():
+                    st = entry.stat()
+                    files.append((st.st_mtime_ns, st.st_size, entry.path, entry.name[:-4]))
+        except OSError as e:
+            logger.warning(f"清理合成缓存失败: {e}")
+            return
+        
+        files.sort()
+        count = len(files)
+        total = sum(size for _, size, _, _ in files)
+        for _, size, path, key in files:
+            if count <= self.max_disk_entries and total <= self.max_disk_bytes:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                continue  # 文件仍被映射时（Windows）跳过
+            count -= 1
+            total -= size
+            with self._lock:
+                self._disk.pop(key, None)
+
+
+# 全局合成缓存
+synthesis_cache = SynthesisCache()
+
+
+def _split_text(text, max_chars=_MAX_CHUNK_CHARS):
+    """
+    按句子边界切分文本，相邻短句合并，每段不超过 max_chars 个字符
+    
+    第一句单独成段，使首段尽快合成完成、可以先行播放；
+    单句超过 max_chars 时按长度硬切分。
+    """
+    chunks = []
+    current = ""
+    for sentence in _SENTENCE_END_RE.split(text):
+        if not sentence:
+            continue
+        while len(sentence) > max_chars:
+            if current:
+                chunks.append(current)
+                current = ""
+            chunks.append(sentence[:max_chars])
+            sentence = sentence[max_chars:]
+        if len(current) + len(sentence) > max_chars:
+            chunks.append(current)
+            current = sentence
+        else:
+            current += sentence
+        if not chunks and current.strip():
+            chunks.append(current)
+            current = ""
+    if current:
+        chunks.append(current)
+    return [chunk.strip() for chunk in chunks if chunk.strip()]
+
+
+def _apply_fade(audio, sample_rate=_PLAYBACK_SAMPLE_RATE):
+    """对音频首尾做短暂的汉宁窗淡入淡出（返回新数组）"""
+    n = min(int(sample_rate * _CHUNK_FADE_SECONDS), len(audio) // 2)
+    if n < 2:
+        return audio
+    audio = np.array(audio, dtype=np.float32)
+    ramp = np.hanning(2 * n)[:n].astype(np.float32)
+    audio[:n] *= ramp
+    audio[-n:] *= ramp[::-1]
+    return audio
+
 
-class SynthesisThread(QThread):
-    """语音合成线程"""
+def _to_pcm16(audio):
+    """将浮点音频转换为16位小端PCM字节"""
+    buf = np.clip(np.asarray(audio, dtype=np.float32), -1.0, 1.0)
+    np.multiply(buf, 32767, out=buf)
+    return buf.astype('<i2').tobytes()
+
+
+class SynthesisSignals(QObject):
+    """语音合成任务信号"""
     progress_updated = pyqtSignal(int)
-    synthesis_completed = pyqtSignal(np.ndarray)
+    chunk_ready = pyqtSignal(object)  # 单个段落合成完成，可以先行播放
+    synthesis_completed = pyqtSignal(object)  # 按引用传递音频数组，避免跨线程复制
     synthesis_failed = pyqtSignal(str)
+
+
+class SynthesisJob(QRunnable):
+    """语音合成任务（在线程池中执行）"""
     
-    def __init__(self, text, voice_pack, speed, pitch, energy):
+    def __init__(self, text, voice_pack, speed, pitch, energy, cache_key=None):
         super().__init__()
+        self.signals = SynthesisSignals()
         self.text = text
+        self.chunks = _split_text(text)
         self.voice_pack = voice_pack
         self.speed = speed
         self.pitch = pitch
         self.energy = energy
+        self.cache_key = cache_key
     
     def run(self):
         try:
+            from src.core.tts_engine import tts_engine
+            
             # 更新进度
-            self.progress_updated.emit(10)
-            
-            # 进行语音合成
-            audio = tts_engine.synthesize(
-                self.text, 
-                voice_pack=self.voice_pack,
-                speed=self.speed,
-                pitch=self.pitch,
-                energy=self.energy
-            )
+            self.signals.progress_updated.emit(10)
+            
+            # 逐段合成（引擎按文本缓存，重复的段落不会再次推理）
+            parts = []
+            total = len(self.chunks)
+            for index, chunk in enumerate(self.chunks):
+                part = tts_engine.synthesize(
+                    chunk, 
+                    voice_pack=self.voice_pack,
+                    speed=self.speed,
+                    pitch=self.pitch,
+                    energy=self.energy
+                )
+                if part is None:
+                    parts = []
+                    break
+                if total > 1:
+                    part = _apply_fade(part)
+                parts.append(part)
+                self.signals.chunk_ready.emit(part)
+                self.signals.progress_updated.emit(10 + 85 * (index + 1) // total)
+            
+            audio = None
+            if len(parts) == 1:
+                audio = parts[0]
+            elif parts:
+                audio = np.concatenate(parts)
             
             if audio is not None:
-                self.progress_updated.emit(100)
-                self.synthesis_completed.emit(audio)
+                if self.cache_key:
+                    synthesis_cache.put(self.cache_key, audio)
+                self.signals.progress_updated.emit(100)
+                self.signals.synthesis_completed.emit(audio)
             else:
-                self.synthesis_failed.emit("语音合成失败")
+                self.signals.synthesis_failed.emit("语音合成失败")
                 
         except Exception as e:
-            logger.error(f"语音合成线程异常: {e}")
-            self.synthesis_failed.emit(str(e))
+            logger.error(f"语音合成任务异常: {e}")
+            self.signals.synthesis_failed.emit(str(e))
+
+
+class SaveSignals(QObject):
+    """音频保存任务信号"""
+    saved = pyqtSignal(str)
+    failed = pyqtSignal(str)
+
+
+class SaveTask(QRunnable):
+    """音频保存任务（在线程池中执行，避免写文件阻塞界面）"""
+    
+    def __init__(self, audio_processor, audio, sample_rate, engine_name, voice_pack, filename=None):
+        super().__init__()
+        self.signals = SaveSignals()
+        self.audio_processor = audio_processor
+        self.audio = audio
+        self.sample_rate = sample_rate
+        self.engine_name = engine_name
+        self.voice_pack = voice_pack
+        self.filename = filename
+    
+    def run(self):
+        try:
+            path = self.audio_processor.save_audio(
+                self.audio,
+                self.sample_rate,
+                self.engine_name,
+                self.voice_pack,
+                self.filename
+            )
+            self.signals.saved.emit(path)
+        except Exception as e:
+            logger.error(f"保存音频任务失败: {e}")
+            self.signals.failed.emit(str(e))
+
+
+class ModelLoadThread(QThread):
+    """TTS模型加载线程"""
+    loaded = pyqtSignal(bool)
+    
+    def run(self):
+        try:
+            from src.core.tts_engine import tts_engine
+            self.loaded.emit(bool(tts_engine.load_model()))
+        except Exception as e:
+            logger.error(f"模型加载线程异常: {e}")
+            self.loaded.emit(False)
 
 
 class MainWindow(QMainWindow):
@@ -74,10 +447,72 @@ class MainWindow(QMainWindow):
     def __init__(self):
         super().__init__()
         self.current_audio = None
-        self.synthesis_thread = None
+        self._synthesis_job = None
+        self._settings_dialog = None
+        self._help_dialog = None
+        self._start_menu = None
+        self._pcm_bytes = None
+        self._audio_output = None
+        self._audio_device = None
+        self.current_audio_chunks = []  # 正在合成的音频已完成的段落
+        self._synthesizing = False
+        self._streaming = False  # 播放过程中是否继续接收新合成的段落
+        self._pcm_queue = deque()  # 待写入输出设备的PCM数据
+        self._feed_timer = QTimer(self)
+        self._feed_timer.setInterval(_PLAYBACK_FEED_MS)
+        self._feed_timer.timeout.connect(self._feed_audio)
+        self._btn_font = None
+        self._engine_name = ""  # 当前选择的引擎（随下拉框变化同步）
+        self._voice_id = ""  # 当前选择的语音包ID
+        self._save_tasks = set()  # 进行中的保存任务（保持信号对象存活）
+        
+        # 单线程的合成线程池：复用工作线程，同时保证模型不会被并发调用
+        self._pool = QThreadPool(self)
+        self._pool.setMaxThreadCount(1)
+        self._voice_pack_cache = {}  # 引擎 -> [(显示名称, 语音包ID)]
+        self._engine_voice_cache = {}  # 引擎 -> 引擎语音管理器返回的语音列表
+        self._engine_info_cache = {}  # 引擎 -> 引擎信息
+        self._voice_loaders = {
+            "edge_tts": self._build_edge_tts_voices,
+            "cosyvoice": self._build_cosyvoice_voices,
+            "gtts": self._build_gtts_voices,
+            "pyttsx3": self._build_pyttsx3_voices
+        }
+        self._pending_sig = None
+        self._last_sig = None
+        self._last_audio = None
+        self._model_thread = None
+        
+        # 参数调节结束后合并为一次更新
+        self._param_update_timer = QTimer(self)
+        self._param_update_timer.setSingleShot(True)
+        self._param_update_timer.setInterval(30)
+        self._param_update_timer.timeout.connect(self._on_params_settled)
+        
+        # 日志消息先缓冲，按帧率批量写入日志框
+        self._log_buf = []
+        self._log_timer = QTimer(self)
+        self._log_timer.setSingleShot(True)
+        self._log_timer.setInterval(16)
+        self._log_timer.timeout.connect(self._flush_log)
+        
         self.init_ui()
+        
+        # 在后台线程加载TTS引擎，界面可以先显示和配置
         self.init_tts_engine()
     
+    @property
+    def tts_engine(self):
+        """TTS引擎（首次使用时才导入）"""
+        from src.core.tts_engine import tts_engine
+        return tts_engine
+    
+    @property
+    def audio_processor(self):
+        """音频处理器（首次使用时才导入）"""
+        from src.audio.audio_processor import audio_processor
+        return audio_processor
+    
     def init_ui(self):
         """初始化用户界面"""
         self.setWindowTitle("CosyVoice TTS - 文本转语音系统")
@@ -88,6 +523,7 @@ class MainWindow(QMainWindow):
         
         # 创建中央部件
         central_widget = QWidget()
+        central_widget.setUpdatesEnabled(False)
         self.setCentralWidget(central_widget)
         
         # 创建主布局
@@ -107,72 +543,15 @@ class MainWindow(QMainWindow):
         
         # 设置分割器比例 (适应更小的界面)
         splitter.setSizes([300, 600])
+        central_widget.setUpdatesEnabled(True)
         
         # 设置样式
-        self.setStyleSheet("""
-            QMainWindow {
-                background-color: #f0f0f0;
-            }
-            QGroupBox {
-                font-weight: bold;
-                border: 2px solid #cccccc;
-                border-radius: 5px;
-                margin-top: 1ex;
-                padding-top: 10px;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 5px 0 5px;
-            }
-            QPushButton {
-                background-color: #4CAF50;
-                color: white;
-                border: none;
-                padding: 8px 16px;
-                border-radius: 4px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #45a049;
-            }
-            QPushButton:pressed {
-                background-color: #3d8b40;
-            }
-            QPushButton:disabled {
-                background-color: #cccccc;
-                color: #666666;
-            }
-            QTextEdit {
-                border: 1px solid #cccccc;
-                border-radius: 4px;
-                padding: 5px;
-                background-color: white;
-            }
-            QComboBox {
-                border: 1px solid #cccccc;
-                border-radius: 4px;
-                padding: 5px;
-                background-color: white;
-            }
-            QSlider::groove:horizontal {
-                border: 1px solid #cccccc;
-                height: 8px;
-                background: #e0e0e0;
-                border-radius: 4px;
-            }
-            QSlider::handle:horizontal {
-                background: #4CAF50;
-                border: 1px solid #4CAF50;
-                width: 18px;
-                margin: -2px 0;
-                border-radius: 9px;
-            }
-        """)
+        self.setStyleSheet(_MAIN_WINDOW_QSS)
     
     def create_left_panel(self):
         """创建左侧控制面板"""
         left_widget = QWidget()
+        left_widget.setUpdatesEnabled(False)  # 构建期间暂停重绘，完成后统一布局
         layout = QVBoxLayout(left_widget)
         
         # 引擎选择组
@@ -181,6 +560,7 @@ class MainWindow(QMainWindow):
         
         # 引擎选择下拉框
         self.engine_combo = QComboBox()
+        self.engine_combo.currentIndexChanged.connect(self._on_engine_index_changed)
         self.engine_combo.currentTextChanged.connect(self.on_engine_changed)
         engine_layout.addWidget(QLabel("选择引擎:"))
         engine_layout.addWidget(self.engine_combo)
@@ -198,6 +578,7 @@ class MainWindow(QMainWindow):
         
         # 语音包选择下拉框
         self.voice_pack_combo = QComboBox()
+        self.voice_pack_combo.currentIndexChanged.connect(self._on_voice_index_changed)
         voice_pack_layout.addWidget(QLabel("选择语音包:"))
         voice_pack_layout.addWidget(self.voice_pack_combo)
         
@@ -274,7 +655,10 @@ class MainWindow(QMainWindow):
         control_layout = QVBoxLayout(control_group)
         
         # 合成按钮
-        self.synthesize_btn = QPushButton("开始合成")
+        self.synthesize_btn = QPushButton("加载中...")
+        self.synthesize_btn.setObjectName("synthesizeButton")
+        self._apply_button_palette(self.synthesize_btn)
+        self.synthesize_btn.setEnabled(False)
         self.synthesize_btn.clicked.connect(self.start_synthesis)
         control_layout.addWidget(self.synthesize_btn)
         
@@ -300,11 +684,26 @@ class MainWindow(QMainWindow):
         # 添加弹性空间
         layout.addStretch()
         
+        left_widget.setUpdatesEnabled(True)
         return left_widget
     
+    def _apply_button_palette(self, button):
+        """用字体和调色板设置按钮外观，颜色不再经过样式表状态匹配"""
+        if self._btn_font is None:
+            self._btn_font = QFont(button.font())
+            self._btn_font.setBold(True)
+        button.setFont(self._btn_font)
+        
+        palette = button.palette()
+        palette.setColor(QPalette.Button, _BTN_COLOR)
+        palette.setColor(QPalette.ButtonText, _BTN_TEXT_COLOR)
+        button.setAutoFillBackground(True)
+        button.setPalette(palette)
+    
     def create_right_panel(self):
         """创建右侧显示面板"""
         right_widget = QWidget()
+        right_widget.setUpdatesEnabled(False)  # 构建期间暂停重绘，完成后统一布局
         layout = QVBoxLayout(right_widget)
         
         # 创建标签页
@@ -318,21 +717,39 @@ class MainWindow(QMainWindow):
         log_widget = QWidget()
         log_layout = QVBoxLayout(log_widget)
         
-        self.log_text = QTextEdit()
+        self.log_text = QPlainTextEdit()
         self.log_text.setReadOnly(True)
+        self.log_text.setUndoRedoEnabled(False)
+        # 纯文本日志并限制行数，长时间运行时保持追加开销和内存占用稳定
+        self.log_text.setMaximumBlockCount(1000)
         log_layout.addWidget(self.log_text)
         
         tab_widget.addTab(log_widget, "日志")
         
         layout.addWidget(tab_widget)
         
+        right_widget.setUpdatesEnabled(True)
         return right_widget
     
     def init_tts_engine(self):
-        """初始化TTS引擎"""
+        """初始化TTS引擎（在后台线程中加载模型）"""
         try:
-            # 加载TTS引擎
-            if tts_engine.load_model():
+            self._model_thread = ModelLoadThread()
+            self._model_thread.loaded.connect(self._on_model_loaded)
+            self._model_thread.start()
+            self.log_message("正在加载TTS引擎...")
+            
+        except Exception as e:
+            logger.error(f"初始化TTS引擎失败: {e}")
+            self.log_message(f"初始化TTS引擎失败: {e}", "error")
+    
+    def _on_model_loaded(self, ok):
+        """模型加载完成事件"""
+        try:
+            self.synthesize_btn.setText("开始合成")
+            self.synthesize_btn.setEnabled(True)
+            
+            if ok:
                 self.log_message("TTS引擎加载成功")
                 
                 # 动态加载可用引擎
@@ -356,12 +773,12 @@ class MainWindow(QMainWindow):
         """动态加载可用的TTS引擎"""
         try:
             # 获取实际可用的引擎列表
-            available_engines = tts_engine.get_available_engines()
+            available_engines = self.tts_engine.get_available_engines()
             self.engine_combo.clear()
             self.engine_combo.addItems(available_engines)
             
             # 设置当前引擎
-            current_engine = tts_engine.get_current_engine()
+            current_engine = self.tts_engine.get_current_engine()
             if current_engine:
                 index = self.engine_combo.findText(current_engine)
                 if index >= 0:
@@ -375,25 +792,19 @@ class MainWindow(QMainWindow):
     def update_voice_packs(self):
         """更新语音包列表 - 根据当前引擎显示对应的语音包"""
         try:
-            self.voice_pack_combo.clear()
-            
             # 获取当前引擎
-            current_engine = self.engine_combo.currentText()
+            current_engine = self._engine_name
             if not current_engine:
+                self.voice_pack_combo.clear()
                 return
             
-            # 根据引擎类型获取对应的语音包
-            if current_engine == "edge_tts":
-                self._load_edge_tts_voices()
-            elif current_engine == "cosyvoice":
-                self._load_cosyvoice_voices()
-            elif current_engine == "gtts":
-                self._load_gtts_voices()
-            elif current_engine == "pyttsx3":
-                self._load_pyttsx3_voices()
-            else:
-                # 未知引擎，使用基础语音包
-                self._load_basic_voices()
+            # 同一引擎的语音包列表只构建一次
+            items = self._voice_pack_cache.get(current_engine)
+            if not items:
+                items = self._build_voices(current_engine)
+                self._voice_pack_cache[current_engine] = items
+            
+            self._fill_voice_pack_combo(items)
             
             # 设置默认选择
             if self.voice_pack_combo.count() > 0:
@@ -403,14 +814,61 @@ class MainWindow(QMainWindow):
             
         except Exception as e:
             logger.error(f"更新语音包列表失败: {e}")
-            self._load_basic_voices()
+            self._fill_voice_pack_combo(self._build_basic_voices())
+    
+    def refresh_voice_packs(self):
+        """清除语音包缓存并重新加载当前引擎的语音包"""
+        self._voice_pack_cache.clear()
+        self.invalidate_voice_cache()
+        self.update_voice_packs()
+    
+    def _fill_voice_pack_combo(self, items):
+        """一次性填充语音包下拉框"""
+        combo = self.voice_pack_combo
+        combo.blockSignals(True)
+        combo.setUpdatesEnabled(False)
+        try:
+            if len(items) > _LARGE_COMBO_THRESHOLD:
+                # 大量条目：一次性构建模型，只触发一次模型重置
+                model = QStandardItemModel(combo)
+                rows = []
+                for display_name, voice_id in items:
+                    item = QStandardItem(display_name)
+                    item.setData(voice_id, Qt.UserRole)
+                    rows.append(item)
+                model.appendColumn(rows)
+                combo.setModel(model)
+            else:
+                combo.clear()
+                combo.addItems([display_name for display_name, _ in items])
+                for index, (_, voice_id) in enumerate(items):
+                    combo.setItemData(index, voice_id)
+        finally:
+            combo.setUpdatesEnabled(True)
+            combo.blockSignals(False)
+            self._on_voice_index_changed(combo.currentIndex())
+    
+    def _on_engine_index_changed(self, index):
+        """同步缓存当前引擎名称"""
+        self._engine_name = self.engine_combo.itemText(index)
+    
+    def _on_voice_index_changed(self, index):
+        """同步缓存当前语音包ID（没有data时使用显示文本）"""
+        combo = self.voice_pack_combo
+        self._voice_id = combo.itemData(index) or combo.itemText(index)
+    
+    def _build_voices(self, engine_name):
+        """根据引擎类型构建对应的语音包列表（未知引擎使用基础语音包）"""
+        loader = self._voice_loaders.get(engine_name, self._build_basic_voices)
+        return loader()
 
-    def _load_edge_tts_voices(self):
-        """加载Edge-TTS语音包"""
+    def _build_edge_tts_voices(self):
+        """构建Edge-TTS语音包列表"""
         try:
             from src.core.edge_tts_integration import edge_tts_integration
             if hasattr(edge_tts_integration, 'available_voices'):
                 voices = edge_tts_integration.available_voices
+                voice_list = []
                 if isinstance(voices, list):
                     # voices是列表格式，包含字典
                     for voice_info in voices:
@@ -419,96 +877,79 @@ class MainWindow(QMainWindow):
                             friendly_name = voice_info.get('friendly_name', voice_id)
                             gender = voice_info.get('gender', 'Unknown')
                             display_name = f"{friendly_name} ({gender})"
-                            self.voice_pack_combo.addItem(display_name, voice_id)
+                            voice_list.append((display_name, voice_id))
                 elif isinstance(voices, dict):
                     # voices是字典格式
                     for voice_id, voice_info in voices.items():
                         display_name = f"{voice_info.get('name', voice_id)} ({voice_info.get('gender', 'Unknown')})"
-                        self.voice_pack_combo.addItem(display_name, voice_id)
+                        voice_list.append((display_name, voice_id))
                 else:
-                    self._load_basic_voices()
+                    return self._build_basic_voices()
+                return voice_list
             else:
-                self._load_basic_voices()
+                return self._build_basic_voices()
         except Exception as e:
             logger.error(f"加载Edge-TTS语音包失败: {e}")
-            self._load_basic_voices()
+            return self._build_basic_voices()
 
-    def _load_cosyvoice_voices(self):
-        """加载CosyVoice语音包"""
+    def _build_cosyvoice_voices(self):
+        """构建CosyVoice语音包列表"""
+        # CosyVoice默认语音包
+        cosyvoice_packs = [(pack, pack) for pack in ("default", "female_warm", "male_deep", "child_cute")]
         try:
             from src.core.real_cosyvoice_integration import real_cosyvoice_integration
             if hasattr(real_cosyvoice_integration, 'available_voices'):
                 voices = real_cosyvoice_integration.available_voices
                 if voices:
-                    for voice_id, voice_info in voices.items():
-                        display_name = f"{voice_info.get('name', voice_id)} ({voice_info.get('gender', 'Unknown')})"
-                        self.voice_pack_combo.addItem(display_name, voice_id)
-                else:
-                    # CosyVoice默认语音包
-                    cosyvoice_packs = ["default", "female_warm", "male_deep", "child_cute"]
-                    for pack in cosyvoice_packs:
-                        self.voice_pack_combo.addItem(pack, pack)
-            else:
-                cosyvoice_packs = ["default", "female_warm", "male_deep", "child_cute"]
-                for pack in cosyvoice_packs:
-                    self.voice_pack_combo.addItem(pack, pack)
+                    return [(f"{voice_info.get('name', voice_id)} ({voice_info.get('gender', 'Unknown')})", voice_id)
+                            for voice_id, voice_info in voices.items()]
+            return cosyvoice_packs
         except Exception as e:
             logger.error(f"加载CosyVoice语音包失败: {e}")
-            cosyvoice_packs = ["default", "female_warm", "male_deep", "child_cute"]
-            for pack in cosyvoice_packs:
-                self.voice_pack_combo.addItem(pack, pack)
+            return cosyvoice_packs
 
-    def _load_gtts_voices(self):
-        """加载gTTS语音包"""
-        try:
-            # gTTS支持的语言和方言
-            gtts_voices = [
-                ("zh-cn", "中文 (普通话)"),
-                ("zh-tw", "中文 (台湾)"),
-                ("en-us", "English (US)"),
-                ("en-uk", "English (UK)"),
-                ("ja", "日本語"),
-                ("ko", "한국어")
-            ]
-            for voice_id, display_name in gtts_voices:
-                self.voice_pack_combo.addItem(display_name, voice_id)
-        except Exception as e:
-            logger.error(f"加载gTTS语音包失败: {e}")
-            self._load_basic_voices()
+    def _build_gtts_voices(self):
+        """构建gTTS语音包列表"""
+        # gTTS支持的语言和方言
+        return [
+            ("中文 (普通话)", "zh-cn"),
+            ("中文 (台湾)", "zh-tw"),
+            ("English (US)", "en-us"),
+            ("English (UK)", "en-uk"),
+            ("日本語", "ja"),
+            ("한국어", "ko")
+        ]
 
-    def _load_pyttsx3_voices(self):
-        """加载pyttsx3语音包"""
+    def _build_pyttsx3_voices(self):
+        """构建pyttsx3语音包列表"""
         try:
             from src.core.pyttsx3_integration import pyttsx3_integration
             if hasattr(pyttsx3_integration, 'available_voices'):
                 voices = pyttsx3_integration.available_voices
                 if voices:
+                    voice_list = []
                     for voice_info in voices:
                         voice_id = voice_info.get('id', 'Unknown')
                         name = voice_info.get('name', voice_id)
                         gender = voice_info.get('gender', 'Unknown')
                         display_name = f"{name} ({gender})"
-                        self.voice_pack_combo.addItem(display_name, voice_id)
-                else:
-                    self._load_basic_voices()
-            else:
-                self._load_basic_voices()
+                        voice_list.append((display_name, voice_id))
+                    return voice_list
+            return self._build_basic_voices()
         except Exception as e:
             logger.error(f"加载pyttsx3语音包失败: {e}")
-            self._load_basic_voices()
+            return self._build_basic_voices()
 
-    def _load_basic_voices(self):
-        """加载基础语音包"""
-        basic_packs = ["default", "female", "male", "child"]
-        for pack in basic_packs:
-            self.voice_pack_combo.addItem(pack, pack)
+    def _build_basic_voices(self):
+        """构建基础语音包列表"""
+        return [(pack, pack) for pack in ("default", "female", "male", "child")]
     
     def update_engine_info(self):
         """更新引擎信息显示"""
         try:
-            current_engine = self.engine_combo.currentText()
+            current_engine = self._engine_name
             if current_engine:
-                engine_info = tts_engine.get_engine_info(current_engine)
+                engine_info = self.tts_engine.get_engine_info(current_engine)
                 info_text = f"引擎: {engine_info.get('name', 'Unknown')}\n"
                 info_text += f"版本: {engine_info.get('version', 'Unknown')}\n"
                 info_text += f"状态: {'已加载' if engine_info.get('loaded', False) else '未加载'}\n"
@@ -548,34 +989,39 @@ class MainWindow(QMainWindow):
     
     def on_start_synthesis(self):
         """工具栏开始合成按钮事件 - 显示菜单选项"""
-        from PyQt5.QtWidgets import QMenu, QAction
+        if self._start_menu is None:
+            self._start_menu = self._build_start_menu()
+        menu = self._start_menu
+        
+        # 显示菜单
+        # 获取工具栏位置来显示菜单
+        toolbar = self.sender().parent()
+        if toolbar:
+            menu.exec_(toolbar.mapToGlobal(toolbar.rect().bottomLeft()))
+        else:
+            menu.exec_(self.mapToGlobal(self.rect().center()))
+    
+    def _build_start_menu(self):
+        """构建开始菜单"""
+        from PyQt5.QtWidgets import QMenu
         
         menu = QMenu(self)
         
         # 打开文件选项
-        open_file_action = QAction('📁 打开文件', self)
+        open_file_action = menu.addAction('📁 打开文件')
         open_file_action.triggered.connect(self.open_text_file)
-        menu.addAction(open_file_action)
         
         # 开始合成选项
-        start_synthesis_action = QAction('🎵 开始合成', self)
+        start_synthesis_action = menu.addAction('🎵 开始合成')
         start_synthesis_action.triggered.connect(self.start_synthesis)
-        menu.addAction(start_synthesis_action)
         
         menu.addSeparator()
         
         # 关闭选项
-        close_action = QAction('❌ 关闭', self)
+        close_action = menu.addAction('❌ 关闭')
         close_action.triggered.connect(self.close)
-        menu.addAction(close_action)
         
-        # 显示菜单
-        # 获取工具栏位置来显示菜单
-        toolbar = self.sender().parent()
-        if toolbar:
-            menu.exec_(toolbar.mapToGlobal(toolbar.rect().bottomLeft()))
-        else:
-            menu.exec_(self.mapToGlobal(self.rect().center()))
+        return menu
     
     def open_text_file(self):
         """打开文本文件"""
@@ -589,23 +1035,56 @@ class MainWindow(QMainWindow):
         )
         
         if file_path:
+            doc = self.text_edit.document()
             try:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                    # 假设有文本输入框，将内容设置到输入框
-                    if hasattr(self, 'text_input'):
-                        self.text_input.setPlainText(content)
-                    self.log_message(f'已加载文件: {file_path}')
+                # 分块插入文本，关闭撤销记录并合并为一次编辑
+                doc.setUndoRedoEnabled(False)
+                doc.clear()
+                cursor = QTextCursor(doc)
+                cursor.beginEditBlock()
+                loaded = 0
+                truncated = False
+                try:
+                    with open(file_path, 'r', encoding='utf-8') as f:
+                        while True:
+                            chunk = f.read(_FILE_READ_CHUNK)
+                            if not chunk:
+                                break
+                            remaining = _MAX_TEXT_CHARS - loaded
+                            if len(chunk) > remaining:
+                                chunk = chunk[:remaining]
+                                truncated = True
+                            elif len(chunk) == remaining:
+                                truncated = bool(f.read(1))
+                            cursor.insertText(chunk)
+                            loaded += len(chunk)
+                            if loaded >= _MAX_TEXT_CHARS:
+                                break
+                finally:
+                    cursor.endEditBlock()
+                
+                self.log_message(f'已加载文件: {file_path}')
+                if truncated:
+                    self.log_message(f'文件过大，仅载入前 {_MAX_TEXT_CHARS} 个字符', "warning")
+                    QMessageBox.warning(self, '提示', f'文件过大，仅载入前 {_MAX_TEXT_CHARS} 个字符')
             except Exception as e:
                 QMessageBox.warning(self, '错误', f'无法打开文件: {str(e)}')
+            finally:
+                doc.setUndoRedoEnabled(True)
     
     def show_settings(self):
         """显示引擎与语音包配置对话框"""
-        from PyQt5.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QLabel, 
-                                     QComboBox, QPushButton, QTextEdit, QTabWidget,
-                                     QWidget, QListWidget, QSplitter, QGroupBox,
-                                     QGridLayout, QMessageBox, QCheckBox)
-        import json
+        from PyQt5.QtWidgets import QDialog
+        
+        if self._settings_dialog is None:
+            self._settings_dialog = self._build_settings_dialog()
+        
+        if self._settings_dialog.exec_() == QDialog.Accepted:
+            self.log_message('设置已保存')
+    
+    def _build_settings_dialog(self):
+        """构建设置对话框"""
+        from PyQt5.QtWidgets import QDialog, QCheckBox
         
         dialog = QDialog(self)
         dialog.setWindowTitle('引擎与语音包配置')
@@ -647,12 +1126,18 @@ class MainWindow(QMainWindow):
         button_layout.addWidget(cancel_button)
         layout.addLayout(button_layout)
         
-        if dialog.exec_() == QDialog.Accepted:
-            self.log_message('设置已保存')
+        return dialog
     
     def show_help(self):
         """显示帮助对话框"""
-        from PyQt5.QtWidgets import QDialog, QVBoxLayout, QTextEdit, QPushButton
+        if self._help_dialog is None:
+            self._help_dialog = self._build_help_dialog()
+        
+        self._help_dialog.exec_()
+    
+    def _build_help_dialog(self):
+        """构建帮助对话框"""
+        from PyQt5.QtWidgets import QDialog
         
         dialog = QDialog(self)
         dialog.setWindowTitle('帮助')
@@ -662,61 +1147,24 @@ class MainWindow(QMainWindow):
         
         help_text = QTextEdit()
         help_text.setReadOnly(True)
-        help_text.setHtml("""
-        <h2>CosyVoice TTS 语音合成系统</h2>
-        
-        <h3>功能介绍:</h3>
-        <ul>
-            <li><b>多引擎支持:</b> Edge-TTS、CosyVoice、Google TTS、pyttsx3</li>
-            <li><b>语音包管理:</b> 每个引擎显示专属语音包</li>
-            <li><b>参数调节:</b> 支持语速、音调、音量调节</li>
-            <li><b>音频可视化:</b> 实时显示音频波形和频谱</li>
-        </ul>
-        
-        <h3>使用方法:</h3>
-        <ol>
-            <li>选择TTS引擎</li>
-            <li>选择对应的语音包</li>
-            <li>输入要转换的文本</li>
-            <li>调整语音参数</li>
-            <li>点击"开始合成"按钮</li>
-            <li>播放或保存生成的音频</li>
-        </ol>
-        
-        <h3>引擎说明:</h3>
-        <ul>
-            <li><b>Edge-TTS:</b> 微软TTS服务，36+中文语音包</li>
-            <li><b>CosyVoice:</b> 阿里巴巴开源TTS模型，高质量合成</li>
-            <li><b>Google TTS:</b> Google文本转语音服务</li>
-            <li><b>pyttsx3:</b> 本地系统TTS引擎</li>
-        </ul>
-        
-        <h3>快捷键:</h3>
-        <ul>
-            <li><b>Ctrl+Enter:</b> 开始合成</li>
-            <li><b>Space:</b> 播放/暂停</li>
-            <li><b>Ctrl+S:</b> 保存音频</li>
-        </ul>
-        """)
+        help_text.setHtml(_HELP_HTML)
         layout.addWidget(help_text)
         
         close_button = QPushButton('关闭')
         close_button.clicked.connect(dialog.close)
         layout.addWidget(close_button)
         
-        dialog.exec_()
+        return dialog
     
     def update_voice_pack_info(self):
         """更新语音包信息显示"""
         try:
             # 获取当前选择的语音包ID
-            current_voice_pack = self.voice_pack_combo.currentData()
-            if not current_voice_pack:
-                current_voice_pack = self.voice_pack_combo.currentText()
-            current_engine = self.engine_combo.currentText()
+            current_voice_pack = self._voice_id
+            current_engine = self._engine_name
             
             if current_voice_pack and current_engine:
-                pack_info = tts_engine.get_voice_pack_info(current_voice_pack, current_engine)
+                pack_info = self.tts_engine.get_voice_pack_info(current_voice_pack, current_engine)
                 if pack_info:
                     info_text = f"名称: {pack_info.get('name', 'Unknown')}\n"
                     info_text += f"描述: {pack_info.get('description', 'Unknown')}\n"
@@ -733,7 +1181,7 @@ class MainWindow(QMainWindow):
         """引擎选择改变事件"""
         try:
             if engine_name:
-                tts_engine.set_current_engine(engine_name)
+                self.tts_engine.set_current_engine(engine_name)
                 self.update_voice_packs()
                 self.update_engine_info()
                 self.log_message(f"切换到引擎: {engine_name}")
@@ -743,29 +1191,53 @@ class MainWindow(QMainWindow):
     
     def on_speed_changed(self, value):
         """语速滑块改变事件"""
-        speed = value / 100.0
-        self.speed_spinbox.setValue(speed)
+        self.speed_spinbox.blockSignals(True)
+        self.speed_spinbox.setValue(value / 100.0)
+        self.speed_spinbox.blockSignals(False)
+        self._param_update_timer.start()
     
     def on_speed_spinbox_changed(self, value):
         """语速输入框改变事件"""
+        self.speed_slider.blockSignals(True)
         self.speed_slider.setValue(int(value * 100))
+        self.speed_slider.blockSignals(False)
+        self._param_update_timer.start()
     
     def on_pitch_changed(self, value):
         """音调滑块改变事件"""
+        self.pitch_spinbox.blockSignals(True)
         self.pitch_spinbox.setValue(value)
+        self.pitch_spinbox.blockSignals(False)
+        self._param_update_timer.start()
     
     def on_pitch_spinbox_changed(self, value):
         """音调输入框改变事件"""
+        self.pitch_slider.blockSignals(True)
         self.pitch_slider.setValue(value)
+        self.pitch_slider.blockSignals(False)
+        self._param_update_timer.start()
     
     def on_energy_changed(self, value):
         """音量滑块改变事件"""
-        energy = value / 100.0
-        self.energy_spinbox.setValue(energy)
+        self.energy_spinbox.blockSignals(True)
+        self.energy_spinbox.setValue(value / 100.0)
+        self.energy_spinbox.blockSignals(False)
+        self._param_update_timer.start()
     
     def on_energy_spinbox_changed(self, value):
         """音量输入框改变事件"""
+        self.energy_slider.blockSignals(True)
         self.energy_slider.setValue(int(value * 100))
+        self.energy_slider.blockSignals(False)
+        self._param_update_timer.start()
+    
+    def _on_params_settled(self):
+        """参数调节停止后更新状态栏"""
+        self.statusBar().showMessage(
+            f"语速: {self.speed_spinbox.value():.2f}  "
+            f"音调: {self.pitch_spinbox.value()}  "
+            f"音量: {self.energy_spinbox.value():.2f}", 2000
+        )
     
     def start_synthesis(self):
         """开始语音合成"""
@@ -775,15 +1247,33 @@ class MainWindow(QMainWindow):
                 QMessageBox.warning(self, "警告", "请输入要转换的文本")
                 return
             
-            # 获取语音包ID（使用currentData获取实际的语音包ID）
-            voice_pack = self.voice_pack_combo.currentData()
-            if not voice_pack:
-                # 如果没有data，则使用text作为备用
-                voice_pack = self.voice_pack_combo.currentText()
+            # 已有合成任务在执行时不再排队
+            if self._pool.activeThreadCount() > 0:
+                self.log_message("已有合成任务正在进行", "warning")
+                return
+            
+            # 获取语音包ID（没有data时已回退为显示文本）
+            voice_pack = self._voice_id
             speed = self.speed_spinbox.value()
             pitch = self.pitch_spinbox.value()
             energy = self.energy_spinbox.value()
             
+            # 与上一次成功合成的文本和参数完全相同时直接复用结果
+            engine_name = self._engine_name
+            sig = (text, voice_pack, round(speed, 3), pitch, round(energy, 3), engine_name)
+            self._pending_sig = sig
+            if sig == self._last_sig and self._last_audio is not None:
+                QTimer.singleShot(0, lambda: self.on_synthesis_completed(self._last_audio, from_cache=True))
+                return
+            
+            # 相同文本和参数已合成过时直接使用缓存结果
+            cache_key = SynthesisCache.make_key(text, engine_name, voice_pack, speed, pitch, energy)
+            cached_audio = synthesis_cache.get(cache_key)
+            if cached_audio is not None:
+                self.log_message("使用缓存的合成结果")
+                QTimer.singleShot(0, lambda: self.on_synthesis_completed(cached_audio, from_cache=True))
+                return
+            
             # 禁用按钮
             self.synthesize_btn.setEnabled(False)
             self.play_btn.setEnabled(False)
@@ -793,12 +1283,17 @@ class MainWindow(QMainWindow):
             self.progress_bar.setVisible(True)
             self.progress_bar.setValue(0)
             
-            # 创建合成线程
-            self.synthesis_thread = SynthesisThread(text, voice_pack, speed, pitch, energy)
-            self.synthesis_thread.progress_updated.connect(self.progress_bar.setValue)
-            self.synthesis_thread.synthesis_completed.connect(self.on_synthesis_completed)
-            self.synthesis_thread.synthesis_failed.connect(self.on_synthesis_failed)
-            self.synthesis_thread.start()
+            # 提交合成任务
+            self.current_audio_chunks = []
+            self._synthesizing = True
+            self._streaming = False
+            job = SynthesisJob(text, voice_pack, speed, pitch, energy, cache_key)
+            job.signals.progress_updated.connect(self.progress_bar.setValue)
+            job.signals.chunk_ready.connect(self._on_chunk_ready)
+            job.signals.synthesis_completed.connect(self.on_synthesis_completed)
+            job.signals.synthesis_failed.connect(self.on_synthesis_failed)
+            self._synthesis_job = job
+            self._pool.start(job)
             
             self.log_message("开始语音合成...")
             
@@ -807,10 +1302,21 @@ class MainWindow(QMainWindow):
             self.log_message(f"开始合成失败: {e}", "error")
             self.reset_ui()
     
-    def on_synthesis_completed(self, audio):
-        """合成完成事件"""
+    def on_synthesis_completed(self, audio, from_cache=False):
+        """合成完成事件（from_cache 为 True 表示复用已有结果，不再重复保存）"""
         try:
             self.current_audio = audio
+            self._last_sig = self._pending_sig
+            self._last_audio = audio
+            
+            # 预先转换为PCM，播放时直接从内存输出
+            self._synthesizing = False
+            if self._streaming:
+                # 边合成边播放中：剩余数据继续播放完
+                self._streaming = False
+            else:
+                self._stop_playback()
+            self._pcm_bytes = _to_pcm16(audio)
             
             # 更新音频可视化
             self.audio_visualizer.set_audio(audio)
@@ -825,27 +1331,9 @@ class MainWindow(QMainWindow):
             # 重新启用合成按钮
             self.synthesize_btn.setEnabled(True)
             
-            # 自动保存音频文件（使用新的文件命名规则）
-            try:
-                from ..audio.audio_processor import audio_processor
-                engine_name = self.engine_combo.currentText()
-                voice_pack = self.voice_pack_combo.currentData() or self.voice_pack_combo.currentText()
-                
-                # 保存音频文件
-                actual_file = audio_processor.save_audio(
-                    audio, 
-                    22050,
-                    engine_name,
-                    voice_pack
-                )
-                
-                self.log_message(f"✅ 语音合成完成！文件已保存: {os.path.basename(actual_file)}")
-                self.statusBar().showMessage(f"✅ 合成完成！文件: {os.path.basename(actual_file)}")
-                
-            except Exception as save_error:
-                logger.error(f"保存音频文件失败: {save_error}")
-                self.log_message("✅ 语音合成完成")
-                self.statusBar().showMessage("✅ 合成完成")
+            # 在后台自动保存音频文件（使用新的文件命名规则）；复用的结果此前已保存过
+            if not from_cache:
+                self._start_save(audio, self._on_auto_saved, self._on_auto_save_failed)
             
         except Exception as e:
             logger.error(f"处理合成结果失败: {e}")
@@ -855,6 +1343,8 @@ class MainWindow(QMainWindow):
     def on_synthesis_failed(self, error_msg):
         """合成失败事件"""
         try:
+            self._synthesizing = False
+            self._streaming = False
             self.log_message(f"语音合成失败: {error_msg}", "error")
             QMessageBox.critical(self, "错误", f"语音合成失败: {error_msg}")
             self.reset_ui()
@@ -863,26 +1353,89 @@ class MainWindow(QMainWindow):
             logger.error(f"处理合成失败事件异常: {e}")
     
     def play_audio(self):
-        """播放音频"""
+        """播放音频（直接从内存输出PCM数据，合成过程中可边合成边播放）"""
         try:
-            if self.current_audio is not None:
-                # 播放音频（使用新的文件命名规则）
-                actual_file = audio_processor.play_audio(
-                    self.current_audio, 
-                    engine_name=self.engine_combo.currentText(),
-                    voice_pack=self.voice_pack_combo.currentData() or self.voice_pack_combo.currentText()
-                )
-                if actual_file:
-                    self.log_message(f"开始播放音频，文件已保存: {os.path.basename(actual_file)}")
-                else:
-                    self.log_message("开始播放音频")
+            if self._synthesizing and self.current_audio_chunks:
+                # 先播放已完成的段落，后续段落合成后继续追加
+                self._stop_playback()
+                for part in self.current_audio_chunks:
+                    self._pcm_queue.append(memoryview(_to_pcm16(part)))
+                self._streaming = True
+            elif self.current_audio is not None:
+                if self._pcm_bytes is None:
+                    self._pcm_bytes = _to_pcm16(self.current_audio)
+                self._stop_playback()
+                self._pcm_queue.append(memoryview(self._pcm_bytes))
             else:
                 QMessageBox.warning(self, "警告", "没有可播放的音频")
+                return
+            
+            self._start_output()
+            self.log_message("开始播放音频")
                 
         except Exception as e:
             logger.error(f"播放音频失败: {e}")
             self.log_message(f"播放音频失败: {e}", "error")
     
+    def _start_output(self):
+        """以推送模式打开音频输出设备"""
+        from PyQt5.QtMultimedia import QAudioFormat, QAudioOutput
+        
+        audio_format = QAudioFormat()
+        audio_format.setSampleRate(_PLAYBACK_SAMPLE_RATE)
+        audio_format.setChannelCount(1)
+        audio_format.setSampleSize(16)
+        audio_format.setCodec("audio/pcm")
+        audio_format.setByteOrder(QAudioFormat.LittleEndian)
+        audio_format.setSampleType(QAudioFormat.SignedInt)
+        
+        self._audio_output = QAudioOutput(audio_format, self)
+        self._audio_device = self._audio_output.start()
+        self._feed_audio()
+        self._feed_timer.start()
+    
+    def _feed_audio(self):
+        """按输出设备的空闲缓冲区大小写入排队的PCM数据"""
+        if self._audio_device is None:
+            self._feed_timer.stop()
+            return
+        
+        free = self._audio_output.bytesFree()
+        queue = self._pcm_queue
+        while free > 0 and queue:
+            data = queue[0]
+            written = self._audio_device.write(bytes(data[:free]))
+            if written <= 0:
+                break
+            if written < len(data):
+                queue[0] = data[written:]
+            else:
+                queue.popleft()
+            free -= written
+        
+        if not queue and not self._streaming:
+            self._feed_timer.stop()
+    
+    def _on_chunk_ready(self, part):
+        """单个段落合成完成"""
+        self.current_audio_chunks.append(part)
+        self.play_btn.setEnabled(True)
+        if self._streaming:
+            self._pcm_queue.append(memoryview(_to_pcm16(part)))
+            if not self._feed_timer.isActive():
+                self._feed_timer.start()
+    
+    def _stop_playback(self):
+        """停止当前播放并释放输出设备"""
+        self._feed_timer.stop()
+        self._pcm_queue.clear()
+        self._streaming = False
+        if self._audio_output is not None:
+            self._audio_output.stop()
+            self._audio_output.deleteLater()
+            self._audio_output = None
+        self._audio_device = None
+    
     def save_audio(self):
         """保存音频"""
         try:
@@ -892,9 +1445,10 @@ class MainWindow(QMainWindow):
                 )
                 
                 if file_path:
-                    audio_processor.save_audio(self.current_audio, file_path)
-                    self.log_message(f"音频已保存: {file_path}")
-                    QMessageBox.information(self, "成功", "音频文件保存成功")
+                    self._start_save(
+                        self.current_audio, self._on_manual_saved, self._on_manual_save_failed,
+                        filename=file_path
+                    )
             else:
                 QMessageBox.warning(self, "警告", "没有可保存的音频")
                 
@@ -902,6 +1456,40 @@ class MainWindow(QMainWindow):
             logger.error(f"保存音频失败: {e}")
             self.log_message(f"保存音频失败: {e}", "error")
     
+    def _start_save(self, audio, on_saved, on_failed, filename=None):
+        """提交后台保存任务"""
+        task = SaveTask(
+            self.audio_processor, audio, 22050, self._engine_name, self._voice_id, filename
+        )
+        task.signals.saved.connect(on_saved)
+        task.signals.failed.connect(on_failed)
+        task.signals.saved.connect(lambda _: self._save_tasks.discard(task))
+        task.signals.failed.connect(lambda _: self._save_tasks.discard(task))
+        self._save_tasks.add(task)
+        QThreadPool.globalInstance().start(task)
+    
+    def _on_auto_saved(self, actual_file):
+        """自动保存完成"""
+        name = os.path.basename(actual_file)
+        self.log_message(f"✅ 语音合成完成！文件已保存: {name}")
+        self.statusBar().showMessage(f"✅ 合成完成！文件: {name}")
+    
+    def _on_auto_save_failed(self, error_msg):
+        """自动保存失败"""
+        logger.error(f"保存音频文件失败: {error_msg}")
+        self.log_message("✅ 语音合成完成")
+        self.statusBar().showMessage("✅ 合成完成")
+    
+    def _on_manual_saved(self, file_path):
+        """手动保存完成"""
+        self.log_message(f"音频已保存: {file_path}")
+        QMessageBox.information(self, "成功", "音频文件保存成功")
+    
+    def _on_manual_save_failed(self, error_msg):
+        """手动保存失败"""
+        logger.error(f"保存音频失败: {error_msg}")
+        self.log_message(f"保存音频失败: {error_msg}", "error")
+    
     def reset_ui(self):
         """重置UI状态"""
         self.synthesize_btn.setEnabled(True)
@@ -910,45 +1498,66 @@ class MainWindow(QMainWindow):
     def log_message(self, message, level="info"):
         """记录日志消息"""
         try:
-            timestamp = QTimer().remainingTime()  # 简单的时间戳
+            ts = time.strftime('%H:%M:%S')
             level_text = {"info": "信息", "error": "错误", "warning": "警告"}.get(level, "信息")
             
-            log_text = f"[{level_text}] {message}"
-            self.log_text.append(log_text)
+            log_text = f"{ts} [{level_text}] {message}"
+            self._log_buf.append(log_text)
+            if not self._log_timer.isActive():
+                self._log_timer.start()
+            
+        except Exception as e:
+            logger.error(f"记录日志消息失败: {e}")
+    
+    def _flush_log(self):
+        """将缓冲的日志消息一次性写入日志框"""
+        try:
+            if not self._log_buf:
+                return
+            
+            text = "\n".join(self._log_buf)
+            self._log_buf.clear()
+            self.log_text.appendPlainText(text)
             
             # 滚动到底部
-            scrollbar = self.log_text.verticalScrollBar()
-            scrollbar.setValue(scrollbar.maximum())
+            self.log_text.moveCursor(QTextCursor.End)
             
         except Exception as e:
-            logger.error(f"记录日志消息失败: {e}")
+            logger.error(f"刷新日志失败: {e}")
     
     def closeEvent(self, event):
         """窗口关闭事件"""
         try:
-            # 停止合成线程
-            if self.synthesis_thread and self.synthesis_thread.isRunning():
-                self.synthesis_thread.terminate()
-                self.synthesis_thread.wait()
+            # 取消尚未开始的合成任务
+            self._pool.clear()
             
             # 停止音频播放
-            audio_processor.stop_audio()
+            self._stop_playback()
+            self.audio_processor.stop_audio()
             
             event.accept()
             
         except Exception as e:
             logger.error(f"关闭窗口异常: {e}")
     
+    def invalidate_voice_cache(self):
+        """清除引擎语音列表和引擎信息缓存"""
+        self._engine_voice_cache.clear()
+        self._engine_info_cache.clear()
+        get_engine_voice_manager().invalidate()
+    
     def load_available_engines(self):
         """动态加载可用的TTS引擎"""
         try:
+            self.invalidate_voice_cache()
+            
             # 获取实际可用的引擎列表
-            available_engines = engine_voice_manager.get_available_engines()
+            available_engines = get_engine_voice_manager().get_available_engines()
             self.engine_combo.clear()
             self.engine_combo.addItems(available_engines)
             
             # 设置当前引擎
-            current_engine = tts_engine.get_current_engine()
+            current_engine = self.tts_engine.get_current_engine()
             if current_engine:
                 index = self.engine_combo.findText(current_engine)
                 if index >= 0:
@@ -962,19 +1571,20 @@ class MainWindow(QMainWindow):
     def update_voice_packs_new(self):
         """更新语音包列表 - 根据当前引擎显示对应的语音包"""
         try:
-            self.voice_pack_combo.clear()
-            
             # 获取当前引擎
-            current_engine = self.engine_combo.currentText()
+            current_engine = self._engine_name
             if not current_engine:
+                self.voice_pack_combo.clear()
                 return
             
-            # 使用引擎语音管理器获取对应的语音包
-            voices = engine_voice_manager.get_voices_for_engine(current_engine)
+            # 使用引擎语音管理器获取对应的语音包（按引擎缓存）
+            voices = self._engine_voice_cache.get(current_engine)
+            if voices is None:
+                voices = get_engine_voice_manager().get_voices_for_engine(current_engine)
+                self._engine_voice_cache[current_engine] = voices
             
             # 添加语音包到下拉菜单
-            for display_name, voice_id in voices:
-                self.voice_pack_combo.addItem(display_name, voice_id)
+            self._fill_voice_pack_combo(voices)
             
             # 设置默认选择
             if self.voice_pack_combo.count() > 0:
@@ -985,28 +1595,28 @@ class MainWindow(QMainWindow):
         except Exception as e:
             logger.error(f"更新语音包列表失败: {e}")
             # 添加基本的语音包作为备用
-            basic_voices = [("默认语音", "default"), ("女声", "female"), ("男声", "male")]
-            for display_name, voice_id in basic_voices:
-                self.voice_pack_combo.addItem(display_name, voice_id)
+            self._fill_voice_pack_combo([("默认语音", "default"), ("女声", "female"), ("男声", "male")])
 
     def update_engine_info_new(self):
         """更新引擎信息显示"""
         try:
-            current_engine = self.engine_combo.currentText()
+            current_engine = self._engine_name
             if current_engine:
-                engine_info = engine_voice_manager.get_engine_info(current_engine)
+                engine_info = self._engine_info_cache.get(current_engine)
+                if engine_info is None:
+                    engine_info = get_engine_voice_manager().get_engine_info(current_engine)
+                    self._engine_info_cache[current_engine] = engine_info
                 name = engine_info.get('name', 'Unknown')
                 desc = engine_info.get('description', 'Unknown')
                 features = ', '.join(engine_info.get('features', []))
                 voice_count = engine_info.get('voice_count', 'Unknown')
                 
-                info_text = f"引擎: {name}\
-"
-                info_text += f"描述: {desc}\
-"
-                info_text += f"特性: {features}\
-"
-                info_text += f"语音数量: {voice_count}"
+                info_text = (
+                    f"引擎: {name}\n"
+                    f"描述: {desc}\n"
+                    f"特性: {features}\n"
+                    f"语音数量: {voice_count}"
+                )
                 
                 self.engine_info_label.setText(info_text)
                 
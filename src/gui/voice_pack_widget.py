@@ -5,9 +5,18 @@
 from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QListWidget, 
                              QListWidgetItem, QLabel, QPushButton, QGroupBox,
                              QTextEdit, QSplitter)
-from PyQt5.QtCore import Qt, pyqtSignal
+from PyQt5.QtCore import Qt, pyqtSignal, QSignalBlocker
 from PyQt5.QtGui import QFont
 
+# 详情中固定显示的字段：(标签, 键名, 缺省值)
+_DETAIL_FIELDS = (
+    ("描述", 'description', '无描述'),
+    ("性别", 'gender', '未知'),
+    ("语言", 'language', '未知'),
+    ("风格", 'style', '标准'),
+    ("情感", 'emotion', '中性'),
+)
+
 
 class VoicePackWidget(QWidget):
     """语音包选择组件"""
@@ -17,6 +26,7 @@ class VoicePackWidget(QWidget):
     def __init__(self):
         super().__init__()
         self.voice_packs = {}
+        self._details_html = {}  # 语音包名称 -> 详情HTML
         self.init_ui()
     
     def init_ui(self):
@@ -82,6 +92,7 @@ class VoicePackWidget(QWidget):
         """设置语音包数据"""
         try:
             self.voice_packs = voice_packs
+            self._build_details_cache()
             self.refresh_voice_pack_list()
             
         except Exception as e:
@@ -90,7 +101,8 @@ class VoicePackWidget(QWidget):
     def refresh_voice_pack_list(self):
         """刷新语音包列表"""
         try:
-            self.voice_pack_list.clear()
+            items = []
+            bold_font = None
             
             for pack_name, pack_info in self.voice_packs.items():
                 item = QListWidgetItem(pack_name)
@@ -109,11 +121,24 @@ class VoicePackWidget(QWidget):
                 
                 # 设置样式
                 if pack_info.get('recommended', False):
-                    font = item.font()
-                    font.setBold(True)
-                    item.setFont(font)
+                    if bold_font is None:
+                        bold_font = item.font()
+                        bold_font.setBold(True)
+                    item.setFont(bold_font)
                 
-                self.voice_pack_list.addItem(item)
+                items.append(item)
+            
+            # 重建期间屏蔽信号并暂停重绘，只触发一次视图刷新
+            list_widget = self.voice_pack_list
+            blocker = QSignalBlocker(list_widget)
+            list_widget.setUpdatesEnabled(False)
+            try:
+                list_widget.clear()
+                for item in items:
+                    list_widget.addItem(item)
+            finally:
+                list_widget.setUpdatesEnabled(True)
+                blocker.unblock()
             
         except Exception as e:
             print(f"刷新语音包列表失败: {e}")
@@ -133,45 +158,56 @@ class VoicePackWidget(QWidget):
     def show_voice_pack_details(self, pack_name):
         """显示语音包详情"""
         try:
-            if pack_name not in self.voice_packs:
+            details_html = self._details_html.get(pack_name)
+            if details_html is None:
                 return
             
-            pack_info = self.voice_packs[pack_name]
-            
-            details_html = f"""
-            <h3>{pack_info.get('display_name', pack_name)}</h3>
-            <p><b>内部名称:</b> {pack_name}</p>
-            <p><b>描述:</b> {pack_info.get('description', '无描述')}</p>
-            <p><b>性别:</b> {pack_info.get('gender', '未知')}</p>
-            <p><b>语言:</b> {pack_info.get('language', '未知')}</p>
-            <p><b>风格:</b> {pack_info.get('style', '标准')}</p>
-            <p><b>情感:</b> {pack_info.get('emotion', '中性')}</p>
-            """
-            
-            # 支持的引擎
-            supported_engines = pack_info.get('supported_engines', {})
-            if supported_engines:
-                details_html += "<p><b>支持的引擎:</b></p><ul>"
-                for engine, supported in supported_engines.items():
-                    status = "✓" if supported else "✗"
-                    details_html += f"<li>{status} {engine}</li>"
-                details_html += "</ul>"
-            
-            # 额外信息
-            if 'sample_rate' in pack_info:
-                details_html += f"<p><b>采样率:</b> {pack_info['sample_rate']}Hz</p>"
-            
-            if 'quality' in pack_info:
-                details_html += f"<p><b>质量:</b> {pack_info['quality']}</p>"
-            
-            if pack_info.get('recommended', False):
-                details_html += "<p><b>🌟 推荐语音包</b></p>"
-            
             self.details_text.setHtml(details_html)
             
         except Exception as e:
             print(f"显示语音包详情失败: {e}")
     
+    def _build_details_cache(self):
+        """预先生成所有语音包的详情HTML"""
+        self._details_html = {
+            pack_name: self._build_pack_html(pack_name, pack_info)
+            for pack_name, pack_info in self.voice_packs.items()
+        }
+    
+    @staticmethod
+    def _build_pack_html(pack_name, pack_info):
+        """生成语音包详情HTML"""
+        parts = [f"""
+        <h3>{pack_info.get('display_name', pack_name)}</h3>
+        <p><b>内部名称:</b> {pack_name}</p>
+        """]
+        parts.extend(
+            f"<p><b>{label}:</b> {pack_info.get(key, default)}</p>"
+            for label, key, default in _DETAIL_FIELDS
+        )
+        
+        # 支持的引擎
+        supported_engines = pack_info.get('supported_engines', {})
+        if supported_engines:
+            parts.append("<p><b>支持的引擎:</b></p><ul>")
+            parts.extend(
+                f"<li>{'✓' if supported else '✗'} {engine}</li>"
+                for engine, supported in supported_engines.items()
+            )
+            parts.append("</ul>")
+        
+        # 额外信息
+        if 'sample_rate' in pack_info:
+            parts.append(f"<p><b>采样率:</b> {pack_info['sample_rate']}Hz</p>")
+        
+        if 'quality' in pack_info:
+            parts.append(f"<p><b>质量:</b> {pack_info['quality']}</p>")
+        
+        if pack_info.get('recommended', False):
+            parts.append("<p><b>🌟 推荐语音包</b></p>")
+        
+        return ''.join(parts)
+    
     def preview_voice_pack(self):
         """预览语音包"""
         try:
@@ -188,6 +224,7 @@ class VoicePackWidget(QWidget):
         """刷新语音包"""
         try:
             # 这里可以添加重新加载语音包的逻辑
+            self._build_details_cache()
             self.refresh_voice_pack_list()
             
         except Exception as e:
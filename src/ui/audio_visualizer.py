@@ -5,9 +5,90 @@
 
 import numpy as np
 from PyQt5.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QLabel, QComboBox
-from PyQt5.QtCore import Qt, pyqtSignal
+from PyQt5.QtCore import Qt, pyqtSignal, QObject, QRunnable, QThreadPool, QTimer
 import pyqtgraph as pg
 
+# 波形图最少保留的绘制点数
+_MIN_WAVEFORM_POINTS = 2000
+
+# 显示刷新合并间隔（毫秒）
+_UPDATE_DEBOUNCE_MS = 50
+
+# 频谱图显示的动态范围（dB）
+_SPECTROGRAM_DB_RANGE = 80.0
+
+# 频谱图颜色查找表（首次使用时生成）
+_spectrogram_lut = None
+
+
+def _get_spectrogram_lut():
+    """获取频谱图颜色查找表"""
+    global _spectrogram_lut
+    if _spectrogram_lut is None:
+        _spectrogram_lut = pg.colormap.get('viridis').getLookupTable(nPts=256)
+    return _spectrogram_lut
+
+
+def _compute_spectrogram(audio_data, sample_rate, window, hop_size, freq_axis):
+    """
+    计算频谱图
+    
+    Returns:
+        (uint8量化的dB幅度矩阵[频率, 帧], 时间轴, 频率轴)
+    """
+    # 计算STFT：分帧视图加窗后一次性做rfft
+    frames = np.lib.stride_tricks.sliding_window_view(audio_data, len(window))[::hop_size]
+    spectrum = np.fft.rfft(frames * window, axis=1)
+    
+    # 幅度直接写入预分配的连续float32矩阵（行为频率、列为帧），
+    # 按行优先顺序显示时绘制阶段无需再转置拷贝
+    stft_array = np.empty((spectrum.shape[1], spectrum.shape[0]), dtype=np.float32)
+    np.abs(spectrum.T, out=stft_array)
+    
+    # 相对最大值转换为dB并量化到0-255，绘制时直接按查找表上色
+    peak = stft_array.max()
+    if peak > 0:
+        stft_array /= peak
+    stft_array += 1e-9
+    np.log10(stft_array, out=stft_array)
+    stft_array *= 20.0
+    stft_array += _SPECTROGRAM_DB_RANGE
+    np.clip(stft_array, 0.0, _SPECTROGRAM_DB_RANGE, out=stft_array)
+    stft_array *= 255.0 / _SPECTROGRAM_DB_RANGE
+    stft_array = stft_array.astype(np.uint8)
+    
+    # 创建时间轴
+    time_axis = np.arange(len(frames)) * hop_size / sample_rate
+    return stft_array, time_axis, freq_axis
+
+
+class SpectrogramSignals(QObject):
+    """频谱图计算任务信号"""
+    finished = pyqtSignal(int, object)  # (代数, 计算结果)
+
+
+class SpectrogramJob(QRunnable):
+    """频谱图计算任务（在线程池中执行）"""
+    
+    def __init__(self, generation, audio_data, sample_rate, window, hop_size, freq_axis):
+        super().__init__()
+        self.signals = SpectrogramSignals()
+        self.generation = generation
+        self.audio_data = audio_data
+        self.sample_rate = sample_rate
+        self.window = window
+        self.hop_size = hop_size
+        self.freq_axis = freq_axis
+    
+    def run(self):
+        try:
+            result = _compute_spectrogram(
+                self.audio_data, self.sample_rate, self.window, self.hop_size, self.freq_axis
+            )
+        except Exception:
+            result = ()
+        self.signals.finished.emit(self.generation, result)
+
 
 class AudioVisualizer(QWidget):
     """音频可视化组件"""
@@ -16,6 +97,18 @@ class AudioVisualizer(QWidget):
         super().__init__()
         self.audio_data = None
         self.sample_rate = 22050
+        self._window_cache = {}
+        self._freq_cache = {}
+        self._spec_cache = None
+        self._sgram_cache = None
+        self._sgram_job = None
+        self._gen = 0
+        
+        # 合并短时间内的多次刷新请求
+        self._update_timer = QTimer(self)
+        self._update_timer.setSingleShot(True)
+        self._update_timer.timeout.connect(self._do_update_display)
+        
         self.init_ui()
     
     def init_ui(self):
@@ -47,11 +140,20 @@ class AudioVisualizer(QWidget):
     
     def set_audio(self, audio_data: np.ndarray, sample_rate: int):
         """设置音频数据"""
-        self.audio_data = audio_data
+        # 统一为连续的float32，FFT路径的内存带宽减半
+        self.audio_data = np.ascontiguousarray(audio_data, dtype=np.float32)
         self.sample_rate = sample_rate
+        self._spec_cache = None
+        self._sgram_cache = None
+        self._sgram_job = None
+        self._gen += 1
         self.update_display()
     
     def update_display(self):
+        """请求更新显示"""
+        self._update_timer.start(_UPDATE_DEBOUNCE_MS)
+    
+    def _do_update_display(self):
         """更新显示"""
         if self.audio_data is None:
             return
@@ -69,11 +171,23 @@ class AudioVisualizer(QWidget):
         """显示波形"""
         self.plot_widget.clear()
         
-        # 创建时间轴
-        time_axis = np.arange(len(self.audio_data)) / self.sample_rate
+        audio = self.audio_data
+        target = max(_MIN_WAVEFORM_POINTS, self.plot_widget.width() * 2)
+        
+        if len(audio) > target:
+            # 按分段取最小值/最大值降采样，保留可见包络
+            step = len(audio) // target
+            blocks = audio[:target * step].reshape(target, step)
+            audio = np.empty(target * 2, dtype=blocks.dtype)
+            audio[0::2] = blocks.min(axis=1)
+            audio[1::2] = blocks.max(axis=1)
+            time_axis = np.repeat(np.arange(target) * (step / self.sample_rate), 2)
+        else:
+            # 创建时间轴
+            time_axis = np.arange(len(audio)) / self.sample_rate
         
         # 绘制波形
-        self.plot_widget.plot(time_axis, self.audio_data, pen=pg.mkPen('b', width=1))
+        self.plot_widget.plot(time_axis, audio, pen=pg.mkPen('b', width=1))
         self.plot_widget.setLabel('bottom', '时间 (秒)')
         self.plot_widget.setLabel('left', '幅度')
         self.plot_widget.setTitle('音频波形')
@@ -82,16 +196,14 @@ class AudioVisualizer(QWidget):
         """显示频谱"""
         self.plot_widget.clear()
         
-        # 计算FFT
-        fft_data = np.fft.fft(self.audio_data)
-        magnitude = np.abs(fft_data)
-        
-        # 只显示正频率部分
-        half_length = len(magnitude) // 2
-        magnitude = magnitude[:half_length]
-        
-        # 创建频率轴
-        freq_axis = np.linspace(0, self.sample_rate / 2, half_length)
+        if self._spec_cache is None:
+            # 计算FFT（rfft只返回正频率部分）
+            magnitude = np.abs(np.fft.rfft(self.audio_data))
+            
+            # 创建频率轴
+            freq_axis = np.fft.rfftfreq(len(self.audio_data), 1.0 / self.sample_rate)
+            self._spec_cache = (freq_axis, magnitude)
+        freq_axis, magnitude = self._spec_cache
         
         # 绘制频谱
         self.plot_widget.plot(freq_axis, magnitude, pen=pg.mkPen('r', width=1))
@@ -103,32 +215,22 @@ class AudioVisualizer(QWidget):
         """显示频谱图"""
         self.plot_widget.clear()
         
-        # 计算频谱图
-        # 使用较小的窗口大小以提高性能
-        window_size = min(1024, len(self.audio_data) // 10)
-        hop_size = window_size // 4
-        
-        # 计算STFT
-        stft_data = []
-        for i in range(0, len(self.audio_data) - window_size, hop_size):
-            window = self.audio_data[i:i + window_size]
-            fft = np.fft.fft(window)
-            magnitude = np.abs(fft[:window_size // 2])
-            stft_data.append(magnitude)
+        if self._sgram_cache is None:
+            # 在后台线程计算，完成后再回到此处绘制
+            self._request_spectrogram()
+            return
         
-        if stft_data:
-            stft_array = np.array(stft_data).T
-            
-            # 创建时间和频率轴
-            time_axis = np.arange(len(stft_data)) * hop_size / self.sample_rate
-            freq_axis = np.linspace(0, self.sample_rate / 2, window_size // 2)
+        if self._sgram_cache:
+            stft_array, time_axis, freq_axis = self._sgram_cache
             
             # 创建图像项
-            img = pg.ImageItem()
+            img = pg.ImageItem(axisOrder='row-major')
             self.plot_widget.addItem(img)
             
             # 设置图像数据
-            img.setImage(stft_array)
+            img.setImage(
+                stft_array, autoLevels=False, levels=(0, 255), lut=_get_spectrogram_lut()
+            )
             
             # 设置坐标轴
             img.setTransform(pg.Transform3D().scale(
@@ -140,7 +242,59 @@ class AudioVisualizer(QWidget):
             self.plot_widget.setLabel('left', '频率 (Hz)')
             self.plot_widget.setTitle('音频频谱图')
     
+    def _request_spectrogram(self):
+        """提交频谱图计算任务"""
+        # 使用较小的窗口大小以提高性能
+        window_size = min(1024, len(self.audio_data) // 10)
+        hop_size = window_size // 4
+        
+        if hop_size < 1:
+            self._sgram_cache = ()
+            return
+        
+        self.plot_widget.setTitle('音频频谱图（计算中...）')
+        if self._sgram_job is not None:
+            return
+        
+        job = SpectrogramJob(
+            self._gen, self.audio_data, self.sample_rate,
+            self._get_window(window_size), hop_size, self._get_freq_axis(window_size)
+        )
+        job.signals.finished.connect(self._on_spectrogram_ready)
+        self._sgram_job = job
+        QThreadPool.globalInstance().start(job)
+    
+    def _on_spectrogram_ready(self, generation, result):
+        """频谱图计算完成"""
+        # 音频已更换，丢弃过期结果
+        if generation != self._gen:
+            return
+        
+        self._sgram_job = None
+        self._sgram_cache = result
+        if self.display_mode_combo.currentText() == "频谱图":
+            self.show_spectrogram()
+    
+    def _get_freq_axis(self, n: int) -> np.ndarray:
+        """获取缓存的rfft频率轴"""
+        key = (n, self.sample_rate)
+        freq_axis = self._freq_cache.get(key)
+        if freq_axis is None:
+            freq_axis = self._freq_cache[key] = np.fft.rfftfreq(n, 1.0 / self.sample_rate)
+        return freq_axis
+    
+    def _get_window(self, window_size: int) -> np.ndarray:
+        """获取缓存的汉宁窗"""
+        window = self._window_cache.get(window_size)
+        if window is None:
+            window = self._window_cache[window_size] = np.hanning(window_size).astype(np.float32)
+        return window
+    
     def clear(self):
         """清空显示"""
         self.plot_widget.clear()
-        self.audio_data = None 
\ No newline at end of file
+        self.audio_data = None
+        self._spec_cache = None
+        self._sgram_cache = None
+        self._sgram_job = None
+        self._gen += 1 
\ No newline at end of file
@@ -5,71 +5,475 @@
 
 import os
 import csv
-from typing import List, Dict
+import hashlib
+import multiprocessing
+import queue
+import threading
+import time
+from array import array
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
+from dataclasses import dataclass, field
+from typing import List, Iterable, Tuple
+import numpy as np
 from PyQt5.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QGridLayout,
     QTextEdit, QComboBox, QSlider, QLabel, QPushButton, QGroupBox,
-    QFileDialog, QProgressBar, QMessageBox, QTableWidget, QTableWidgetItem,
-    QHeaderView, QSpinBox, QLineEdit
+    QFileDialog, QProgressBar, QMessageBox, QTableView,
+    QHeaderView, QSpinBox, QLineEdit, QCheckBox
+)
+from PyQt5.QtCore import (
+    Qt, QThread, pyqtSignal, QRunnable, QThreadPool, QAbstractTableModel, QModelIndex
 )
-from PyQt5.QtCore import Qt, QThread, pyqtSignal
 from PyQt5.QtGui import QFont
 
 from src.core.tts_engine import tts_engine
 from src.audio.audio_processor import audio_processor
 from src.utils.logger import get_logger
 
+logger = get_logger(__name__)
+
+# 保存音频时使用的采样率
+_SAMPLE_RATE = 22050
+
+# 参数相同的任务每次最多合并提交的文本数
+_BATCH_SIZE = 16
+
+# 完成状态合并发送的条数和时间间隔（秒）
+_FLUSH_ITEMS = 32
+_FLUSH_INTERVAL = 0.1
+
+# 滑块整数值到语速/音量倍数的查找表（与滑块范围一致）
+_SPEED_MIN = 50
+_ENERGY_MIN = 10
+_SPEED_LUT = [i / 100.0 for i in range(_SPEED_MIN, 201)]
+_ENERGY_LUT = [i / 100.0 for i in range(_ENERGY_MIN, 201)]
+
+# 多进程模式下工作进程数上限（每个进程都会完整加载一份引擎模型）
+_MAX_PROCESS_WORKERS = 2
+
+# 音频缓冲区池：最小尺寸级别（采样点数）和每个级别最多保留的缓冲区数
+_MIN_BUFFER_SAMPLES = 1 << 14
+_MAX_BUFFERS_PER_CLASS = 8
+
+
+class WaveBufferPool:
+    """
+    音频缓冲区池
+    
+    按2的幂次划分尺寸级别复用float32缓冲区，减少批量保存时反复分配大块内存。
+    """
+    
+    def __init__(self, max_per_class: int = _MAX_BUFFERS_PER_CLASS):
+        self._free = defaultdict(list)
+        self._max_per_class = max_per_class
+        self._lock = threading.Lock()
+    
+    @staticmethod
+    def _size_class(n_samples: int) -> int:
+        return max(_MIN_BUFFER_SAMPLES, 1 << max(n_samples - 1, 0).bit_length())
+    
+    def acquire(self, n_samples: int) -> np.ndarray:
+        """获取至少能容纳n_samples个采样点的缓冲区"""
+        size = self._size_class(n_samples)
+        with self._lock:
+            free = self._free[size]
+            if free:
+                return free.pop()
+        return np.empty(size, dtype=np.float32)
+    
+    def release(self, buf: np.ndarray):
+        """归还缓冲区"""
+        with self._lock:
+            free = self._free[len(buf)]
+            if len(free) < self._max_per_class:
+                free.append(buf)
+
+
+# 全局缓冲区池实例
+wave_buffer_pool = WaveBufferPool()
+
+
+# 多进程模式下工作进程内使用的引擎（由 _worker_init 初始化）
+_worker_engine = None
+
+
+def _worker_init(engine_name: str):
+    """工作进程初始化：每个进程只加载一次模型"""
+    global _worker_engine
+    from src.core.tts_engine import tts_engine as engine
+    engine.load_model()
+    if engine_name:
+        engine.set_current_engine(engine_name)
+    _worker_engine = engine
+
+
+def _worker_synth(texts: List[str], voice_pack: str, speed: float, pitch: int, energy: float):
+    """在工作进程中合成一个子批次"""
+    return _worker_engine.synthesize_batch(
+        texts, voice_pack=voice_pack, speed=speed, pitch=pitch, energy=energy
+    )
+
+
+@dataclass
+class TaskStore:
+    """批量任务列表（按列存储：文本、语音包和各合成参数分别保存在各自的数组中）"""
+    texts: List[str] = field(default_factory=list)
+    voice_packs: List[str] = field(default_factory=list)
+    speeds: array = field(default_factory=lambda: array('d'))
+    pitches: array = field(default_factory=lambda: array('h'))
+    energies: array = field(default_factory=lambda: array('d'))
+    
+    def __len__(self) -> int:
+        return len(self.texts)
+    
+    def append(self, text: str, voice_pack: str, speed: float, pitch: int, energy: float):
+        """添加一个任务"""
+        self.texts.append(text)
+        self.voice_packs.append(voice_pack)
+        self.speeds.append(speed)
+        self.pitches.append(pitch)
+        self.energies.append(energy)
+    
+    def extend(self, rows: Iterable[Tuple[str, str, float, int, float]]):
+        """批量添加任务，每行为 (文本, 语音包, 语速, 音调, 音量)"""
+        for row in rows:
+            self.append(*row)
+    
+    def clear(self):
+        """清空所有任务"""
+        del self.texts[:]
+        del self.voice_packs[:]
+        del self.speeds[:]
+        del self.pitches[:]
+        del self.energies[:]
+    
+    def copy(self) -> 'TaskStore':
+        """复制任务列表（交给处理线程的快照）"""
+        return TaskStore(
+            list(self.texts), list(self.voice_packs),
+            array('d', self.speeds), array('h', self.pitches), array('d', self.energies)
+        )
+
+
+class BatchTaskModel(QAbstractTableModel):
+    """任务列表模型（直接读取 TaskStore，只为可见行生成显示内容）"""
+    
+    HEADERS = ("序号", "文本", "语音包", "状态")
+    STATUS_COLUMN = 3
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.store = TaskStore()
+        self.statuses: List[str] = []
+    
+    def set_store(self, store: TaskStore):
+        """替换任务列表，所有任务状态重置为等待中"""
+        self.beginResetModel()
+        self.store = store
+        self.statuses = ["等待中"] * len(store)
+        self.endResetModel()
+    
+    def set_statuses(self, updates: Iterable[Tuple[int, str]]):
+        """批量更新任务状态，合并为一次 dataChanged 通知"""
+        first = last = None
+        for row, status in updates:
+            self.statuses[row] = status
+            first = row if first is None else min(first, row)
+            last = row if last is None else max(last, row)
+        
+        if first is not None:
+            self.dataChanged.emit(
+                self.index(first, self.STATUS_COLUMN),
+                self.index(last, self.STATUS_COLUMN),
+                [Qt.DisplayRole]
+            )
+    
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.statuses)
+    
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+    
+    def data(self, index, role=Qt.DisplayRole):
+        if role != Qt.DisplayRole or not index.isValid():
+            return None
+        
+        row, column = index.row(), index.column()
+        if column == 0:
+            return str(row + 1)
+        if column == 1:
+            # 文本（截断显示）
+            text = self.store.texts[row]
+            return text[:47] + "..." if len(text) > 50 else text
+        if column == 2:
+            return self.store.voice_packs[row]
+        return self.statuses[row]
+    
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.HEADERS[section]
+        return super().headerData(section, orientation, role)
+
+
+class BatchWorker(QRunnable):
+    """批量合成工作任务（在线程池中执行一个子批次）"""
+    
+    def __init__(self, controller, batch, voice_pack: str, speed: float, pitch: int, energy: float):
+        super().__init__()
+        self.controller = controller
+        self.batch = batch  # [(任务序号, 文本, 输出文件名)]
+        self.voice_pack = voice_pack
+        self.speed = speed
+        self.pitch = pitch
+        self.energy = energy
+    
+    def run(self):
+        # 已请求停止时不再开始新的合成
+        if self.controller._stop:
+            return
+        
+        audios = [None] * len(self.batch)
+        try:
+            # 执行语音合成（请求停止后，子批次中尚未开始的文本会被取消）
+            audios = tts_engine.synthesize_batch(
+                [text for _, text, _ in self.batch],
+                voice_pack=self.voice_pack,
+                speed=self.speed,
+                pitch=self.pitch,
+                energy=self.energy,
+                should_stop=self.controller.is_stop_requested
+            )
+        except Exception as e:
+            logger.error(f"批量合成子任务失败: {e}")
+        
+        for (i, _, filename), audio in zip(self.batch, audios):
+            self.controller._save_item(i, filename, self.voice_pack, audio)
+
 
 class BatchSynthesisThread(QThread):
-    """批量合成线程"""
+    """
+    批量合成控制线程
+    
+    将任务分批提交到线程池并行处理（引擎内部按引擎串行调用，无需额外加锁），
+    合成结果交给写盘线程保存，下一批合成无需等待磁盘写入；
+    工作任务通过结果队列回报，由本线程统一发出界面信号。
+    
+    多进程模式下改为提交到进程池，文本预处理等Python代码不受GIL限制；
+    GPU设备上只启动一个工作进程。
+    """
     progress_updated = pyqtSignal(int, int)  # current, total
-    item_completed = pyqtSignal(int, str, bool)  # index, filename, success
+    items_completed = pyqtSignal(list)  # [(index, filename, success)]
     batch_completed = pyqtSignal()
     error_occurred = pyqtSignal(str)
     
-    def __init__(self, tasks: List[Dict], output_dir: str):
+    def __init__(self, tasks: TaskStore, output_dir: str, use_processes: bool = False):
         super().__init__()
         self.tasks = tasks
         self.output_dir = output_dir
+        # 输出目录只解析一次为绝对路径前缀，逐个任务拼接文件名即可
+        self._output_dir_b = os.path.join(os.fsencode(os.path.abspath(output_dir)), b'')
+        self.use_processes = use_processes
+        self._procs = None
+        self._results = queue.Queue()
+        self._pool = QThreadPool(self)
+        self._pool.setMaxThreadCount(QThread.idealThreadCount())
+        self._io = ThreadPoolExecutor(max_workers=2)
+        self._stop = False
+    
+    def request_stop(self):
+        """请求停止批量处理（正在合成的一条文本完成后退出，不阻塞调用方）"""
+        self._stop = True
+    
+    def is_stop_requested(self) -> bool:
+        """是否已请求停止"""
+        return self._stop
     
     def run(self):
         try:
             total = len(self.tasks)
             
-            for i, task in enumerate(self.tasks):
-                try:
-                    # 执行语音合成
-                    audio = tts_engine.synthesize(
-                        text=task['text'],
-                        voice_pack=task['voice_pack'],
-                        speed=task['speed'],
-                        pitch=task['pitch'],
-                        energy=task['energy']
-                    )
-                    
-                    if audio is not None:
-                        # 生成文件名
-                        filename = f"batch_{i+1:03d}_{task['voice_pack']}.wav"
-                        filepath = os.path.join(self.output_dir, filename)
-                        
-                        # 保存音频
-                        audio_processor.save_audio(audio, filepath)
-                        
-                        self.item_completed.emit(i, filename, True)
+            # 按合成参数分组，同组任务分批提交（保留原始序号）；
+            # 输出文件已存在的任务直接记为完成，中断后可继续处理
+            tasks = self.tasks
+            groups = defaultdict(list)
+            params = zip(tasks.voice_packs, tasks.speeds, tasks.pitches, tasks.energies)
+            for i, (text, key) in enumerate(zip(tasks.texts, params)):
+                filename = self._output_filename(i, text, *key)
+                if self._is_completed(filename):
+                    self._results.put((i, filename, True))
+                else:
+                    groups[key].append((i, text, filename))
+            
+            if self.use_processes:
+                # 工作进程在初始化时各自加载模型。使用 spawn 启动：fork 会复制
+                # 已有线程持有的锁和引擎请求队列，却不会复制处理队列的工作线程
+                if tts_engine.device == "cuda":
+                    max_workers = 1
+                else:
+                    max_workers = min(_MAX_PROCESS_WORKERS, os.cpu_count() or 1)
+                self._procs = ProcessPoolExecutor(
+                    max_workers=max_workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                    initializer=_worker_init,
+                    initargs=(tts_engine.get_current_engine(),)
+                )
+            else:
+                # 提交前预热用到的语音包，首批结果不再被一次性初始化拖慢
+                for voice_pack in {key[0] for key in groups}:
+                    if self._stop:
+                        break
+                    tts_engine.warmup(voice_pack)
+            
+            for (voice_pack, speed, pitch, energy), items in groups.items():
+                for start in range(0, len(items), _BATCH_SIZE):
+                    batch = items[start:start + _BATCH_SIZE]
+                    if self._procs is not None:
+                        future = self._procs.submit(
+                            _worker_synth, [text for _, text, _ in batch],
+                            voice_pack, speed, pitch, energy
+                        )
+                        future.add_done_callback(partial(self._on_process_batch_done, batch, voice_pack))
                     else:
-                        self.item_completed.emit(i, f"batch_{i+1:03d}", False)
-                    
-                    # 更新进度
-                    self.progress_updated.emit(i + 1, total)
-                    
-                except Exception as e:
-                    self.item_completed.emit(i, f"batch_{i+1:03d}", False)
-                    self.progress_updated.emit(i + 1, total)
+                        self._pool.start(BatchWorker(self, batch, voice_pack, speed, pitch, energy))
             
+            # 汇总工作任务的结果，按条数或时间间隔合并发送，避免大批量时信号刷屏
+            done = 0
+            pending = []
+            last_flush = time.monotonic()
+            while done < total:
+                if self._stop:
+                    # 丢弃尚未开始的子批次；进行中的子批次会取消剩余文本，很快结束
+                    self._pool.clear()
+                    self._pool.waitForDone()
+                    if self._procs is not None:
+                        self._procs.shutdown(wait=True, cancel_futures=True)
+                    self._io.shutdown(wait=True)
+                    done += self._drain(pending)
+                    self._flush(pending, done, total)
+                    return
+                
+                try:
+                    pending.append(self._results.get(timeout=_FLUSH_INTERVAL))
+                    done += 1
+                except queue.Empty:
+                    pass
+                
+                now = time.monotonic()
+                if pending and (len(pending) >= _FLUSH_ITEMS or now - last_flush >= _FLUSH_INTERVAL):
+                    self._flush(pending, done, total)
+                    pending = []
+                    last_flush = now
+            
+            # 所有文件写入完成后才发出完成信号
+            self._io.shutdown(wait=True)
+            self._flush(pending, done, total)
             self.batch_completed.emit()
             
         except Exception as e:
             self.error_occurred.emit(f"批量处理过程中发生错误: {str(e)}")
+        finally:
+            if self._procs is not None:
+                self._procs.shutdown(wait=False, cancel_futures=True)
+            self._io.shutdown(wait=False)
+    
+    def _on_process_batch_done(self, batch, voice_pack: str, future):
+        """进程池中的子批次完成（在进程池的管理线程中调用）"""
+        if future.cancelled():
+            return
+        
+        try:
+            audios = future.result()
+        except Exception as e:
+            logger.error(f"批量合成子任务失败: {e}")
+            audios = [None] * len(batch)
+        
+        for (i, _, filename), audio in zip(batch, audios):
+            self._save_item(i, filename, voice_pack, audio)
+    
+    def _drain(self, pending: list) -> int:
+        """取出结果队列中剩余的结果，返回取出的条数"""
+        count = 0
+        while True:
+            try:
+                pending.append(self._results.get_nowait())
+            except queue.Empty:
+                return count
+            count += 1
+    
+    def _flush(self, pending: list, done: int, total: int):
+        """发送合并后的完成状态和进度"""
+        if pending:
+            self.items_completed.emit(pending)
+            
+            # 更新进度
+            self.progress_updated.emit(done, total)
+    
+    @staticmethod
+    def _output_filename(i: int, text: str, voice_pack: str, speed: float, pitch: int, energy: float) -> str:
+        """生成输出文件名（包含文本和合成参数的短哈希，参数变化后不会误用旧文件）"""
+        params = (text, voice_pack, speed, pitch, energy)
+        hash8 = hashlib.blake2b(repr(params).encode('utf-8'), digest_size=4).hexdigest()
+        return f"batch_{i+1:03d}_{voice_pack}_{hash8}.wav"
+    
+    def _output_path(self, filename: str) -> str:
+        """输出文件的绝对路径"""
+        return os.fsdecode(self._output_dir_b + os.fsencode(filename))
+    
+    def _is_completed(self, filename: str) -> bool:
+        """输出文件已存在且不只是WAV文件头时视为已完成"""
+        try:
+            return os.path.getsize(self._output_path(filename)) > 44
+        except OSError:
+            return False
+    
+    def _save_item(self, i: int, filename: str, voice_pack: str, audio):
+        """提交单个任务的合成结果到写盘线程（在工作线程中调用）"""
+        if audio is None:
+            self._results.put((i, f"batch_{i+1:03d}", False))
+            return
+        
+        self._io.submit(self._write_item, i, filename, voice_pack, audio)
+    
+    def _write_item(self, i: int, filename: str, voice_pack: str, audio):
+        """将单个任务的合成结果写入文件（在写盘线程中调用）"""
+        buf = None
+        part_path = None
+        try:
+            filepath = self._output_path(filename)
+            # 先写入临时文件再改名，中途中断时不会留下最终文件名的残缺文件
+            # （soundfile 按扩展名判断格式，所以临时文件仍以 .wav 结尾）
+            part_path = os.path.splitext(filepath)[0] + ".part.wav"
+            
+            # 在复用的float32缓冲区中完成格式转换和归一化，保存时无需再分配
+            n = len(audio)
+            buf = wave_buffer_pool.acquire(n)
+            wave = buf[:n]
+            np.copyto(wave, audio, casting='unsafe')
+            peak = np.max(np.abs(wave)) if n else 0.0
+            if peak > 1.0:
+                wave /= peak
+            
+            # 保存音频
+            audio_processor.save_audio(
+                wave, _SAMPLE_RATE, tts_engine.get_current_engine(), voice_pack, part_path
+            )
+            os.replace(part_path, filepath)
+            
+            self._results.put((i, filename, True))
+            
+        except Exception as e:
+            logger.error(f"保存批量任务 {i+1} 失败: {e}")
+            if part_path is not None:
+                try:
+                    os.remove(part_path)
+                except OSError:
+                    pass
+            self._results.put((i, f"batch_{i+1:03d}", False))
+        finally:
+            if buf is not None:
+                wave_buffer_pool.release(buf)
 
 
 class BatchProcessor(QWidget):
@@ -79,7 +483,12 @@ class BatchProcessor(QWidget):
         super().__init__()
         self.logger = get_logger(__name__)
         self.batch_thread = None
-        self.tasks = []
+        self.tasks = TaskStore()
+        self._pack_names = []
+        # 参数标签上次显示的文本，文本不变时跳过 setText
+        self._last_speed_text = None
+        self._last_pitch_text = None
+        self._last_energy_text = None
         self.init_ui()
         self.load_config()
     
@@ -123,7 +532,7 @@ class BatchProcessor(QWidget):
         
         param_layout.addWidget(QLabel("语速:"), 1, 0)
         self.speed_slider = QSlider(Qt.Horizontal)
-        self.speed_slider.setRange(50, 200)
+        self.speed_slider.setRange(_SPEED_MIN, 200)
         self.speed_slider.setValue(100)
         param_layout.addWidget(self.speed_slider, 1, 1)
         
@@ -141,7 +550,7 @@ class BatchProcessor(QWidget):
         
         param_layout.addWidget(QLabel("音量:"), 3, 0)
         self.energy_slider = QSlider(Qt.Horizontal)
-        self.energy_slider.setRange(10, 200)
+        self.energy_slider.setRange(_ENERGY_MIN, 200)
         self.energy_slider.setValue(100)
         param_layout.addWidget(self.energy_slider, 3, 1)
         
@@ -156,9 +565,9 @@ class BatchProcessor(QWidget):
         task_layout = QVBoxLayout()
         
         # 任务表格
-        self.task_table = QTableWidget()
-        self.task_table.setColumnCount(4)
-        self.task_table.setHorizontalHeaderLabels(["序号", "文本", "语音包", "状态"])
+        self.task_model = BatchTaskModel(self)
+        self.task_table = QTableView()
+        self.task_table.setModel(self.task_model)
         self.task_table.horizontalHeader().setSectionResizeMode(1, QHeaderView.Stretch)
         task_layout.addWidget(self.task_table)
         
@@ -206,6 +615,10 @@ class BatchProcessor(QWidget):
         self.stop_batch_button.setEnabled(False)
         control_layout.addWidget(self.stop_batch_button)
         
+        self.process_mode_check = QCheckBox("多进程合成")
+        self.process_mode_check.setToolTip("在独立进程中运行合成，适合CPU推理的引擎")
+        control_layout.addWidget(self.process_mode_check)
+        
         control_layout.addStretch()
         layout.addLayout(control_layout)
         
@@ -226,34 +639,68 @@ class BatchProcessor(QWidget):
         try:
             # 加载语音包
             available_packs = tts_engine.get_available_voice_packs()
-            self.voice_pack_combo.clear()
             
+            display_names = []
             for pack_name in available_packs:
                 pack_info = tts_engine.get_voice_pack_info(pack_name)
                 if pack_info:
-                    display_name = f"{pack_name} - {pack_info.get('name', 'Unknown')}"
+                    display_names.append(f"{pack_name} - {pack_info.get('name', 'Unknown')}")
                 else:
-                    display_name = pack_name
-                
-                self.voice_pack_combo.addItem(display_name, pack_name)
+                    display_names.append(pack_name)
+            
+            # 一次性添加所有条目，填充期间屏蔽信号
+            combo = self.voice_pack_combo
+            combo.blockSignals(True)
+            try:
+                combo.clear()
+                combo.addItems(display_names)
+                for i, pack_name in enumerate(available_packs):
+                    combo.setItemData(i, pack_name)
+            finally:
+                combo.blockSignals(False)
+            self._pack_names = list(available_packs)
             
         except Exception as e:
             self.logger.error(f"加载配置失败: {e}")
     
+    def _speed(self) -> float:
+        """当前语速倍数"""
+        return _SPEED_LUT[self.speed_slider.value() - _SPEED_MIN]
+    
+    def _energy(self) -> float:
+        """当前音量倍数"""
+        return _ENERGY_LUT[self.energy_slider.value() - _ENERGY_MIN]
+    
     def update_speed_label(self):
         """更新语速标签"""
-        value = self.speed_slider.value() / 100.0
-        self.speed_label.setText(f"{value:.1f}x")
+        text = f"{self._speed():.1f}x"
+        if text != self._last_speed_text:
+            self.speed_label.setText(text)
+            self._last_speed_text = text
     
     def update_pitch_label(self):
         """更新音调标签"""
-        value = self.pitch_slider.value()
-        self.pitch_label.setText(str(value))
+        text = str(self.pitch_slider.value())
+        if text != self._last_pitch_text:
+            self.pitch_label.setText(text)
+            self._last_pitch_text = text
     
     def update_energy_label(self):
         """更新音量标签"""
-        value = self.energy_slider.value() / 100.0
-        self.energy_label.setText(f"{value:.1f}x")
+        text = f"{self._energy():.1f}x"
+        if text != self._last_energy_text:
+            self.energy_label.setText(text)
+            self._last_energy_text = text
+    
+    def _current_params(self) -> Tuple[str, float, int, float]:
+        """读取当前界面上的合成参数 (语音包, 语速, 音调, 音量)"""
+        index = self.voice_pack_combo.currentIndex()
+        return (
+            self._pack_names[index] if 0 <= index < len(self._pack_names) else None,
+            self._speed(),
+            self.pitch_slider.value(),
+            self._energy()
+        )
     
     def import_from_file(self):
         """从文件导入"""
@@ -275,39 +722,47 @@ class BatchProcessor(QWidget):
     
     def import_from_txt(self, file_path: str):
         """从文本文件导入"""
+        # 合成参数在循环外读取一次
+        vp, sp, pt, en = self._current_params()
+        
+        # 逐行读取，不一次性载入整个文件
+        self.tasks = TaskStore()
         with open(file_path, 'r', encoding='utf-8') as f:
-            lines = f.readlines()
-        
-        self.tasks = []
-        for line in lines:
-            line = line.strip()
-            if line:
-                self.tasks.append({
-                    'text': line,
-                    'voice_pack': self.voice_pack_combo.currentData(),
-                    'speed': self.speed_slider.value() / 100.0,
-                    'pitch': self.pitch_slider.value(),
-                    'energy': self.energy_slider.value() / 100.0
-                })
+            self.tasks.extend((line, vp, sp, pt, en) for line in (ln.strip() for ln in f) if line)
         
         self.update_task_table()
     
     def import_from_csv(self, file_path: str):
         """从CSV文件导入"""
-        self.tasks = []
+        self.tasks = TaskStore()
+        default_pack = self._current_params()[0]
         
-        with open(file_path, 'r', encoding='utf-8') as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                task = {
-                    'text': row.get('text', ''),
-                    'voice_pack': row.get('voice_pack', self.voice_pack_combo.currentData()),
-                    'speed': float(row.get('speed', 1.0)),
-                    'pitch': int(row.get('pitch', 0)),
-                    'energy': float(row.get('energy', 1.0))
-                }
-                if task['text']:
-                    self.tasks.append(task)
+        with open(file_path, 'r', encoding='utf-8', newline='') as f:
+            reader = csv.reader(f)
+            header = next(reader, None)
+            
+            # 列位置只从表头解析一次，缺失的列使用默认值
+            columns = {name.strip(): index for index, name in enumerate(header or ())}
+            text_i = columns.get('text')
+            if text_i is not None:
+                pack_i = columns.get('voice_pack')
+                speed_i = columns.get('speed')
+                pitch_i = columns.get('pitch')
+                energy_i = columns.get('energy')
+                
+                def cell(row, index):
+                    return row[index] if index is not None and index < len(row) else ''
+                
+                self.tasks.extend(
+                    (
+                        row[text_i],
+                        cell(row, pack_i) or default_pack,
+                        float(cell(row, speed_i) or 1.0),
+                        int(cell(row, pitch_i) or 0),
+                        float(cell(row, energy_i) or 1.0)
+                    )
+                    for row in reader if text_i < len(row) and row[text_i]
+                )
         
         self.update_task_table()
     
@@ -337,19 +792,12 @@ class BatchProcessor(QWidget):
             QMessageBox.warning(self, "输入错误", "请输入要转换的文本")
             return
         
-        # 分割多行文本
-        lines = text.split('\n')
-        for line in lines:
-            line = line.strip()
-            if line:
-                task = {
-                    'text': line,
-                    'voice_pack': self.voice_pack_combo.currentData(),
-                    'speed': self.speed_slider.value() / 100.0,
-                    'pitch': self.pitch_slider.value(),
-                    'energy': self.energy_slider.value() / 100.0
-                }
-                self.tasks.append(task)
+        # 合成参数在循环外读取一次
+        vp, sp, pt, en = self._current_params()
+        
+        # 分割多行文本，过滤空行
+        lines = [line for line in (ln.strip() for ln in text.splitlines()) if line]
+        self.tasks.extend((line, vp, sp, pt, en) for line in lines)
         
         self.update_task_table()
         self.text_edit.clear()
@@ -361,23 +809,8 @@ class BatchProcessor(QWidget):
     
     def update_task_table(self):
         """更新任务表格"""
-        self.task_table.setRowCount(len(self.tasks))
-        
-        for i, task in enumerate(self.tasks):
-            # 序号
-            self.task_table.setItem(i, 0, QTableWidgetItem(str(i + 1)))
-            
-            # 文本（截断显示）
-            text = task['text']
-            if len(text) > 50:
-                text = text[:47] + "..."
-            self.task_table.setItem(i, 1, QTableWidgetItem(text))
-            
-            # 语音包
-            self.task_table.setItem(i, 2, QTableWidgetItem(task['voice_pack']))
-            
-            # 状态
-            self.task_table.setItem(i, 3, QTableWidgetItem("等待中"))
+        # 模型整体重置一次，表格只为可见行请求数据
+        self.task_model.set_store(self.tasks)
     
     def browse_output_dir(self):
         """浏览输出目录"""
@@ -411,19 +844,26 @@ class BatchProcessor(QWidget):
         self.progress_bar.setValue(0)
         
         # 创建批量处理线程
-        self.batch_thread = BatchSynthesisThread(self.tasks, output_dir)
+        self.batch_thread = BatchSynthesisThread(
+            self.tasks.copy(), output_dir, self.process_mode_check.isChecked()
+        )
         self.batch_thread.progress_updated.connect(self.update_progress)
-        self.batch_thread.item_completed.connect(self.update_task_status)
+        self.batch_thread.items_completed.connect(self.update_tasks_status)
         self.batch_thread.batch_completed.connect(self.batch_completed)
         self.batch_thread.error_occurred.connect(self.batch_error)
+        self.batch_thread.finished.connect(self.batch_thread_finished)
         self.batch_thread.start()
     
     def stop_batch_processing(self):
-        """停止批量处理"""
+        """停止批量处理（只发出停止请求，线程结束后再恢复界面）"""
         if self.batch_thread and self.batch_thread.isRunning():
-            self.batch_thread.terminate()
-            self.batch_thread.wait()
-        
+            self.batch_thread.request_stop()
+            self.stop_batch_button.setEnabled(False)
+        else:
+            self.batch_thread_finished()
+    
+    def batch_thread_finished(self):
+        """批量处理线程结束（完成、出错或已停止）"""
         self.start_batch_button.setEnabled(True)
         self.stop_batch_button.setEnabled(False)
         self.progress_bar.setVisible(False)
@@ -432,12 +872,12 @@ class BatchProcessor(QWidget):
         """更新进度"""
         self.progress_bar.setValue(current)
     
-    def update_task_status(self, index: int, filename: str, success: bool):
-        """更新任务状态"""
-        if success:
-            self.task_table.setItem(index, 3, QTableWidgetItem(f"完成: {filename}"))
-        else:
-            self.task_table.setItem(index, 3, QTableWidgetItem("失败"))
+    def update_tasks_status(self, results: list):
+        """批量更新任务状态"""
+        self.task_model.set_statuses(
+            (index, f"完成: {filename}" if success else "失败")
+            for index, filename, success in results
+        )
     
     def batch_completed(self):
         """批量处理完成"""
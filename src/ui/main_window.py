@@ -3,25 +3,29 @@
 提供完整的图形用户界面
 """
 
-import sys
 import os
-from pathlib import Path
+import time
 from typing import Optional
 from PyQt5.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QGridLayout,
     QTextEdit, QComboBox, QSlider, QLabel, QPushButton, QGroupBox,
     QFileDialog, QProgressBar, QMessageBox, QSplitter, QTabWidget
 )
-from PyQt5.QtCore import Qt, QThread, pyqtSignal
+from PyQt5.QtCore import Qt, QThread, QTimer, pyqtSignal, QSignalBlocker
 from PyQt5.QtGui import QFont
 
-# 添加项目根目录到Python路径
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
-
-from src.core.tts_engine import tts_engine
-from src.audio.audio_processor import audio_processor
 from src.utils.logger import get_logger
-from .audio_visualizer import AudioVisualizer
+
+# 引擎、音频处理和可视化模块依赖较重，在首次使用时再导入
+
+# 合成进度估算：预计耗时 = 基础耗时 + 每字符耗时（毫秒），完成前进度最多显示到95%
+_PROGRESS_BASE_MS = 1000
+_PROGRESS_MS_PER_CHAR = 30
+_PROGRESS_INTERVAL_MS = 100
+_PROGRESS_CAP = 95
+
+# 文本统计的刷新延迟（毫秒），连续输入时只在停顿后统计一次
+_STATS_DEBOUNCE_MS = 100
 
 
 class SynthesisThread(QThread):
@@ -37,14 +41,17 @@ class SynthesisThread(QThread):
         self.speed = speed
         self.pitch = pitch
         self.energy = energy
+        self._cancel = False
+    
+    def cancel(self):
+        """请求取消合成（合成返回后不再回传结果）"""
+        self._cancel = True
+        self.requestInterruption()
     
     def run(self):
+        from src.core.tts_engine import tts_engine
+        
         try:
-            # 模拟进度更新
-            for i in range(101):
-                self.progress_updated.emit(i)
-                self.msleep(50)
-            
             # 执行语音合成
             audio = tts_engine.synthesize(
                 text=self.text,
@@ -54,7 +61,12 @@ class SynthesisThread(QThread):
                 energy=self.energy
             )
             
+            # 已取消时不再回传结果
+            if self._cancel:
+                return
+            
             if audio is not None:
+                self.progress_updated.emit(100)
                 self.synthesis_completed.emit(audio)
             else:
                 self.error_occurred.emit("语音合成失败")
@@ -66,9 +78,12 @@ class SynthesisThread(QThread):
 class AudioPlayer(QWidget):
     """音频播放器组件"""
     
+    _SAVE_FILTER = "WAV文件 (*.wav);;MP3文件 (*.mp3);;所有文件 (*)"
+    
     def __init__(self):
         super().__init__()
         self.current_audio = None
+        self._save_dlg = None
         self.init_ui()
     
     def init_ui(self):
@@ -101,9 +116,8 @@ class AudioPlayer(QWidget):
         self.current_audio = audio
         
         if audio is not None:
-            audio_info = audio_processor.get_audio_info(audio, sample_rate)
-            info_text = f"时长: {audio_info['duration']:.2f}秒\n采样率: {audio_info['sample_rate']}Hz"
-            self.info_label.setText(info_text)
+            duration = len(audio) / float(sample_rate)
+            self.info_label.setText(f"时长: {duration:.2f}秒\n采样率: {sample_rate}Hz")
             self.play_button.setEnabled(True)
             self.save_button.setEnabled(True)
         else:
@@ -114,18 +128,25 @@ class AudioPlayer(QWidget):
     def play_audio(self):
         if self.current_audio is not None:
             try:
+                from src.core.tts_engine import tts_engine
+                from src.audio.audio_processor import audio_processor
                 audio_processor.play_audio(self.current_audio, tts_engine.sample_rate)
             except Exception as e:
                 QMessageBox.warning(self, "播放错误", f"播放音频时发生错误: {str(e)}")
     
     def save_audio(self):
         if self.current_audio is not None:
-            file_path, _ = QFileDialog.getSaveFileName(
-                self, "保存音频文件", "", "WAV文件 (*.wav);;MP3文件 (*.mp3);;所有文件 (*)"
-            )
+            # 保存对话框首次使用时创建，之后重复使用（同时保留上次的目录）
+            if self._save_dlg is None:
+                self._save_dlg = QFileDialog(self, "保存音频文件")
+                self._save_dlg.setAcceptMode(QFileDialog.AcceptSave)
+                self._save_dlg.setNameFilter(self._SAVE_FILTER)
+            
+            file_path = self._save_dlg.selectedFiles()[0] if self._save_dlg.exec_() else ""
             
             if file_path:
                 try:
+                    from src.audio.audio_processor import audio_processor
                     audio_processor.save_audio(self.current_audio, file_path)
                     QMessageBox.information(self, "保存成功", f"音频文件已保存到: {file_path}")
                 except Exception as e:
@@ -139,6 +160,16 @@ class MainWindow(QMainWindow):
         super().__init__()
         self.logger = get_logger(__name__)
         self.synthesis_thread = None
+        # 引擎不报告进度，按文本长度估算合成进度
+        self._progress_timer = QTimer(self)
+        self._progress_timer.setInterval(_PROGRESS_INTERVAL_MS)
+        self._progress_timer.timeout.connect(self._advance_progress)
+        self._progress_started = 0.0
+        self._progress_estimate_ms = _PROGRESS_BASE_MS
+        self._stats_timer = QTimer(self)
+        self._stats_timer.setSingleShot(True)
+        self._stats_timer.setInterval(_STATS_DEBOUNCE_MS)
+        self._stats_timer.timeout.connect(self._do_update_text_stats)
         self.init_ui()
         self.load_config()
     
@@ -256,6 +287,11 @@ class MainWindow(QMainWindow):
         self.energy_label = QLabel("1.0x")
         voice_layout.addWidget(self.energy_label, 3, 2)
         
+        # 预先生成各滑块取值对应的标签文本，拖动时直接按下标取用
+        self._speed_strs = tuple(f"{v / 100:.1f}x" for v in range(50, 201))
+        self._pitch_strs = tuple(str(v) for v in range(-12, 13))
+        self._energy_strs = tuple(f"{v / 100:.1f}x" for v in range(10, 201))
+        
         voice_group.setLayout(voice_layout)
         layout.addWidget(voice_group)
         
@@ -300,29 +336,62 @@ class MainWindow(QMainWindow):
         self.audio_player = AudioPlayer()
         tab_widget.addTab(self.audio_player, "音频播放")
         
-        # 可视化标签页
-        self.audio_visualizer = AudioVisualizer()
-        tab_widget.addTab(self.audio_visualizer, "音频可视化")
+        # 可视化标签页（先放占位页面，首次切换到该页时再创建可视化器）
+        self.audio_visualizer = None
+        self._pending_viz_audio = None
+        tab_widget.addTab(QWidget(), "音频可视化")
+        tab_widget.currentChanged.connect(self._lazy_build_viz)
+        self._tab_widget = tab_widget
         
         layout.addWidget(tab_widget)
         panel.setLayout(layout)
         return panel
     
+    def _lazy_build_viz(self, index: int):
+        """首次切换到可视化标签页时创建可视化器"""
+        if index != 1 or self.audio_visualizer is not None:
+            return
+        
+        from .audio_visualizer import AudioVisualizer
+        self.audio_visualizer = AudioVisualizer()
+        
+        tab_widget = self._tab_widget
+        tab_widget.blockSignals(True)
+        placeholder = tab_widget.widget(1)
+        tab_widget.removeTab(1)
+        tab_widget.insertTab(1, self.audio_visualizer, "音频可视化")
+        tab_widget.setCurrentIndex(1)
+        tab_widget.blockSignals(False)
+        placeholder.deleteLater()
+        
+        # 显示创建前合成的音频
+        if self._pending_viz_audio is not None:
+            self.audio_visualizer.set_audio(*self._pending_viz_audio)
+            self._pending_viz_audio = None
+    
     def load_config(self):
         """加载配置"""
         try:
-            # 加载语音包
-            available_packs = tts_engine.get_available_voice_packs()
-            self.voice_pack_combo.clear()
+            from src.core.tts_engine import tts_engine
             
-            for pack_name in available_packs:
-                pack_info = tts_engine.get_voice_pack_info(pack_name)
-                if pack_info:
-                    display_name = f"{pack_name} - {pack_info.get('name', 'Unknown')}"
-                else:
-                    display_name = pack_name
-                
-                self.voice_pack_combo.addItem(display_name, pack_name)
+            # 加载语音包（一次取出全部语音包信息，不再逐个查询）
+            voice_packs = tts_engine.get_voice_packs()
+            pack_names = list(voice_packs)
+            display_names = [
+                f"{pack_name} - {pack_info.get('name', 'Unknown')}" if pack_info else pack_name
+                for pack_name, pack_info in voice_packs.items()
+            ]
+            
+            # 填充期间屏蔽下拉框信号
+            combo = self.voice_pack_combo
+            blocker = QSignalBlocker(combo)
+            try:
+                combo.clear()
+                combo.addItems(display_names)
+                for i, pack_name in enumerate(pack_names):
+                    combo.setItemData(i, pack_name)
+            finally:
+                blocker.unblock()
             
             self.logger.info("配置加载完成")
             
@@ -331,25 +400,25 @@ class MainWindow(QMainWindow):
             QMessageBox.warning(self, "配置错误", f"加载配置时发生错误: {str(e)}")
     
     def update_text_stats(self):
-        """更新文本统计"""
-        text = self.text_edit.toPlainText()
-        char_count = len(text)
+        """更新文本统计（合并短时间内的多次请求）"""
+        self._stats_timer.start()
+    
+    def _do_update_text_stats(self):
+        """统计字符数（直接读取文档字符数，不复制整段文本）"""
+        char_count = self.text_edit.document().characterCount() - 1
         self.text_stats_label.setText(f"字符数: {char_count}")
     
     def update_speed_label(self):
         """更新语速标签"""
-        value = self.speed_slider.value() / 100.0
-        self.speed_label.setText(f"{value:.1f}x")
+        self.speed_label.setText(self._speed_strs[self.speed_slider.value() - 50])
     
     def update_pitch_label(self):
         """更新音调标签"""
-        value = self.pitch_slider.value()
-        self.pitch_label.setText(str(value))
+        self.pitch_label.setText(self._pitch_strs[self.pitch_slider.value() + 12])
     
     def update_energy_label(self):
         """更新音量标签"""
-        value = self.energy_slider.value() / 100.0
-        self.energy_label.setText(f"{value:.1f}x")
+        self.energy_label.setText(self._energy_strs[self.energy_slider.value() - 10])
     
     def start_synthesis(self):
         """开始语音合成"""
@@ -376,22 +445,39 @@ class MainWindow(QMainWindow):
         self.synthesis_thread.synthesis_completed.connect(self.synthesis_completed)
         self.synthesis_thread.error_occurred.connect(self.synthesis_error)
         self.synthesis_thread.start()
+        
+        self._progress_started = time.monotonic()
+        self._progress_estimate_ms = _PROGRESS_BASE_MS + len(text) * _PROGRESS_MS_PER_CHAR
+        self._progress_timer.start()
+    
+    def _advance_progress(self):
+        """按预计耗时推进进度条（完成前不超过上限）"""
+        elapsed_ms = (time.monotonic() - self._progress_started) * 1000
+        value = int(elapsed_ms / self._progress_estimate_ms * _PROGRESS_CAP)
+        self.progress_bar.setValue(min(value, _PROGRESS_CAP))
     
     def synthesis_completed(self, audio):
         """合成完成"""
+        self._progress_timer.stop()
         self.synthesize_button.setEnabled(True)
         self.progress_bar.setVisible(False)
         
+        from src.core.tts_engine import tts_engine
+        
         # 设置音频到播放器
         self.audio_player.set_audio(audio, tts_engine.sample_rate)
         
-        # 设置音频到可视化器
-        self.audio_visualizer.set_audio(audio, tts_engine.sample_rate)
+        # 设置音频到可视化器（尚未创建时先保存，打开标签页后再显示）
+        if self.audio_visualizer is not None:
+            self.audio_visualizer.set_audio(audio, tts_engine.sample_rate)
+        else:
+            self._pending_viz_audio = (audio, tts_engine.sample_rate)
         
         QMessageBox.information(self, "合成完成", "语音合成已完成！")
     
     def synthesis_error(self, error_msg):
         """合成错误"""
+        self._progress_timer.stop()
         self.synthesize_button.setEnabled(True)
         self.progress_bar.setVisible(False)
         
@@ -404,6 +490,12 @@ class MainWindow(QMainWindow):
     def closeEvent(self, event):
         """关闭事件"""
         if self.synthesis_thread and self.synthesis_thread.isRunning():
-            self.synthesis_thread.terminate()
-            self.synthesis_thread.wait()
+            # 请求线程自行退出，超时后才强制终止
+            self.synthesis_thread.cancel()
+            self.synthesis_thread.quit()
+            from src.audio.audio_processor import audio_processor
+            audio_processor.stop_audio()
+            if not self.synthesis_thread.wait(2000):
+                self.synthesis_thread.terminate()
+                self.synthesis_thread.wait()
         event.accept() 
\ No newline at end of file
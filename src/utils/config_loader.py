@@ -4,12 +4,75 @@
 """
 
 import os
+import copy
 import yaml
-from typing import Dict, Any, Optional
+from functools import lru_cache
+from typing import Dict, Any, Optional, Tuple
 import logging
 
 logger = logging.getLogger(__name__)
 
+# 优先使用 libyaml 提供的C实现
+try:
+    from yaml import CSafeLoader as _Loader, CSafeDumper as _Dumper
+except ImportError:
+    from yaml import SafeLoader as _Loader, SafeDumper as _Dumper
+
+# 配置文件读写缓冲区大小
+_IO_BUFFER_SIZE = 1 << 20
+
+# 配置文件解析结果缓存，按 (路径, 修改时间) 区分，文件未变化时不重复解析
+_PARSE_CACHE: Dict[tuple, Dict[str, Any]] = {}
+
+# 默认配置（只构建一次，使用时返回深拷贝）
+_DEFAULT_CONFIG: Dict[str, Any] = {
+    'model': {
+        'name': 'cosyvoice2.0',
+        'path': 'models/cosyvoice2.0.pth',
+        'device': 'auto',
+        'batch_size': 1,
+        'max_text_length': 500
+    },
+    'audio': {
+        'sample_rate': 22050,
+        'hop_length': 256,
+        'win_length': 1024,
+        'n_fft': 1024,
+        'mel_channels': 80,
+        'mel_fmin': 0,
+        'mel_fmax': 8000
+    },
+    'voice_packs': {
+        'default': {
+            'name': '默认语音包',
+            'description': '标准中文语音包',
+            'speaker_id': 0,
+            'emotion': 'neutral',
+            'speed': 1.0,
+            'pitch': 0,
+            'energy': 1.0
+        }
+    },
+    'output': {
+        'format': 'wav',
+        'quality': 'high',
+        'normalize': True,
+        'trim_silence': True
+    },
+    'logging': {
+        'level': 'INFO',
+        'file': 'logs/tts.log',
+        'max_size': '10MB',
+        'backup_count': 5
+    }
+}
+
+
+@lru_cache(maxsize=256)
+def _split_key(key: str) -> Tuple[str, ...]:
+    """拆分点号分隔的配置键（结果缓存）"""
+    return tuple(key.split('.'))
+
 
 class ConfigLoader:
     """配置加载器类"""
@@ -33,13 +96,22 @@ class ConfigLoader:
             配置字典
         """
         try:
-            if not os.path.exists(self.config_path):
+            try:
+                st = os.stat(self.config_path)
+            except FileNotFoundError:
                 logger.warning(f"配置文件不存在: {self.config_path}")
                 self.config = self._get_default_config()
                 return self.config
             
-            with open(self.config_path, 'r', encoding='utf-8') as f:
-                self.config = yaml.safe_load(f)
+            key = (self.config_path, st.st_mtime_ns)
+            cached = _PARSE_CACHE.get(key)
+            if cached is not None:
+                self.config = copy.deepcopy(cached)
+                return self.config
+            
+            with open(self.config_path, 'r', encoding='utf-8', buffering=_IO_BUFFER_SIZE) as f:
+                self.config = yaml.load(f, Loader=_Loader)
+            _PARSE_CACHE[key] = copy.deepcopy(self.config)
             
             logger.info(f"成功加载配置文件: {self.config_path}")
             return self.config
@@ -60,15 +132,12 @@ class ConfigLoader:
         Returns:
             配置值
         """
-        keys = key.split('.')
         value = self.config
-        
-        try:
-            for k in keys:
-                value = value[k]
-            return value
-        except (KeyError, TypeError):
-            return default
+        for k in _split_key(key):
+            if not isinstance(value, dict) or k not in value:
+                return default
+            value = value[k]
+        return value
     
     def set(self, key: str, value: Any) -> None:
         """
@@ -78,13 +147,11 @@ class ConfigLoader:
             key: 配置键，支持点号分隔的多级键
             value: 配置值
         """
-        keys = key.split('.')
+        keys = _split_key(key)
         config = self.config
         
         for k in keys[:-1]:
-            if k not in config:
-                config[k] = {}
-            config = config[k]
+            config = config.setdefault(k, {})
         
         config[keys[-1]] = value
     
@@ -97,10 +164,14 @@ class ConfigLoader:
         """
         save_path = path or self.config_path
         
+        # 文件内容即将改变，丢弃该路径的解析缓存
+        for key in [k for k in _PARSE_CACHE if k[0] == save_path]:
+            del _PARSE_CACHE[key]
+        
         try:
             os.makedirs(os.path.dirname(save_path), exist_ok=True)
-            with open(save_path, 'w', encoding='utf-8') as f:
-                yaml.dump(self.config, f, default_flow_style=False, allow_unicode=True)
+            with open(save_path, 'w', encoding='utf-8', buffering=_IO_BUFFER_SIZE) as f:
+                yaml.dump(self.config, f, Dumper=_Dumper, default_flow_style=False, allow_unicode=True)
             
             logger.info(f"配置文件已保存: {save_path}")
             
@@ -114,47 +185,7 @@ class ConfigLoader:
         Returns:
             默认配置字典
         """
-        return {
-            'model': {
-                'name': 'cosyvoice2.0',
-                'path': 'models/cosyvoice2.0.pth',
-                'device': 'auto',
-                'batch_size': 1,
-                'max_text_length': 500
-            },
-            'audio': {
-                'sample_rate': 22050,
-                'hop_length': 256,
-                'win_length': 1024,
-                'n_fft': 1024,
-                'mel_channels': 80,
-                'mel_fmin': 0,
-                'mel_fmax': 8000
-            },
-            'voice_packs': {
-                'default': {
-                    'name': '默认语音包',
-                    'description': '标准中文语音包',
-                    'speaker_id': 0,
-                    'emotion': 'neutral',
-                    'speed': 1.0,
-                    'pitch': 0,
-                    'energy': 1.0
-                }
-            },
-            'output': {
-                'format': 'wav',
-                'quality': 'high',
-                'normalize': True,
-                'trim_silence': True
-            },
-            'logging': {
-                'level': 'INFO',
-                'file': 'logs/tts.log',
-                'max_size': '10MB',
-                'backup_count': 5
-            }
-        }
+        return copy.deepcopy(_DEFAULT_CONFIG)
 
 
 # 全局配置实例
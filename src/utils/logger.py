@@ -4,11 +4,123 @@
 """
 
 import os
+import re
+import queue
+import atexit
+import threading
 import logging
 import logging.handlers
-from typing import Optional
+from typing import Dict, Optional
 from .config_loader import config_loader
 
+# 日志文件大小配置的解析规则（如 "10MB"），无法解析时使用默认的10MB
+_SIZE_RE = re.compile(r'^\s*(\d+)\s*(B|KB|MB|GB)\s*$', re.I)
+_SIZE_MULT = {'B': 1, 'KB': 1024, 'MB': 1 << 20, 'GB': 1 << 30}
+_DEFAULT_MAX_BYTES = 10 << 20
+
+# 已配置过的日志记录器名称
+_CONFIGURED = set()
+
+# 日志级别名称到数值的缓存
+_LEVEL_CACHE: Dict[str, int] = {}
+
+# 日志文件写缓冲区大小
+_LOG_BUFFER_SIZE = 1 << 16
+
+# 每个日志文件一个记录队列和后台写入线程：{日志文件: (队列, 监听器)}
+_LISTENERS: Dict[str, tuple] = {}
+_LISTENERS_LOCK = threading.Lock()
+
+
+class BufferedRotatingFileHandler(logging.handlers.RotatingFileHandler):
+    """
+    带写缓冲的轮转文件处理器
+    
+    只有ERROR及以上级别的记录会立即刷新到磁盘，其余记录在缓冲区写满、
+    轮转或关闭时写入，减少频繁日志带来的系统调用。
+    
+    父类判断是否轮转时会 seek 到文件末尾，而 seek 会先刷新缓冲区；
+    这里改为自行累计已写入的字节数来判断。
+    """
+    
+    def __init__(self, *args, **kwargs):
+        self._flush_now = False
+        self._size = 0
+        self._pending = 0
+        super().__init__(*args, **kwargs)
+    
+    def _open(self):
+        stream = open(self.baseFilename, self.mode, buffering=_LOG_BUFFER_SIZE,
+                      encoding=self.encoding, errors=self.errors)
+        self._size = os.path.getsize(self.baseFilename)
+        return stream
+    
+    def shouldRollover(self, record):
+        if self.stream is None:
+            self.stream = self._open()
+        if self.maxBytes <= 0:
+            self._pending = 0
+            return False
+        
+        msg = f"{self.format(record)}{self.terminator}"
+        self._pending = len(msg.encode(self.encoding or 'utf-8', errors=self.errors or 'strict'))
+        return self._size + self._pending >= self.maxBytes
+    
+    def emit(self, record):
+        self._flush_now = record.levelno >= logging.ERROR
+        super().emit(record)
+        self._size += self._pending
+    
+    def flush(self):
+        if self._flush_now:
+            super().flush()
+    
+    def close(self):
+        self._flush_now = True
+        super().close()
+
+
+def _lvl(level: str) -> int:
+    """解析日志级别名称（结果缓存）"""
+    value = _LEVEL_CACHE.get(level)
+    if value is None:
+        value = _LEVEL_CACHE[level] = getattr(logging, level.upper())
+    return value
+
+
+def _get_log_queue(log_file: str, max_bytes: int, backup_count: int,
+                   formatter: logging.Formatter) -> queue.SimpleQueue:
+    """获取日志文件对应的记录队列，首次使用时创建文件处理器并启动后台写入线程"""
+    key = os.path.abspath(log_file)
+    with _LISTENERS_LOCK:
+        entry = _LISTENERS.get(key)
+        if entry is None:
+            # 创建轮转文件处理器
+            file_handler = BufferedRotatingFileHandler(
+                log_file,
+                maxBytes=max_bytes,
+                backupCount=backup_count,
+                encoding='utf-8'
+            )
+            file_handler.setFormatter(formatter)
+            
+            log_queue = queue.SimpleQueue()
+            listener = logging.handlers.QueueListener(log_queue, file_handler, respect_handler_level=True)
+            listener.start()
+            entry = _LISTENERS[key] = (log_queue, listener)
+        return entry[0]
+
+
+@atexit.register
+def _stop_listeners():
+    """退出时写完队列中剩余的日志记录"""
+    with _LISTENERS_LOCK:
+        for _, listener in _LISTENERS.values():
+            listener.stop()
+            for handler in listener.handlers:
+                handler.close()
+        _LISTENERS.clear()
+
 
 def setup_logger(
     name: str = "cosyvoice_tts",
@@ -45,7 +157,8 @@ def setup_logger(
     
     # 创建日志记录器
     logger = logging.getLogger(name)
-    logger.setLevel(getattr(logging, level.upper()))
+    lvl = _lvl(level)
+    logger.setLevel(lvl)
     
     # 清除现有的处理器
     logger.handlers.clear()
@@ -58,7 +171,7 @@ def setup_logger(
     
     # 控制台处理器
     console_handler = logging.StreamHandler()
-    console_handler.setLevel(getattr(logging, level.upper()))
+    console_handler.setLevel(lvl)
     console_handler.setFormatter(formatter)
     logger.addHandler(console_handler)
     
@@ -71,32 +184,19 @@ def setup_logger(
                 os.makedirs(log_dir, exist_ok=True)
             
             # 解析文件大小
-            size_map = {'B': 1, 'KB': 1024, 'MB': 1024**2, 'GB': 1024**3}
-            size_str = max_size.upper()
-            max_bytes = 10 * 1024 * 1024  # 默认10MB
-            for unit, multiplier in size_map.items():
-                if size_str.endswith(unit):
-                    try:
-                        max_bytes = int(size_str[:-len(unit)]) * multiplier
-                        break
-                    except ValueError:
-                        max_bytes = 10 * 1024 * 1024  # 默认10MB
-                        break
+            m = _SIZE_RE.match(str(max_size))
+            max_bytes = int(m.group(1)) * _SIZE_MULT[m.group(2).upper()] if m else _DEFAULT_MAX_BYTES
             
-            # 创建轮转文件处理器
-            file_handler = logging.handlers.RotatingFileHandler(
-                log_file,
-                maxBytes=max_bytes,
-                backupCount=backup_count,
-                encoding='utf-8'
-            )
-            file_handler.setLevel(getattr(logging, level.upper()))
-            file_handler.setFormatter(formatter)
-            logger.addHandler(file_handler)
+            # 记录先放入队列，由后台线程写入轮转文件，调用方不会阻塞在磁盘写入上
+            log_queue = _get_log_queue(log_file, max_bytes, backup_count, formatter)
+            queue_handler = logging.handlers.QueueHandler(log_queue)
+            queue_handler.setLevel(lvl)
+            logger.addHandler(queue_handler)
             
         except Exception as e:
             print(f"创建日志文件失败: {e}")
     
+    _CONFIGURED.add(name)
     return logger
 
 
@@ -110,14 +210,17 @@ def get_logger(name: str = "cosyvoice_tts") -> logging.Logger:
     Returns:
         日志记录器实例
     """
-    logger = logging.getLogger(name)
+    if name in _CONFIGURED:
+        return logging.getLogger(name)
     
-    # 如果日志记录器还没有配置处理器，则进行配置
-    if not logger.handlers:
-        setup_logger(name)
-    
-    return logger
+    # 首次获取时进行配置
+    return setup_logger(name)
 
 
-# 创建默认日志记录器
-default_logger = setup_logger() 
\ No newline at end of file
+def __getattr__(name: str):
+    """首次访问 default_logger 时才创建默认日志记录器（避免导入本模块就打开日志文件）"""
+    if name == "default_logger":
+        logger = get_logger()
+        globals()["default_logger"] = logger
+        return logger
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}") 
\ No newline at end of file